@@ -2,14 +2,19 @@ from cattrs.converters import Converter
 
 from django.conf import settings
 
+from .fail_fast import FailFastConverter
 from .register_hooks import (
     register_all_unstructure_hooks,
     register_structure_hooks,
     register_model_structure_hook,
     register_all_empty_unstructure_hooks,
+    register_lazy_file_structure_hooks,
 )
 
-converter = Converter()
+if getattr(settings, "DCF_FAIL_FAST", False):
+    converter = FailFastConverter(max_errors=getattr(settings, "DCF_MAX_ERRORS", None))
+else:
+    converter = Converter()
 
 
 register_structure_hooks(converter)
@@ -20,5 +25,9 @@ if getattr(settings, "DCF_EMPTY_HOOKS", False):
     register_all_empty_unstructure_hooks(converter)
 
 
+if getattr(settings, "DCF_FILE_HOOKS", True) and getattr(settings, "DCF_LAZY_FILE_URLS", False):
+    register_lazy_file_structure_hooks(converter)
+
+
 if getattr(settings, "DCF_MODEL_HOOKS", True):
     register_model_structure_hook(converter)
@@ -0,0 +1,247 @@
+import datetime
+import os
+from collections.abc import Callable, Iterable, Sequence
+from functools import cache
+from operator import attrgetter
+from types import NoneType, UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from attrs import fields, has
+
+from cattrs._compat import is_annotated
+from cattrs.converters import Converter
+
+from django_cattrs_fields.fields import (
+    BooleanField,
+    CharField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    EmailField,
+    FloatField,
+    IntegerField,
+    Params,
+    SlugField,
+    TimeField,
+    URLField,
+    UUIDField,
+)
+from django_cattrs_fields.hooks.batch_hooks import structure_columns
+
+from .register_hooks import register_all_unstructure_hooks, register_structure_hooks
+
+# a columnar format, `list[Cls]` is written as arrow record batches, one column per field,
+# and read back a column at a time (see `structure_columns`).
+# the values go into arrow as they are, they don't go through the unstructure hooks.
+
+T = TypeVar("T")
+
+# rows per record batch
+BATCH_SIZE = 64 * 1024
+
+# the widest precision `decimal128` can hold
+DECIMAL128_MAX_DIGITS = 38
+
+
+def _uuid_bytes(val: UUIDField | None) -> bytes | None:
+    return None if val is None else val.bytes
+
+
+def _decimal_str(val: DecimalField | None) -> str | None:
+    return None if val is None else str(val)
+
+
+def _utc(val: DateTimeField | None) -> DateTimeField | None:
+    # naive datetimes are taken as UTC, like arrow does
+    if val is None or val.tzinfo is not None:
+        return val
+    return val.replace(tzinfo=datetime.UTC)
+
+
+ARROW_TYPES: dict[Any, pa.DataType] = {
+    BooleanField: pa.bool_(),
+    CharField: pa.string(),
+    DateField: pa.date32(),
+    DateTimeField: pa.timestamp("us", tz="UTC"),
+    # decimals without `Params` have no precision, they are stored as strings
+    DecimalField: pa.string(),
+    EmailField: pa.string(),
+    FloatField: pa.float64(),
+    IntegerField: pa.int64(),
+    SlugField: pa.string(),
+    TimeField: pa.time64("us"),
+    URLField: pa.string(),
+    UUIDField: pa.binary(16),
+}
+
+# how a value is prepared for its arrow type, fields not here go in as they are
+ARROW_VALUES: dict[Any, Callable[[Any], Any]] = {
+    DateTimeField: _utc,
+    DecimalField: _decimal_str,
+    UUIDField: _uuid_bytes,
+}
+
+
+def _field_type(tp: Any) -> tuple[pa.DataType, Callable[[Any], Any] | None, bool]:
+    """the arrow type of `tp`, how its values are prepared and whether it's nullable."""
+    nullable = False
+    if get_origin(tp) in (Union, UnionType):
+        args = [arg for arg in get_args(tp) if arg is not NoneType]
+        if len(args) == 1:
+            tp = args[0]
+            nullable = True
+
+    if is_annotated(tp):
+        base, *metadata = get_args(tp)
+        params = next((m for m in metadata if isinstance(m, Params)), None)
+        if (
+            base is DecimalField
+            and params is not None
+            and params.decimal_max_digits is not None
+            and params.decimal_places is not None
+        ):
+            if params.decimal_max_digits > DECIMAL128_MAX_DIGITS:
+                arrow_type = pa.decimal256(params.decimal_max_digits, params.decimal_places)
+            else:
+                arrow_type = pa.decimal128(params.decimal_max_digits, params.decimal_places)
+            return arrow_type, None, nullable
+        tp = base
+
+    if tp in ARROW_TYPES:
+        return ARROW_TYPES[tp], ARROW_VALUES.get(tp), nullable
+    raise TypeError(f"{tp!r} has no arrow equivalent")
+
+
+@cache
+def _plan(cls: Any) -> tuple[pa.Schema, tuple[tuple[Any, Callable[[Any], Any] | None], ...]]:
+    schema_fields = []
+    columns = []
+    for a in fields(cls):
+        arrow_type, prepare, nullable = _field_type(a.type)
+        schema_fields.append(pa.field(a.name, arrow_type, nullable=nullable))
+        columns.append((attrgetter(a.name), prepare))
+    return pa.schema(schema_fields), tuple(columns)
+
+
+def schema_for(cls: Any) -> pa.Schema:
+    """the arrow schema of the attrs class `cls`.
+
+    raises `TypeError` if one of the fields has no arrow equivalent (e.g: `FileField`).
+    """
+    return _plan(cls)[0]
+
+
+def to_batches(
+    objs: Iterable[Any], cls: Any, batch_size: int = BATCH_SIZE
+) -> Iterable[pa.RecordBatch]:
+    """record batches of `objs` (instances of `cls`), `batch_size` rows each."""
+    schema, columns = _plan(cls)
+    objs = list(objs)
+    for start in range(0, len(objs), batch_size):
+        chunk = objs[start : start + batch_size]
+        arrays = []
+        for (get, prepare), field in zip(columns, schema):
+            values = list(map(get, chunk))
+            if prepare is not None:
+                values = list(map(prepare, values))
+            arrays.append(pa.array(values, type=field.type))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_table(objs: Iterable[Any], cls: Any, batch_size: int = BATCH_SIZE) -> pa.Table:
+    return pa.Table.from_batches(list(to_batches(objs, cls, batch_size)), schema=schema_for(cls))
+
+
+def from_table(table: pa.Table, cls: Any, converter: Converter | None = None) -> list[Any]:
+    """structure the rows of `table` into a list of `cls`, a column at a time."""
+    names = set(table.column_names)
+    columns = {a.name: table.column(a.name).to_pylist() for a in fields(cls) if a.name in names}
+    return structure_columns(columns, cls, converter or serializer)
+
+
+# Files
+
+
+def write_ipc(
+    where: str | os.PathLike | pa.NativeFile, objs: Iterable[Any], cls: Any, **kwargs: Any
+) -> None:
+    """write `objs` as an arrow ipc (feather v2) file, `kwargs` go to `to_batches`."""
+    with pa.ipc.new_file(where, schema_for(cls)) as writer:
+        for batch in to_batches(objs, cls, **kwargs):
+            writer.write_batch(batch)
+
+
+def read_ipc(
+    where: str | os.PathLike, cls: Any, memory_map: bool = True, converter: Converter | None = None
+) -> list[Any]:
+    """read an arrow ipc file, memory mapped by default so other columns are never read in."""
+    source = pa.memory_map(str(where)) if memory_map else pa.OSFile(str(where))
+    with source, pa.ipc.open_file(source) as reader:
+        return from_table(reader.read_all(), cls, converter)
+
+
+def write_parquet(where: str | os.PathLike, objs: Iterable[Any], cls: Any, **kwargs: Any) -> None:
+    """write `objs` as a parquet file, `kwargs` go to `pyarrow.parquet.write_table`."""
+    pq.write_table(to_table(objs, cls), where, **kwargs)
+
+
+def read_parquet(
+    where: str | os.PathLike, cls: Any, memory_map: bool = True, converter: Converter | None = None
+) -> list[Any]:
+    names = [a.name for a in fields(cls)]
+    table = pq.read_table(where, columns=names, memory_map=memory_map)
+    return from_table(table, cls, converter)
+
+
+class ArrowConverter(Converter):
+    """`dumps` writes a list of attrs objects as an arrow ipc stream, `loads` reads it back."""
+
+    def dumps(self, obj: Any, unstructure_as: Any = None, **kwargs: Any) -> bytes:
+        objs: Sequence[Any] = [obj] if has(obj.__class__) else list(obj)
+        if unstructure_as is not None:
+            cls = (
+                get_args(unstructure_as)[0]
+                if get_origin(unstructure_as) is list
+                else unstructure_as
+            )
+        elif objs:
+            cls = objs[0].__class__
+        else:
+            raise ValueError("pass `unstructure_as` to dump an empty list")
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, schema_for(cls)) as writer:
+            for batch in to_batches(objs, cls, **kwargs):
+                writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+    def loads(self, data: bytes, cl: type[T]) -> T:
+        with pa.ipc.open_stream(data) as reader:
+            table = reader.read_all()
+        if get_origin(cl) is list:
+            return from_table(table, get_args(cl)[0], self)  # type: ignore[return-value]
+        if table.num_rows != 1:
+            raise ValueError(f"expected a single row, got {table.num_rows}")
+        return from_table(table, cl, self)[0]
+
+
+serializer = ArrowConverter()
+
+register_structure_hooks(serializer)
+register_all_unstructure_hooks(serializer)
+
+__all__ = (
+    "ARROW_TYPES",
+    "ArrowConverter",
+    "from_table",
+    "read_ipc",
+    "read_parquet",
+    "schema_for",
+    "serializer",
+    "to_batches",
+    "to_table",
+    "write_ipc",
+    "write_parquet",
+)
@@ -1,21 +1,174 @@
-from typing import Union
+from collections.abc import Iterator, Mapping, Set
+from functools import cache
+from typing import IO, Any, TypeVar, Union, get_args
 
+from attrs import NOTHING, Factory, fields
+from bson import decode, decode_file_iter, encode
 from bson.binary import Binary
+from bson.codec_options import DEFAULT_CODEC_OPTIONS, CodecOptions
+from bson.raw_bson import RawBSONDocument
 
-from cattrs.preconf.bson import make_converter
+from cattrs._compat import is_sequence
+from cattrs.converters import Converter
+from cattrs.errors import AttributeValidationNote, ClassValidationError
+from cattrs.preconf.bson import BsonConverter, configure_converter
 
 from django.conf import settings
 
 from django_cattrs_fields.fields import DateField, DecimalField, TimeField, UUIDField
 from django_cattrs_fields.hooks.date_hooks import time_unstructure_str
 from django_cattrs_fields.hooks.number_hooks import decimal_unstructure_str
+from django_cattrs_fields.hooks.row_hooks import attribute_structure_hook
 
 from .register_hooks import (
+    register_compact_profile,
+    register_binary_file_hooks,
     register_structure_hooks,
     register_unstructure_hooks,
     register_datetime_unstructure_hooks,
 )
 
+T = TypeVar("T")
+
+# a bson document can't be a list, lists are wrapped in a document under this key
+LIST_KEY = "items"
+
+
+def _raw_codec_options(codec_options: CodecOptions) -> CodecOptions:
+    return codec_options.with_options(document_class=RawBSONDocument)
+
+
+@cache
+def _lazy_plan(cl: Any, converter: Converter) -> dict[str, tuple[Any, Any]]:
+    return {a.name: (a, attribute_structure_hook(a, converter)) for a in fields(cl)}
+
+
+class LazyDocument:
+    """a bson document waiting to be structured into the attrs class `cl`.
+
+    fields are structured one at a time, the first time they are accessed (`doc.name`),
+    the document itself is only parsed as far as needed (see `RawBSONDocument`).
+    call `structure()` to get the whole instance.
+    """
+
+    __slots__ = ("_raw", "_cl", "_converter", "_values")
+
+    def __init__(self, raw: Mapping[str, Any], cl: Any, converter: Converter):
+        self._raw = raw
+        self._cl = cl
+        self._converter = converter
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        plan = _lazy_plan(self._cl, self._converter)
+        if name not in plan:
+            raise AttributeError(f"{self._cl.__name__!r} has no field {name!r}")
+        a, handler = plan[name]
+
+        try:
+            if name in self._raw:
+                value = self._raw[name]
+                if handler is not None:
+                    value = handler(value, a.type)
+            elif isinstance(a.default, Factory):
+                value = a.default.factory(self) if a.default.takes_self else a.default.factory()
+            elif a.default is not NOTHING:
+                value = a.default
+            else:
+                raise KeyError(name)
+        except Exception as e:
+            e.__notes__ = [
+                *getattr(e, "__notes__", []),
+                AttributeValidationNote(
+                    f"Structuring class {self._cl.__qualname__} @ attribute {name}", name, a.type
+                ),
+            ]
+            raise ClassValidationError(
+                f"While structuring {self._cl.__name__}", [e], self._cl
+            ) from None
+
+        self._values[name] = value
+        return value
+
+    def structure(self) -> Any:
+        return self._converter.structure(self._raw, self._cl)
+
+    def __repr__(self) -> str:
+        return f"LazyDocument({self._cl.__name__}, {sorted(self._values)})"
+
+
+class BsonDocumentConverter(BsonConverter):
+    """bson converter that wraps lists in a `{"items": [...]}` document,
+    and can load documents lazily (`loads_lazy`, `iter_lazy`).
+    """
+
+    def dumps(
+        self,
+        obj: Any,
+        unstructure_as: Any = None,
+        check_keys: bool = False,
+        codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS,
+    ) -> bytes:
+        data = self.unstructure(obj, unstructure_as=unstructure_as)
+        if not isinstance(data, Mapping):
+            data = {LIST_KEY: data}
+        return encode(data, check_keys=check_keys, codec_options=codec_options)
+
+    def loads(
+        self,
+        data: bytes,
+        cl: type[T],
+        codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS,
+    ) -> T:
+        document = decode(data, codec_options=codec_options)
+        if is_sequence(cl):
+            return self.structure(document[LIST_KEY], cl)
+        return self.structure(document, cl)
+
+    def loads_lazy(
+        self,
+        data: bytes,
+        cl: Any,
+        codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS,
+    ) -> Any:
+        """load `data` as a `LazyDocument` of `cl`, or a list of them if `cl` is a list type."""
+        raw = RawBSONDocument(data, _raw_codec_options(codec_options))
+        if is_sequence(cl):
+            (item_cl,) = get_args(cl)
+            return [LazyDocument(item, item_cl, self) for item in raw[LIST_KEY]]
+        return LazyDocument(raw, cl, self)
+
+    def iter_lazy(
+        self,
+        file: IO[bytes],
+        cl: Any,
+        codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS,
+    ) -> Iterator[LazyDocument]:
+        """read a file of concatenated bson documents (e.g: a mongodump collection),
+        one `LazyDocument` at a time.
+        """
+        for raw in decode_file_iter(file, codec_options=_raw_codec_options(codec_options)):
+            yield LazyDocument(raw, cl, self)
+
+
+def make_converter(*args: Any, **kwargs: Any) -> BsonDocumentConverter:
+    # same as `cattrs.preconf.bson.make_converter`, with our converter class
+    kwargs["unstruct_collection_overrides"] = {
+        Set: list,
+        **kwargs.get("unstruct_collection_overrides", {}),
+    }
+    res = BsonDocumentConverter(*args, **kwargs)
+    configure_converter(res)
+    return res
+
+
 serializer = make_converter()
 
 register_structure_hooks(serializer)
@@ -51,4 +204,9 @@ if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
     serializer.register_unstructure_hook(TimeField, time_unstructure_str)
     serializer.register_unstructure_hook(Union[TimeField, None], time_unstructure_str)
 
-__all__ = ("serializer",)
+register_compact_profile(serializer, "bson")
+
+if getattr(settings, "DCF_FILE_HOOKS", True) and getattr(settings, "DCF_BINARY_FILES", False):
+    register_binary_file_hooks(serializer, as_bytes=True)
+
+__all__ = ("BsonDocumentConverter", "LazyDocument", "make_converter", "serializer")
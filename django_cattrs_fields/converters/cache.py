@@ -0,0 +1,164 @@
+import struct
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import suppress
+from functools import cache
+from typing import Any
+
+from attrs import has
+from attrs.exceptions import FrozenInstanceError
+
+from cattrs.converters import Converter
+from cattrs.preconf.json import JsonConverter
+
+# serializing the same (immutable) object again and again gives the same bytes every time,
+# `SerializerCache` keeps those bytes around, lists are put together from the cached bytes
+# of their items.
+# entries are found by identity, not equality: equal values can still dump differently
+# (e.g: `Decimal("1.0")` and `Decimal("1.00")`, or the same moment in two timezones).
+
+
+def _text_list(items: Sequence[str]) -> str:
+    return "[" + ",".join(items) + "]"
+
+
+def _json_list(items: Sequence[str]) -> str:
+    # the default separators of `json.dumps`
+    return "[" + ", ".join(items) + "]"
+
+
+def _bytes_list(items: Sequence[bytes]) -> bytes:
+    return b"[" + b",".join(items) + b"]"
+
+
+def _msgpack_list(items: Sequence[bytes]) -> bytes:
+    n = len(items)
+    if n < 16:
+        header = bytes((0x90 | n,))
+    elif n < 0x10000:
+        header = struct.pack(">BH", 0xDC, n)
+    else:
+        header = struct.pack(">BI", 0xDD, n)
+    return header + b"".join(items)
+
+
+def _cbor2_list(items: Sequence[bytes]) -> bytes:
+    n = len(items)
+    if n < 24:
+        header = bytes((0x80 | n,))
+    elif n < 0x100:
+        header = struct.pack(">BB", 0x98, n)
+    elif n < 0x10000:
+        header = struct.pack(">BH", 0x99, n)
+    elif n < 0x100000000:
+        header = struct.pack(">BI", 0x9A, n)
+    else:
+        header = struct.pack(">BQ", 0x9B, n)
+    return header + b"".join(items)
+
+
+# how to join already encoded items into a list, by the serializer's class
+LIST_SPLICERS: dict[type, Callable[[Sequence[Any]], Any]] = {JsonConverter: _json_list}
+
+# the other serializers need their optional dependency
+with suppress(ImportError):
+    from cattrs.preconf.cbor2 import Cbor2Converter
+
+    LIST_SPLICERS[Cbor2Converter] = _cbor2_list
+with suppress(ImportError):
+    from cattrs.preconf.msgpack import MsgpackConverter
+
+    LIST_SPLICERS[MsgpackConverter] = _msgpack_list
+with suppress(ImportError):
+    from cattrs.preconf.msgspec import MsgspecJsonConverter
+
+    LIST_SPLICERS[MsgspecJsonConverter] = _bytes_list
+with suppress(ImportError):
+    from cattrs.preconf.orjson import OrjsonConverter
+
+    LIST_SPLICERS[OrjsonConverter] = _bytes_list
+with suppress(ImportError):
+    from cattrs.preconf.ujson import UjsonConverter
+
+    LIST_SPLICERS[UjsonConverter] = _text_list
+
+
+@cache
+def cacheable(cls: type) -> bool:
+    """only frozen attrs classes whose instances can be weakly referenced are cached"""
+    if not has(cls) or not cls.__weakrefoffset__:
+        return False
+    try:
+        # a frozen class refuses every attribute, whatever the instance
+        cls.__setattr__(None, "__dcf_probe__", None)
+    except FrozenInstanceError:
+        return True
+    except (AttributeError, TypeError):
+        pass
+    return False
+
+
+class SerializerCache:
+    """a bounded, thread safe LRU cache of what `serializer.dumps` returns
+    for frozen attrs instances.
+
+    instances are found by identity, equal instances each get their own entry.
+    other objects are dumped as usual, without being cached.
+    frozen instances holding mutable values (e.g: lists) must not be changed once they're cached.
+    """
+
+    def __init__(self, serializer: Converter, maxsize: int = 1024):
+        self.serializer = serializer
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # id -> (a weak reference to the object, its dump)
+        self._data: OrderedDict[int, tuple[weakref.ref, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._splice = next(
+            (LIST_SPLICERS[cls] for cls in type(serializer).__mro__ if cls in LIST_SPLICERS),
+            None,
+        )
+
+    def dumps(self, obj: Any) -> Any:
+        if not cacheable(obj.__class__):
+            return self.serializer.dumps(obj)  # type: ignore[attr-defined]
+
+        key = id(obj)
+        with self._lock:
+            entry = self._data.get(key)
+            # the id of a dead object can be reused, the weak reference tells them apart
+            if entry is not None and entry[0]() is obj:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        data = self.serializer.dumps(obj)  # type: ignore[attr-defined]
+        with self._lock:
+            self.misses += 1
+            self._data[key] = (weakref.ref(obj), data)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return data
+
+    def dumps_list(self, objs: Iterable[Any]) -> Any:
+        """dump a list, using the cached bytes of its items.
+
+        serializers that can't be spliced (bson, yaml, toml) dump the whole list as usual.
+        """
+        if self._splice is None:
+            return self.serializer.dumps(list(objs))  # type: ignore[attr-defined]
+        return self._splice([self.dumps(obj) for obj in objs])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+__all__ = ("SerializerCache", "cacheable")
@@ -7,6 +7,8 @@ from django_cattrs_fields.fields import TimeField
 from django_cattrs_fields.hooks.date_hooks import time_unstructure_str
 
 from .register_hooks import (
+    register_compact_profile,
+    register_binary_file_hooks,
     register_date_unstructure_hooks,
     register_datetime_unstructure_hooks,
     register_decimal_unstructure_hooks,
@@ -28,4 +30,9 @@ if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
     serializer.register_unstructure_hook(TimeField, time_unstructure_str)
     serializer.register_unstructure_hook(Union[TimeField, None], time_unstructure_str)
 
+register_compact_profile(serializer, "cbor2")
+
+if getattr(settings, "DCF_FILE_HOOKS", True) and getattr(settings, "DCF_BINARY_FILES", False):
+    register_binary_file_hooks(serializer, as_bytes=True)
+
 __all__ = ("serializer",)
@@ -0,0 +1,157 @@
+import csv
+import io
+from collections.abc import Iterable, Iterator
+from typing import IO, Any, TypeVar, Union, get_args, get_origin
+
+from attrs import fields, has
+
+from cattrs.converters import Converter
+
+from django.conf import settings
+
+from django_cattrs_fields.fields import (
+    BooleanField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    TimeField,
+    UUIDField,
+)
+from django_cattrs_fields.hooks.date_hooks import time_unstructure_str
+from django_cattrs_fields.hooks.row_hooks import make_row_structure_fn, make_row_unstructure_fn
+
+from .register_hooks import register_structure_hooks, register_unstructure_hooks
+
+# every csv value is a string, the hooks here write each field in a form its structure hook
+# reads back (iso dates and times, uuid strings, plain decimals), empty cells are nulls.
+# rows are read and written one at a time, files of any size are handled in constant memory.
+
+T = TypeVar("T")
+
+
+def boolean_unstructure_str(val: BooleanField | None) -> str | None:
+    if val is None:
+        return None
+    # `BOOLEAN_VALUES` has no "True"/"False", which is what `csv` would write
+    return "true" if val else "false"
+
+
+def decimal_unstructure_csv(val: DecimalField | None) -> str | None:
+    # only nulls are empty cells, `decimal_unstructure_str` would write zero as one too
+    if val is None:
+        return None
+    return format(val, "f")
+
+
+class _Echo:
+    """a file that gives back what's written to it, so `csv.writer` returns each line."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _class_of(tp: Any) -> Any:
+    return get_args(tp)[0] if get_origin(tp) is list else tp
+
+
+def write_csv(
+    file: IO[str], objs: Iterable[Any], cls: Any, converter: Converter | None = None, **fmtparams
+) -> None:
+    """write a header and a row per object to `file` (opened with `newline=""`).
+
+    `fmtparams` go to `csv.writer`.
+    """
+    unstructure = make_row_unstructure_fn(cls, converter or serializer)
+    writer = csv.writer(file, **fmtparams)
+    writer.writerow(a.name for a in fields(cls))
+    writer.writerows(map(unstructure, objs))
+
+
+def iter_csv(
+    objs: Iterable[Any], cls: Any, converter: Converter | None = None, **fmtparams
+) -> Iterator[str]:
+    """the lines of the csv of `objs`, one at a time, e.g: for a `StreamingHttpResponse`."""
+    unstructure = make_row_unstructure_fn(cls, converter or serializer)
+    writer = csv.writer(_Echo(), **fmtparams)
+    yield writer.writerow([a.name for a in fields(cls)])
+    for obj in objs:
+        yield writer.writerow(unstructure(obj))
+
+
+def structure_iter(
+    lines: Iterable[str], cls: Any, converter: Converter | None = None, **fmtparams
+) -> Iterator[Any]:
+    """structure the rows of a csv (its first row is the header) into `cls`, one at a time.
+
+    `lines` is usually a file opened with `newline=""`, errors get a note with their row number.
+    """
+    reader = csv.reader(lines, **fmtparams)
+    header = next(reader, None)
+    if header is None:
+        return
+    structure = make_row_structure_fn(cls, header, converter or serializer)
+    for number, row in enumerate(reader, 1):
+        try:
+            # empty cells are nulls
+            obj = structure([value or None for value in row])
+        except Exception as e:
+            e.add_note(f"csv row {number}")
+            raise
+        yield obj
+
+
+class CsvConverter(Converter):
+    """`dumps` writes a list of attrs objects as a csv string, `loads` reads it back."""
+
+    def dumps(self, obj: Any, unstructure_as: Any = None, **kwargs: Any) -> str:
+        objs = [obj] if has(obj.__class__) else list(obj)
+        if unstructure_as is not None:
+            cls = _class_of(unstructure_as)
+        elif objs:
+            cls = objs[0].__class__
+        else:
+            raise ValueError("pass `unstructure_as` to dump an empty list")
+
+        buffer = io.StringIO(newline="")
+        write_csv(buffer, objs, cls, self, **kwargs)
+        return buffer.getvalue()
+
+    def loads(self, data: str, cl: type[T]) -> T:
+        objs = list(structure_iter(io.StringIO(data, newline=""), _class_of(cl), self))
+        if get_origin(cl) is list:
+            return objs  # type: ignore[return-value]
+        if len(objs) != 1:
+            raise ValueError(f"expected a single row, got {len(objs)}")
+        return objs[0]
+
+
+serializer = CsvConverter()
+
+register_structure_hooks(serializer)
+register_unstructure_hooks(serializer)
+
+if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
+    serializer.register_unstructure_hook(BooleanField, boolean_unstructure_str)
+    serializer.register_unstructure_hook(Union[BooleanField, None], boolean_unstructure_str)
+    serializer.register_unstructure_hook(UUIDField, lambda x: str(x))
+    serializer.register_unstructure_hook(Union[UUIDField, None], lambda x: str(x) if x else None)
+    serializer.register_unstructure_hook(DateField, lambda x: x.isoformat())
+    serializer.register_unstructure_hook(
+        Union[DateField, None], lambda x: x.isoformat() if x else None
+    )
+    serializer.register_unstructure_hook(DateTimeField, lambda x: x.isoformat())
+    serializer.register_unstructure_hook(
+        Union[DateTimeField, None], lambda x: x.isoformat() if x else None
+    )
+    serializer.register_unstructure_hook(DecimalField, decimal_unstructure_csv)
+    serializer.register_unstructure_hook(Union[DecimalField, None], decimal_unstructure_csv)
+    serializer.register_unstructure_hook(TimeField, time_unstructure_str)
+    serializer.register_unstructure_hook(Union[TimeField, None], time_unstructure_str)
+
+__all__ = (
+    "CsvConverter",
+    "iter_csv",
+    "serializer",
+    "structure_iter",
+    "write_csv",
+)
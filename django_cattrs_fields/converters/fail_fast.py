@@ -0,0 +1,111 @@
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from cattrs.converters import Converter
+
+# with detailed validation cattrs wraps every field in a try block, collects the errors
+# and attaches notes to them, valid payloads pay for that too.
+# `FailFastConverter` structures with a non-detailed copy of itself first,
+# and only structures again in detailed mode when that fails.
+
+T = TypeVar("T")
+
+
+def trim_errors(exc: BaseException, max_errors: int) -> BaseException:
+    """keep the first `max_errors` errors of an exception group (and its sub groups)."""
+    if not isinstance(exc, BaseExceptionGroup):
+        return exc
+
+    count = 0
+
+    def keep(e: BaseException) -> bool:
+        nonlocal count
+        if isinstance(e, BaseExceptionGroup):
+            # look inside the group
+            return False
+        count += 1
+        return count <= max_errors
+
+    trimmed = exc.subgroup(keep)
+    if trimmed is None or count <= max_errors:
+        return exc
+    trimmed.add_note(f"{count - max_errors} more errors were left out")
+    return trimmed
+
+
+class FailFastConverter(Converter):
+    """a converter that structures without detailed validation on the happy path.
+
+    when structuring fails, it's done again with detailed validation,
+    so the errors are the same as a regular `Converter`'s.
+
+    `max_errors` caps the errors reported, `0` skips the detailed re-run entirely,
+    the error of the fast path is raised as it is.
+    """
+
+    def __init__(self, *args: Any, max_errors: int | None = None, **kwargs: Any):
+        # `Converter.__init__` registers hooks already
+        self._fast: Converter | None = None
+        super().__init__(*args, **kwargs)
+        self.max_errors = max_errors
+
+    @property
+    def fast(self) -> Converter:
+        """the non-detailed copy, made again when structure hooks are registered."""
+        fast = self._fast
+        if fast is None:
+            fast = self._fast = self.copy(detailed_validation=False)
+        return fast
+
+    def structure(self, obj: Any, cl: type[T]) -> T:
+        if not self.detailed_validation:
+            return super().structure(obj, cl)
+
+        try:
+            return self.fast.structure(obj, cl)
+        except Exception:
+            if self.max_errors == 0:
+                raise
+
+        try:
+            # same hooks in detailed mode, this is what raises the reported error
+            return super().structure(obj, cl)
+        except Exception as e:
+            if self.max_errors is None:
+                raise
+            raise trim_errors(e, self.max_errors) from None
+
+    def copy(self, *args: Any, **kwargs: Any) -> "FailFastConverter":
+        res = super().copy(*args, **kwargs)
+        res.max_errors = self.max_errors
+        return res
+
+    def register_structure_hook(self, *args: Any, **kwargs: Any) -> Any:
+        res = super().register_structure_hook(*args, **kwargs)
+        self._fast = None
+        return res
+
+    def register_structure_hook_func(self, *args: Any, **kwargs: Any) -> None:
+        super().register_structure_hook_func(*args, **kwargs)
+        self._fast = None
+
+    def register_structure_hook_factory(
+        self, predicate: Callable[[Any], bool], factory: Any = None
+    ) -> Any:
+        if factory is None:
+            # used as a decorator, the factory is registered when the decorator is called
+            decorator = super().register_structure_hook_factory(predicate)
+
+            def register(factory: Any) -> Any:
+                res = decorator(factory)
+                self._fast = None
+                return res
+
+            return register
+
+        res = super().register_structure_hook_factory(predicate, factory)
+        self._fast = None
+        return res
+
+
+__all__ = ("FailFastConverter", "trim_errors")
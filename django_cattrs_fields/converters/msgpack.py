@@ -1,18 +1,129 @@
-from typing import Union
+import datetime
+import struct
+from collections.abc import Set
+from decimal import Decimal
+from typing import Any, TypeVar, Union
 
+import msgpack
 from django.conf import settings
 
-from cattrs.preconf.msgpack import make_converter
+from cattrs.converters import Converter
+from cattrs.preconf.msgpack import MsgpackConverter, configure_converter
 
 from django_cattrs_fields.fields import DateField, DateTimeField, DecimalField, TimeField, UUIDField
 from django_cattrs_fields.hooks.date_hooks import time_unstructure_str
+from django_cattrs_fields.hooks.file_hooks import file_buffers
 from django_cattrs_fields.hooks.number_hooks import decimal_unstructure_str
 
 from .register_hooks import (
+    register_compact_profile,
+    register_binary_file_hooks,
     register_structure_hooks,
     register_unstructure_hooks,
 )
 
+T = TypeVar("T")
+
+# msgpack extension type codes, the timestamp extension (-1) is built into msgpack
+DECIMAL_EXT_CODE = 1
+
+# a decimal extension holds the exponent as a signed byte and the signed coefficient
+# as a big endian integer, e.g: `12.50` is `-2` and `1250`.
+# non-finite decimals and exponents that don't fit the byte are written as ascii text
+# after `DECIMAL_TEXT`, an exponent that's never used.
+DECIMAL_TEXT = -128
+DECIMAL_EXPONENT = struct.Struct(">b")
+
+
+def _decimal_ext_data(val: Decimal) -> bytes:
+    sign, digits, exponent = val.as_tuple()
+    if not isinstance(exponent, int) or not DECIMAL_TEXT < exponent <= 127:
+        return DECIMAL_EXPONENT.pack(DECIMAL_TEXT) + str(val).encode("ascii")
+    coefficient = int("".join(map(str, digits)))
+    if sign:
+        coefficient = -coefficient
+    return DECIMAL_EXPONENT.pack(exponent) + coefficient.to_bytes(
+        coefficient.bit_length() // 8 + 1, "big", signed=True
+    )
+
+
+def _decimal_from_ext_data(data: bytes) -> Decimal:
+    (exponent,) = DECIMAL_EXPONENT.unpack_from(data)
+    if exponent == DECIMAL_TEXT:
+        return Decimal(data[1:].decode("ascii"))
+    # built from text, so the exponent is kept (`12.50`, not `12.5`)
+    return Decimal(f"{int.from_bytes(data[1:], 'big', signed=True)}E{exponent}")
+
+
+def ext_hook(code: int, data: bytes) -> Any:
+    if code == DECIMAL_EXT_CODE:
+        return _decimal_from_ext_data(data)
+    return msgpack.ExtType(code, data)
+
+
+class MsgpackExtConverter(MsgpackConverter):
+    """msgpack converter that decodes our extension types,
+    timestamps (-1) are decoded into aware datetimes and decimals (1) into `Decimal`s.
+    uploaded files are packed straight from their buffers (see `file_buffers`).
+    """
+
+    def dumps(self, obj: Any, unstructure_as: Any = None, **kwargs: Any) -> bytes:
+        # uploaded files are packed straight from their buffers, released once packed
+        with file_buffers():
+            return super().dumps(obj, unstructure_as=unstructure_as, **kwargs)
+
+    def loads(self, data: bytes, cl: type[T], **kwargs: Any) -> T:
+        kwargs.setdefault("timestamp", 3)
+        kwargs.setdefault("ext_hook", ext_hook)
+        return self.structure(msgpack.loads(data, **kwargs), cl)
+
+
+def make_converter(*args: Any, **kwargs: Any) -> MsgpackExtConverter:
+    # same as `cattrs.preconf.msgpack.make_converter`, with our converter class
+    kwargs["unstruct_collection_overrides"] = {
+        Set: list,
+        **kwargs.get("unstruct_collection_overrides", {}),
+    }
+    res = MsgpackExtConverter(*args, **kwargs)
+    configure_converter(res)
+    return res
+
+
+def datetime_unstructure_timestamp(val: DateTimeField | None) -> msgpack.Timestamp | None:
+    if val is None:
+        return None
+    if val.tzinfo is None:
+        # naive datetimes (USE_TZ = False) are taken as UTC
+        val = val.replace(tzinfo=datetime.UTC)
+    return msgpack.Timestamp.from_datetime(val)
+
+
+def uuid_unstructure_bytes(val: UUIDField | None) -> bytes | None:
+    if val is None:
+        return None
+    return val.bytes
+
+
+def decimal_unstructure_ext(val: DecimalField | None) -> msgpack.ExtType | None:
+    if val is None:
+        return None
+    return msgpack.ExtType(DECIMAL_EXT_CODE, _decimal_ext_data(val))
+
+
+def register_ext_hooks(converter: Converter):
+    """write datetimes as msgpack timestamps, uuids as 16 bytes and decimals as an extension type.
+
+    only `MsgpackExtConverter` reads timestamps and decimals back, other msgpack readers
+    need `timestamp=3` and an `ext_hook` for the decimal extension (see `ext_hook`).
+    """
+    converter.register_unstructure_hook(DateTimeField, datetime_unstructure_timestamp)
+    converter.register_unstructure_hook(Union[DateTimeField, None], datetime_unstructure_timestamp)
+    converter.register_unstructure_hook(UUIDField, uuid_unstructure_bytes)
+    converter.register_unstructure_hook(Union[UUIDField, None], uuid_unstructure_bytes)
+    converter.register_unstructure_hook(DecimalField, decimal_unstructure_ext)
+    converter.register_unstructure_hook(Union[DecimalField, None], decimal_unstructure_ext)
+
+
 serializer = make_converter()
 
 register_structure_hooks(serializer)
@@ -36,4 +147,18 @@ if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
     serializer.register_unstructure_hook(Union[TimeField, None], time_unstructure_str)
 
 
-__all__ = ("serializer",)
+if getattr(settings, "DCF_MSGPACK_EXT_TYPES", False):
+    register_ext_hooks(serializer)
+
+register_compact_profile(serializer, "msgpack")
+
+if getattr(settings, "DCF_FILE_HOOKS", True) and getattr(settings, "DCF_BINARY_FILES", False):
+    register_binary_file_hooks(serializer)
+
+__all__ = (
+    "MsgpackExtConverter",
+    "ext_hook",
+    "make_converter",
+    "register_ext_hooks",
+    "serializer",
+)
@@ -1,6 +1,44 @@
+import datetime
+import math
+import uuid
+from collections.abc import Callable
+from decimal import Decimal
+from functools import cache
+from types import NoneType, UnionType
+from typing import Annotated, Any, Union, get_args, get_origin
+
+import msgspec
+from attrs import NOTHING, Factory, fields, has
+
+from cattrs._compat import is_annotated
+from cattrs.errors import AttributeValidationNote, ClassValidationError
+from cattrs.converters import Converter
 from cattrs.preconf.msgspec import make_converter
 
+from django.conf import settings
+from django.core import validators
+from django.core.exceptions import ValidationError
+
+from django_cattrs_fields.fields import (
+    BooleanField,
+    CharField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    EmailField,
+    FloatField,
+    IntegerField,
+    Params,
+    SlugField,
+    TimeField,
+    URLField,
+    UUIDField,
+)
+from django_cattrs_fields.hooks.number_hooks import decimal_unstructure_number
+from django_cattrs_fields.utils.timezone import enforce_timezone
+
 from .register_hooks import (
+    register_compact_profile,
     register_structure_hooks,
     register_all_unstructure_hooks,
 )
@@ -10,4 +48,192 @@ serializer = make_converter()
 register_structure_hooks(serializer)
 register_all_unstructure_hooks(serializer)
 
-__all__ = ("serializer",)
+
+def decimal_unstructure_raw(val: DecimalField | None) -> msgspec.Raw | None:
+    number = decimal_unstructure_number(val)
+    if number is None:
+        return None
+    return msgspec.Raw(number.encode())
+
+
+def register_decimal_number_hooks(converter: Converter):
+    """write decimals as exact json numbers instead of strings"""
+    converter.register_unstructure_hook(DecimalField, decimal_unstructure_raw)
+    converter.register_unstructure_hook(Union[DecimalField, None], decimal_unstructure_raw)
+
+
+if getattr(settings, "DCF_DECIMAL_AS_NUMBER", False):
+    register_decimal_number_hooks(serializer)
+
+register_compact_profile(serializer, "msgspec")
+
+
+# Struct mirrors
+# `serializer.loads` decodes into python objects, then runs a hook for every field.
+# `struct_loads` decodes into a `msgspec.Struct` mirroring the attrs class instead,
+# so parsing, type checks and most of the validation happen in C,
+# only the checks msgspec can't express (email, url, timezones, ...) run in python.
+
+# char fields can't be empty or hold null characters, see `char_field_validation`
+_char = Annotated[str, msgspec.Meta(min_length=1, pattern=r"\A[^\x00]*\Z")]
+# `validators.validate_unicode_slug`
+_slug = Annotated[str, msgspec.Meta(min_length=1, pattern=r"\A[-\w]+\Z")]
+
+STRUCT_TYPES: dict[Any, Any] = {
+    BooleanField: bool,
+    CharField: _char,
+    DateField: datetime.date,
+    DateTimeField: datetime.datetime,
+    DecimalField: Decimal,
+    EmailField: _char,
+    FloatField: float,
+    IntegerField: int,
+    SlugField: _slug,
+    TimeField: datetime.time,
+    URLField: _char,
+    UUIDField: uuid.UUID,
+}
+
+
+def _django_validator(validator: Callable[[Any], None]) -> Callable[[Any], Any]:
+    def check(val):
+        try:
+            validator(val)
+        except ValidationError as e:
+            raise ValueError(e.message)
+        return val
+
+    return check
+
+
+def _finite(val: float) -> float:
+    if not math.isfinite(val):
+        raise ValueError("infinite values are not supported.")
+    return val
+
+
+# what's left to check after msgspec is done with a value
+PYTHON_CHECKS: dict[Any, Callable[[Any], Any]] = {
+    DateTimeField: enforce_timezone,
+    DecimalField: _django_validator(validators.DecimalValidator(None, None)),
+    EmailField: _django_validator(validators.validate_email),
+    FloatField: _finite,
+    URLField: _django_validator(validators.URLValidator()),
+}
+
+
+def _nullable(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda val: None if val is None else convert(val)
+
+
+def _list_of(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda val: [convert(item) for item in val]
+
+
+def _plan(tp: Any) -> tuple[Any, Callable[[Any], Any] | None]:
+    """the msgspec type mirroring `tp`, and the python check (or conversion) left to run."""
+    if get_origin(tp) in (Union, UnionType):
+        args = [arg for arg in get_args(tp) if arg is not NoneType]
+        if len(args) == 1:
+            inner, convert = _plan(args[0])
+            return Union[inner, None], None if convert is None else _nullable(convert)
+
+    elif is_annotated(tp):
+        base, *metadata = get_args(tp)
+        if base is DecimalField:
+            params = next((m for m in metadata if isinstance(m, Params)), Params())
+            validator = validators.DecimalValidator(
+                params.decimal_max_digits, params.decimal_places
+            )
+            return Decimal, _django_validator(validator)
+
+    elif get_origin(tp) is list:
+        inner, convert = _plan(get_args(tp)[0])
+        return list[inner], None if convert is None else _list_of(convert)
+
+    elif has(tp):
+        struct, convert = _struct_plan(tp)
+        return struct, convert
+
+    elif tp in STRUCT_TYPES:
+        return STRUCT_TYPES[tp], PYTHON_CHECKS.get(tp)
+
+    raise TypeError(f"{tp!r} has no msgspec equivalent")
+
+
+@cache
+def _struct_plan(cls: Any) -> tuple[type[msgspec.Struct], Callable[[Any], Any]]:
+    struct_fields: list[tuple[Any, ...]] = []
+    plan = []
+    for a in fields(cls):
+        if not a.init:
+            continue
+
+        tp, convert = _plan(a.type)
+        if a.default is NOTHING:
+            struct_fields.append((a.name, tp))
+        elif isinstance(a.default, Factory):
+            if a.default.takes_self:
+                raise TypeError(f"{cls.__name__}.{a.name}: factories taking self aren't supported")
+            struct_fields.append((a.name, tp, msgspec.field(default_factory=a.default.factory)))
+        else:
+            struct_fields.append((a.name, tp, a.default))
+        plan.append((a.name, a.alias, convert, a.type))
+
+    struct = msgspec.defstruct(cls.__name__, struct_fields, kw_only=True)
+    note = f"Structuring class {cls.__qualname__} @ attribute "
+
+    def to_attrs(obj: msgspec.Struct) -> Any:
+        kwargs = {}
+        errors = []
+        for name, alias, convert, t in plan:
+            val = getattr(obj, name)
+            if convert is not None:
+                try:
+                    val = convert(val)
+                except Exception as e:
+                    e.__notes__ = [
+                        *getattr(e, "__notes__", []),
+                        AttributeValidationNote(note + name, name, t),
+                    ]
+                    errors.append(e)
+                    continue
+            kwargs[alias] = val
+        if errors:
+            raise ClassValidationError(f"While structuring {cls.__name__}", errors, cls)
+        return cls(**kwargs)
+
+    return struct, to_attrs
+
+
+def struct_for(cls: Any) -> type[msgspec.Struct]:
+    """the `msgspec.Struct` type mirroring the attrs class `cls`.
+
+    raises `TypeError` if one of the fields has no msgspec equivalent (e.g: `FileField`).
+    """
+    return _struct_plan(cls)[0]
+
+
+@cache
+def _decoder(cl: Any) -> tuple[msgspec.json.Decoder, Callable[[Any], Any] | None]:
+    tp, convert = _plan(cl)
+    # not strict, so strings are accepted for numbers, like the hooks do
+    return msgspec.json.Decoder(tp, strict=False), convert
+
+
+def struct_loads(data: bytes | str, cl: Any) -> Any:
+    """decode json straight into `cl` (an attrs class, or a list of them) using a struct mirror.
+
+    errors are raised as a `ClassValidationError`, like `serializer.loads` does.
+    """
+    decoder, convert = _decoder(cl)
+    try:
+        obj = decoder.decode(data)
+    except msgspec.DecodeError as e:
+        raise ClassValidationError(
+            f"While structuring {getattr(cl, '__name__', repr(cl))}", [ValueError(str(e))], cl
+        ) from None
+    return obj if convert is None else convert(obj)
+
+
+__all__ = ("register_decimal_number_hooks", "serializer", "struct_for", "struct_loads")
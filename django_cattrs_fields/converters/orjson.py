@@ -1,12 +1,37 @@
-from typing import Union
+import weakref
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any, Union, get_args, get_origin
 
+import orjson
+from attrs import fields, has
+
+from cattrs.converters import Converter
 from cattrs.preconf.orjson import make_converter
 from django.conf import settings
 
 from django_cattrs_fields.fields import DecimalField
-from django_cattrs_fields.hooks.number_hooks import decimal_unstructure_str
+from django_cattrs_fields.hooks import (
+    boolean_unstructure,
+    char_unstructure,
+    date_unstructure,
+    datetime_unstructure,
+    email_unstructure,
+    float_unstructure,
+    integer_unstructure,
+    slug_unstructure,
+    time_unstructure,
+    url_unstructure,
+    uuid_unstructure,
+)
+from django_cattrs_fields.hooks.number_hooks import (
+    decimal_unstructure_number,
+    decimal_unstructure_str,
+)
+from django_cattrs_fields.utils.hooks import is_default_unstructure_hook
 
 from .register_hooks import (
+    register_compact_profile,
     register_date_unstructure_hooks,
     register_datetime_unstructure_hooks,
     register_structure_hooks,
@@ -29,4 +54,115 @@ if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
     serializer.register_unstructure_hook(DecimalField, decimal_unstructure_str)
     serializer.register_unstructure_hook(Union[DecimalField, None], decimal_unstructure_str)
 
-__all__ = ("serializer",)
+
+def decimal_unstructure_fragment(val: DecimalField | None) -> orjson.Fragment | None:
+    number = decimal_unstructure_number(val)
+    if number is None:
+        return None
+    return orjson.Fragment(number)
+
+
+def register_decimal_number_hooks(converter: Converter):
+    """write decimals as exact json numbers instead of strings"""
+    converter.register_unstructure_hook(DecimalField, decimal_unstructure_fragment)
+    converter.register_unstructure_hook(Union[DecimalField, None], decimal_unstructure_fragment)
+
+
+if getattr(settings, "DCF_DECIMAL_AS_NUMBER", False):
+    register_decimal_number_hooks(serializer)
+
+register_compact_profile(serializer, "orjson")
+
+
+# Direct encoding
+# `serializer.dumps` unstructures the whole object tree into dicts before orjson sees it.
+# `direct_dumps` hands the attrs instances to orjson instead, `default` turns each one into
+# a flat dict only when orjson reaches it, leaving uuids, dates, nested instances and lists
+# to orjson itself. only fields orjson can't encode as they are go through the hooks.
+# classes with their own unstructure hook (not cattrs' default one) are unstructured by it.
+
+# hooks that hand their value to orjson as it is, fields using them can skip the hook.
+# checking the hooks (not the field types) keeps other hooks (e.g: the compact profile) working.
+NATIVE_HOOKS = frozenset(
+    (
+        boolean_unstructure,
+        char_unstructure,
+        date_unstructure,
+        datetime_unstructure,
+        email_unstructure,
+        float_unstructure,
+        integer_unstructure,
+        slug_unstructure,
+        time_unstructure,
+        url_unstructure,
+        uuid_unstructure,
+    )
+)
+
+
+def _is_native(tp: Any) -> bool:
+    if get_origin(tp) is list:
+        return _is_native(get_args(tp)[0])
+    return has(tp) or serializer.get_unstructure_hook(tp) in NATIVE_HOOKS
+
+
+# the encoder of each class hook, a hook registered later is a new key
+_encoders: "weakref.WeakKeyDictionary[Any, Callable[[Any], Any]]" = weakref.WeakKeyDictionary()
+
+
+def _make_encoder(cls: Any, hook: Any) -> Callable[[Any], Any]:
+    if serializer.omit_if_default or not is_default_unstructure_hook(hook, cls, serializer):
+        return hook
+
+    use_alias = getattr(serializer, "use_alias", False)
+    names = tuple(a.alias if use_alias else a.name for a in fields(cls))
+    attrs = tuple(a.name for a in fields(cls))
+    hooks = tuple(
+        None if _is_native(a.type) else serializer.get_unstructure_hook(a.type) for a in fields(cls)
+    )
+
+    if any(hook is not None for hook in hooks):
+        plan = tuple(zip(names, attrs, hooks))
+
+        def encode(obj):
+            return {
+                name: getattr(obj, attr) if hook is None else hook(getattr(obj, attr))
+                for name, attr, hook in plan
+            }
+
+        return encode
+
+    if len(names) == 1:
+        name, attr = names[0], attrs[0]
+        return lambda obj: {name: getattr(obj, attr)}
+
+    getter = attrgetter(*attrs)
+    return lambda obj: dict(zip(names, getter(obj)))
+
+
+def _encoder(cls: Any) -> Callable[[Any], Any]:
+    hook = serializer.get_unstructure_hook(cls)
+    try:
+        return _encoders[hook]
+    except KeyError:
+        encoder = _encoders[hook] = _make_encoder(cls, hook)
+        return encoder
+
+
+def default(obj: Any) -> Any:
+    """the `default` orjson calls for the objects it can't encode, see `direct_dumps`"""
+    if has(obj.__class__):
+        return _encoder(obj.__class__)(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {obj.__class__.__name__}")
+
+
+def direct_dumps(obj: Any, option: int | None = None) -> bytes:
+    """encode attrs instances (or lists of them) without unstructuring them first,
+    the output is the same as `serializer.dumps`, hooks registered on `serializer` are used.
+    """
+    return orjson.dumps(obj, default=default, option=option)
+
+
+__all__ = ("default", "direct_dumps", "register_decimal_number_hooks", "serializer")
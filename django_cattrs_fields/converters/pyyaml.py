@@ -1,14 +1,16 @@
-from typing import Union
+from typing import Any, TypeVar, Union
 
+import yaml
 from django.conf import settings
 
-from cattrs.preconf.pyyaml import make_converter
+from cattrs.preconf.pyyaml import PyyamlConverter, configure_converter
 
 from django_cattrs_fields.fields import DecimalField, TimeField, UUIDField
 from django_cattrs_fields.hooks.date_hooks import time_unstructure_str
 from django_cattrs_fields.hooks.number_hooks import decimal_unstructure_str
 
 from .register_hooks import (
+    register_compact_profile,
     register_structure_hooks,
     register_unstructure_hooks,
     register_datetime_unstructure_hooks,
@@ -16,6 +18,45 @@ from .register_hooks import (
     register_time_unstructure_hooks,
 )
 
+try:
+    # libyaml bindings, only there if pyyaml was built with libyaml
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+
+class YamlConverter(PyyamlConverter):
+    """pyyaml converter that parses and emits with libyaml (`CSafeLoader`, `CSafeDumper`)
+    when it's available, falling back to the pure python safe loader and dumper.
+
+    both resolve tags the same way, so the output doesn't depend on which one is used.
+    """
+
+    loader: type[Any] = SafeLoader
+    dumper: type[Any] = SafeDumper
+
+    def dumps(self, obj: Any, unstructure_as: Any = None, **kwargs: Any) -> str:
+        return yaml.dump(
+            self.unstructure(obj, unstructure_as=unstructure_as), Dumper=self.dumper, **kwargs
+        )
+
+    def loads(self, data: str, cl: type[T]) -> T:
+        return self.structure(yaml.load(data, Loader=self.loader), cl)  # noqa: S506, a safe loader
+
+
+def make_converter(*args: Any, **kwargs: Any) -> YamlConverter:
+    # yaml has no frozensets (it has sets), they're written as lists
+    kwargs["unstruct_collection_overrides"] = {
+        frozenset: list,
+        **kwargs.get("unstruct_collection_overrides", {}),
+    }
+    res = YamlConverter(*args, **kwargs)
+    configure_converter(res)
+    return res
+
+
 serializer = make_converter()
 
 register_structure_hooks(serializer)
@@ -33,5 +74,6 @@ if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
     serializer.register_unstructure_hook(TimeField, time_unstructure_str)
     serializer.register_unstructure_hook(Union[TimeField, None], time_unstructure_str)
 
+register_compact_profile(serializer, "pyyaml")
 
-__all__ = ("serializer",)
+__all__ = ("YamlConverter", "make_converter", "serializer")
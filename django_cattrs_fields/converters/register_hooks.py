@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Union, get_args
 
 from attrs import has
@@ -9,6 +10,7 @@ from django.conf import settings
 from django_cattrs_fields.fields import (
     BooleanField,
     CharField,
+    ChoiceField,
     DateField,
     DateTimeField,
     DecimalField,
@@ -28,8 +30,13 @@ from django_cattrs_fields.hooks import (
     boolean_structure_nullable,
     boolean_unstructure,
     char_structure,
+    char_structure_annotated_factory,
     char_structure_nullable,
     char_unstructure,
+    choice_structure,
+    choice_structure_factory,
+    choice_unstructure,
+    choice_unstructure_factory,
     date_structure,
     date_structure_nullable,
     date_unstructure,
@@ -44,8 +51,16 @@ from django_cattrs_fields.hooks import (
     email_structure_nullable,
     email_unstructure,
     file_structure,
+    file_structure_annotated,
+    file_structure_binary,
+    file_structure_binary_annotated,
+    file_structure_binary_nullable,
+    file_structure_lazy,
+    file_structure_lazy_nullable,
     file_structure_nullable,
     file_unstructure,
+    file_unstructure_binary,
+    file_unstructure_bytes,
     float_structure,
     float_structure_nullable,
     float_unstructure,
@@ -109,12 +124,37 @@ from django_cattrs_fields.hooks.empty_hooks import (
     empty_uuid_unstructure,
     skip_empty,
 )
+from django_cattrs_fields.hooks.compact_hooks import (
+    DATETIME_UNITS,
+    UUID_FORMATS,
+    datetime_structure_epoch,
+    datetime_structure_epoch_nullable,
+    datetime_unstructure_epoch,
+    uuid_structure_compact,
+    uuid_structure_compact_nullable,
+    uuid_unstructure_compact,
+)
 from django_cattrs_fields.hooks.list_hooks import list_structure_hook_factory, is_list_of_attrs
 
 
 def register_structure_hooks(converter: Converter):
     converter.register_structure_hook(BooleanField, boolean_structure)
     converter.register_structure_hook(CharField, char_structure)
+    converter.register_structure_hook_factory(
+        lambda t: (
+            is_annotated(t)
+            and get_args(t)[0]
+            in (CharField, SlugField, Union[CharField, None], Union[SlugField, None])
+        ),
+        char_structure_annotated_factory,
+    )
+    converter.register_structure_hook_factory(
+        lambda t: t is ChoiceField or t == Union[ChoiceField, None], choice_structure
+    )
+    converter.register_structure_hook_factory(
+        lambda t: is_annotated(t) and get_args(t)[0] in (ChoiceField, Union[ChoiceField, None]),
+        choice_structure_factory,
+    )
     converter.register_structure_hook(DateField, date_structure)
     converter.register_structure_hook(DateTimeField, datetime_structure)
     converter.register_structure_hook_func(
@@ -198,6 +238,10 @@ def register_structure_hooks(converter: Converter):
     # File
 
     if getattr(settings, "DCF_FILE_HOOKS", True):
+        converter.register_structure_hook_func(
+            lambda t: is_annotated(t) and get_args(t)[0] in (FileField, Union[FileField, None]),
+            file_structure_annotated,
+        )
         converter.register_structure_hook(FileField, file_structure)
         converter.register_structure_hook(Union[FileField, None], file_structure_nullable)
         converter.register_structure_hook(Union[FileField, EmptyField], empty_file_structure)
@@ -206,6 +250,78 @@ def register_structure_hooks(converter: Converter):
         )
 
 
+def register_lazy_file_structure_hooks(converter: Converter):
+    """structure `FieldFile`s into `LazyFileURL`s, so urls are only worked out when used"""
+    converter.register_structure_hook(FileField, file_structure_lazy)
+    converter.register_structure_hook(Union[FileField, None], file_structure_lazy_nullable)
+
+
+def register_binary_file_hooks(converter: Converter, as_bytes: bool = False):
+    """embed the content of uploaded files, instead of passing the file object along.
+
+    this is meant for binary serializers,
+    set `as_bytes` for libraries that can't take a `memoryview`.
+    """
+    converter.register_structure_hook_func(
+        lambda t: is_annotated(t) and get_args(t)[0] in (FileField, Union[FileField, None]),
+        file_structure_binary_annotated,
+    )
+    converter.register_structure_hook(FileField, file_structure_binary)
+    converter.register_structure_hook(Union[FileField, None], file_structure_binary_nullable)
+
+    unstructure = file_unstructure_bytes if as_bytes else file_unstructure_binary
+    converter.register_unstructure_hook(FileField, unstructure)
+    converter.register_unstructure_hook(Union[FileField, None], unstructure)
+
+
+def register_compact_hooks(
+    converter: Converter, datetime_unit: str = "ms", uuid_format: str = "base64"
+):
+    """write datetimes as integer epochs (`datetime_unit` is one of "s", "ms" or "us")
+    and uuids in a compact form (`uuid_format` is one of "base64", "hex" or "bytes"),
+    both are read back in either form.
+
+    "bytes" is only for serializers that write bytes as they are (msgpack, cbor2, bson, ...),
+    text formats (json, toml, ...) turn bytes into text and can't read the uuid back.
+    """
+    if datetime_unit not in DATETIME_UNITS:
+        raise ValueError(f"unknown datetime unit {datetime_unit!r}")
+    if uuid_format not in UUID_FORMATS:
+        raise ValueError(f"unknown uuid format {uuid_format!r}")
+    if uuid_format == "bytes" and not isinstance(converter.unstructure(b"\0", bytes), bytes):
+        raise ValueError(
+            f'uuid format "bytes" needs a binary serializer, {type(converter).__name__} '
+            'writes bytes as text, use "base64" or "hex" instead'
+        )
+
+    unstructure_datetime = partial(datetime_unstructure_epoch, unit=datetime_unit)
+    converter.register_unstructure_hook(DateTimeField, unstructure_datetime)
+    converter.register_unstructure_hook(Union[DateTimeField, None], unstructure_datetime)
+    converter.register_structure_hook(
+        DateTimeField, partial(datetime_structure_epoch, unit=datetime_unit)
+    )
+    converter.register_structure_hook(
+        Union[DateTimeField, None], partial(datetime_structure_epoch_nullable, unit=datetime_unit)
+    )
+
+    unstructure_uuid = partial(uuid_unstructure_compact, format=uuid_format)
+    converter.register_unstructure_hook(UUIDField, unstructure_uuid)
+    converter.register_unstructure_hook(Union[UUIDField, None], unstructure_uuid)
+    converter.register_structure_hook(UUIDField, uuid_structure_compact)
+    converter.register_structure_hook(Union[UUIDField, None], uuid_structure_compact_nullable)
+
+
+def register_compact_profile(converter: Converter, name: str):
+    """register the compact hooks on a serializer, if `DCF_COMPACT_PROFILE` selects it.
+
+    `DCF_COMPACT_PROFILE` maps serializer names to the options of `register_compact_hooks`:
+    `{"orjson": {}, "msgpack": {"datetime_unit": "us", "uuid_format": "bytes"}}`
+    """
+    options = getattr(settings, "DCF_COMPACT_PROFILE", {}).get(name)
+    if options is not None:
+        register_compact_hooks(converter, **options)
+
+
 def register_model_structure_hook(converter: Converter):
     """these hooks only make sense on a normal converter, not serializers"""
     converter.register_structure_hook_factory(has, structure_model_factory)
@@ -215,6 +331,11 @@ def register_model_structure_hook(converter: Converter):
 def register_unstructure_hooks(converter: Converter):
     converter.register_unstructure_hook(BooleanField, boolean_unstructure)
     converter.register_unstructure_hook(CharField, char_unstructure)
+    converter.register_unstructure_hook(ChoiceField, choice_unstructure)
+    converter.register_unstructure_hook_factory(
+        lambda t: is_annotated(t) and get_args(t)[0] in (ChoiceField, Union[ChoiceField, None]),
+        choice_unstructure_factory,
+    )
     converter.register_unstructure_hook(EmailField, email_unstructure)
     converter.register_unstructure_hook(EmptyField, empty_unstructure)
     converter.register_unstructure_hook(FloatField, float_unstructure)
@@ -225,6 +346,7 @@ def register_unstructure_hooks(converter: Converter):
     # Union types
     converter.register_unstructure_hook(Union[BooleanField, None], boolean_unstructure)
     converter.register_unstructure_hook(Union[CharField, None], char_unstructure)
+    converter.register_unstructure_hook(Union[ChoiceField, None], choice_unstructure)
     converter.register_unstructure_hook(Union[EmailField, None], email_unstructure)
     converter.register_unstructure_hook(Union[FloatField, None], float_unstructure)
     converter.register_unstructure_hook(Union[IntegerField, None], integer_unstructure)
@@ -0,0 +1,163 @@
+import json
+import math
+import re
+import tomllib
+from base64 import b85decode, b85encode
+from collections.abc import Mapping, Set
+from datetime import date, datetime, time
+from typing import Any, TypeVar, Union
+
+from django.conf import settings
+
+from cattrs.converters import BaseConverter, Converter
+from cattrs.fns import identity
+from cattrs.preconf import validate_datetime
+from cattrs.strategies import configure_union_passthrough
+
+from django_cattrs_fields.fields import DecimalField, UUIDField
+from django_cattrs_fields.hooks.number_hooks import decimal_unstructure_str
+
+from .register_hooks import (
+    register_compact_profile,
+    register_structure_hooks,
+    register_unstructure_hooks,
+    register_datetime_unstructure_hooks,
+    register_date_unstructure_hooks,
+    register_time_unstructure_hooks,
+)
+
+# the tomlkit serializer builds a style preserving document for every dump and load,
+# this one reads with the standard library's `tomllib` and writes plain toml itself.
+# use it when the formatting of the documents doesn't matter, tomlkit when it does.
+
+T = TypeVar("T")
+
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+\Z")
+
+
+def _string(val: str) -> str:
+    # json string escapes are valid toml basic string escapes, toml also forbids a raw DEL
+    return json.dumps(val, ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def _key(key: Any) -> str:
+    key = str(key)
+    return key if _BARE_KEY.match(key) else _string(key)
+
+
+def _value(val: Any) -> str:
+    if val is True:
+        return "true"
+    if val is False:
+        return "false"
+    if isinstance(val, str):
+        return _string(val)
+    if isinstance(val, int):
+        return str(val)
+    if isinstance(val, float):
+        if math.isnan(val):
+            return "nan"
+        if math.isinf(val):
+            return "inf" if val > 0 else "-inf"
+        return repr(val)
+    if isinstance(val, (datetime, date, time)):
+        return val.isoformat()
+    if isinstance(val, Mapping):
+        if not val:
+            return "{}"
+        return "{ " + ", ".join(f"{_key(k)} = {_value(v)}" for k, v in val.items()) + " }"
+    if isinstance(val, (list, tuple)):
+        return "[" + ", ".join(_value(v) for v in val) + "]"
+    raise TypeError(f"Unable to convert an object of {type(val)} to a TOML item")
+
+
+def _is_array_of_tables(val: Any) -> bool:
+    return isinstance(val, list) and bool(val) and all(isinstance(v, Mapping) for v in val)
+
+
+def _write_table(lines: list[str], table: Mapping[Any, Any], path: list[str]) -> None:
+    tables = []
+    for key, val in table.items():
+        if isinstance(val, Mapping) or _is_array_of_tables(val):
+            # sub tables have to come after all the values of this table
+            tables.append((key, val))
+        else:
+            lines.append(f"{_key(key)} = {_value(val)}")
+
+    for key, val in tables:
+        sub_path = [*path, _key(key)]
+        name = ".".join(sub_path)
+        if isinstance(val, Mapping):
+            lines.extend(("", f"[{name}]"))
+            _write_table(lines, val, sub_path)
+        else:
+            for item in val:
+                lines.extend(("", f"[[{name}]]"))
+                _write_table(lines, item, sub_path)
+
+
+def dumps_toml(data: Mapping[Any, Any]) -> str:
+    """write a mapping of plain python values as a toml document."""
+    if not isinstance(data, Mapping):
+        raise TypeError("a toml document must be a table, not a " + type(data).__name__)
+    lines: list[str] = []
+    _write_table(lines, data, [])
+    return "\n".join(lines).lstrip("\n") + "\n"
+
+
+class TomlConverter(Converter):
+    """toml converter that loads with `tomllib` and dumps with `dumps_toml`."""
+
+    def dumps(self, obj: Any, unstructure_as: Any = None, **kwargs: Any) -> str:
+        return dumps_toml(self.unstructure(obj, unstructure_as=unstructure_as))
+
+    def loads(self, data: str, cl: type[T]) -> T:
+        return self.structure(tomllib.loads(data), cl)
+
+
+def configure_converter(converter: BaseConverter):
+    """same as `cattrs.preconf.tomlkit.configure_converter`, without the tomlkit item types."""
+    converter.register_structure_hook(bytes, lambda v, _: b85decode(v))
+    converter.register_unstructure_hook(
+        bytes, lambda v: (b85encode(v) if v else b"").decode("utf8")
+    )
+
+    # datetime inherits from date, so identity unstructure hook used
+    # here to prevent the date unstructure hook running.
+    converter.register_unstructure_hook(datetime, identity)
+    converter.register_structure_hook(datetime, validate_datetime)
+    converter.register_unstructure_hook(date, identity)
+    converter.register_structure_hook(
+        date, lambda v, _: v if isinstance(v, date) else date.fromisoformat(v)
+    )
+    configure_union_passthrough(Union[str, bool, int, float], converter)
+
+
+def make_converter(*args: Any, **kwargs: Any) -> TomlConverter:
+    kwargs["unstruct_collection_overrides"] = {
+        Set: list,
+        tuple: list,
+        **kwargs.get("unstruct_collection_overrides", {}),
+    }
+    res = TomlConverter(*args, **kwargs)
+    configure_converter(res)
+    return res
+
+
+serializer = make_converter()
+
+register_structure_hooks(serializer)
+
+register_unstructure_hooks(serializer)
+register_date_unstructure_hooks(serializer)
+register_datetime_unstructure_hooks(serializer)
+register_time_unstructure_hooks(serializer)
+
+
+if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
+    serializer.register_unstructure_hook(UUIDField, lambda x: str(x))
+    serializer.register_unstructure_hook(DecimalField, decimal_unstructure_str)
+
+register_compact_profile(serializer, "toml")
+
+__all__ = ("TomlConverter", "dumps_toml", "make_converter", "serializer")
@@ -6,6 +6,7 @@ from django_cattrs_fields.fields import DecimalField, UUIDField
 from django_cattrs_fields.hooks.number_hooks import decimal_unstructure_str
 
 from .register_hooks import (
+    register_compact_profile,
     register_structure_hooks,
     register_unstructure_hooks,
     register_datetime_unstructure_hooks,
@@ -27,4 +28,6 @@ if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
     serializer.register_unstructure_hook(UUIDField, lambda x: str(x))
     serializer.register_unstructure_hook(DecimalField, decimal_unstructure_str)
 
+register_compact_profile(serializer, "tomlkit")
+
 __all__ = ("serializer",)
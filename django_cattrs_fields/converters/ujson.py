@@ -9,6 +9,7 @@ from django_cattrs_fields.hooks.date_hooks import time_unstructure_str
 from django_cattrs_fields.hooks.number_hooks import decimal_unstructure_str
 
 from .register_hooks import (
+    register_compact_profile,
     register_structure_hooks,
     register_unstructure_hooks,
 )
@@ -35,4 +36,6 @@ if getattr(settings, "DCF_SERIALIZER_HOOKS", True):
     serializer.register_unstructure_hook(TimeField, time_unstructure_str)
     serializer.register_unstructure_hook(Union[TimeField, None], time_unstructure_str)
 
+register_compact_profile(serializer, "ujson")
+
 __all__ = ("serializer",)
@@ -1,9 +1,28 @@
 import datetime
 import uuid
 from decimal import Decimal
-from typing import final
+from typing import Any, final
 
-from attrs import frozen
+from attrs import field, frozen
+
+
+def _hashable_choices(choices: Any) -> Any:
+    # `Params` ends up in type annotations, which have to be hashable,
+    # groups (`("Audio", [("vinyl", "Vinyl"), ...])`) and dicts like django's are nested
+    if isinstance(choices, dict):
+        return tuple((k, _hashable_choices(v)) for k, v in choices.items())
+    if isinstance(choices, (list, tuple)):
+        return tuple(_hashable_choices(c) for c in choices)
+    return choices
+
+
+def _content_types(content_types: Any) -> tuple[str, ...] | None:
+    # a list (or any iterable) of content types, kept as a tuple to stay hashable
+    if content_types is None:
+        return None
+    if isinstance(content_types, str):
+        return (content_types,)
+    return tuple(content_types)
 
 
 @frozen
@@ -15,10 +34,30 @@ class Params:
     decimal_max_digits : (for DecimalField only) maximum number of digits allowed in the number.
 
     decimal_places : (for DecimalField only) the number of decimal places to store with the number.
+
+    file_max_size : (for FileField only) maximum size of an uploaded file, in bytes.
+
+    file_content_types : (for FileField only) allowed content types of an uploaded file.
+
+    file_hash : (for FileField only) name of a `hashlib` algorithm,
+        the hex digest of an uploaded file is stored on its `checksum` attribute.
+
+    intern : (for CharField and SlugField only) share one string object between equal values,
+        `"batch"` within an `interning()` block, `"global"` through a bounded process wide table.
+
+    choices : (for ChoiceField only) the allowed values, a django `TextChoices`/`IntegerChoices`
+        (or any enum) class, `(value, label)` pairs like django's `choices`, or just the values.
     """
 
     decimal_max_digits: int | None = None  # for DecimalField only
     decimal_places: int | None = None  # for DecimalField only
+    file_max_size: int | None = None  # for FileField only
+    file_content_types: tuple[str, ...] | None = field(
+        default=None, converter=_content_types
+    )  # for FileField only
+    file_hash: str | None = None  # for FileField only
+    intern: str | None = None  # for CharField and SlugField only
+    choices: Any = field(default=None, converter=_hashable_choices)  # for ChoiceField only
 
 
 type BooleanField = bool
@@ -33,6 +72,9 @@ type URLField = str
 
 type UUIDField = uuid.UUID
 
+# the value of a choice, or its member for enum choices (`TextChoices` members are strings)
+type ChoiceField = str | int
+
 type IntegerField = int
 
 type DecimalField = Decimal
@@ -9,9 +9,15 @@ from cattrs import Converter
 from cattrs.gen import make_dict_structure_fn
 
 from django_cattrs_fields.hooks.list_hooks import is_list_of_attrs
+from django_cattrs_fields.utils.relations import (
+    model_to_dict_related,
+    prefetch_related,
+    relation_fields,
+)
 
 from .bool_hooks import *
 from .char_hooks import *
+from .choice_hooks import *
 from .date_hooks import *
 from .empty_hooks import (
     empty_bool_structure,
@@ -67,6 +73,12 @@ __all__ = (
     "boolean_structure_nullable",
     "boolean_unstructure",
     "char_structure",
+    "char_structure_annotated_factory",
+    "choice_structure",
+    "choice_structure_factory",
+    "choice_unstructure",
+    "choice_unstructure_factory",
+    "choices_of",
     "char_structure_nullable",
     "char_unstructure",
     "date_structure",
@@ -79,6 +91,7 @@ __all__ = (
     "decimal_structure_annotated",
     "decimal_structure_nullable",
     "decimal_unstructure",
+    "decimal_unstructure_number",
     "decimal_unstructure_str",
     "email_structure",
     "email_structure_nullable",
@@ -125,8 +138,16 @@ __all__ = (
     "empty_uuid_structure_nullable",
     "empty_uuid_unstructure",
     "file_structure",
+    "file_structure_annotated",
+    "file_structure_binary",
+    "file_structure_binary_annotated",
+    "file_structure_binary_nullable",
+    "file_structure_lazy",
+    "file_structure_lazy_nullable",
     "file_structure_nullable",
     "file_unstructure",
+    "file_unstructure_binary",
+    "file_unstructure_bytes",
     "float_structure",
     "float_structure_nullable",
     "float_unstructure",
@@ -148,10 +169,18 @@ __all__ = (
 
 def structure_model_factory(cls: Any, converter: Converter):
     fn = make_dict_structure_fn(cls, converter)
+    # nested attrs classes stand for related objects,
+    # these are handed over as model objects instead of their primary keys
+    relations = relation_fields(cls)
 
     def structure(d, cl):
         if isinstance(d, Model):
-            d = model_to_dict(d)
+            if relations:
+                # a no-op for relations fetched along with the object, or by the list hook
+                prefetch_related([d], cls)
+                d = model_to_dict_related(d, relations)
+            else:
+                d = model_to_dict(d)
         return fn(d, cl)
 
     return structure
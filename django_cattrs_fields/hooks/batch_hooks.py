@@ -0,0 +1,232 @@
+import math
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from attrs import NOTHING, fields
+from cattrs.errors import BaseValidationError, StructureHandlerNotFoundError
+
+from django_cattrs_fields.hooks.char_hooks import char_structure, char_structure_nullable
+from django_cattrs_fields.hooks.number_hooks import (
+    float_structure,
+    float_structure_nullable,
+    integer_structure,
+    integer_structure_nullable,
+)
+from django_cattrs_fields.hooks.row_hooks import attribute_structure_hook
+from django_cattrs_fields.utils.intern import interning
+
+if TYPE_CHECKING:
+    from cattrs.converters import Converter
+
+# structuring `list[Cls]` calls a hook for every field of every row.
+# `structure_batch` works a column at a time instead, a batch hook gets every value of a field
+# and checks them in one go, the scalar hook only runs for columns that need converting.
+#
+# batch hooks take `(values, type)` and return the structured values as a list,
+# they raise on the first invalid value, `structure_batch` then structures the rows
+# the regular way so the errors are the same as `converter.structure(rows, list[Cls])`.
+
+__all__ = (
+    "DEFAULT_BATCH_HOOKS",
+    "batch_hooks",
+    "char_structure_batch",
+    "char_structure_nullable_batch",
+    "float_structure_batch",
+    "float_structure_nullable_batch",
+    "integer_structure_batch",
+    "integer_structure_nullable_batch",
+    "register_batch_hook",
+    "structure_batch",
+    "structure_columns",
+)
+
+type BatchHook = Callable[[Sequence[Any], Any], list[Any]]
+
+
+# Integer hooks
+
+
+def integer_structure_batch(values: Sequence[Any], _) -> list[Any]:
+    # ints (not bools) are what `integer_structure` would return as they are
+    if all(type(v) is int for v in values):
+        return list(values)
+    return [integer_structure(v, _) for v in values]
+
+
+def integer_structure_nullable_batch(values: Sequence[Any], _) -> list[Any]:
+    if all(type(v) is int or v is None for v in values):
+        return list(values)
+    return [integer_structure_nullable(v, _) for v in values]
+
+
+# Float hooks
+
+
+def float_structure_batch(values: Sequence[Any], _) -> list[Any]:
+    if all(type(v) is float for v in values) and all(map(math.isfinite, values)):
+        return list(values)
+    return [float_structure(v, _) for v in values]
+
+
+def float_structure_nullable_batch(values: Sequence[Any], _) -> list[Any]:
+    if all(v is None or (type(v) is float and math.isfinite(v)) for v in values):
+        return list(values)
+    return [float_structure_nullable(v, _) for v in values]
+
+
+# Char hooks
+
+
+def char_structure_batch(values: Sequence[Any], _) -> list[Any]:
+    # non empty strings without null characters, see `char_field_validation`
+    if all(type(v) is str and v for v in values) and "\x00" not in "".join(values):
+        return list(values)
+    return [char_structure(v, _) for v in values]
+
+
+def char_structure_nullable_batch(values: Sequence[Any], _) -> list[Any]:
+    strings = [v for v in values if v is not None]
+    if all(type(v) is str and v for v in strings) and "\x00" not in "".join(strings):
+        return list(values)
+    return [char_structure_nullable(v, _) for v in values]
+
+
+# the batch hook of each scalar hook, a column uses a batch hook only when the converter's
+# hook for the field is the scalar hook it stands for.
+# add your own to a converter with `register_batch_hook`.
+DEFAULT_BATCH_HOOKS: Mapping[Callable[..., Any], BatchHook] = MappingProxyType(
+    {
+        char_structure: char_structure_batch,
+        char_structure_nullable: char_structure_nullable_batch,
+        float_structure: float_structure_batch,
+        float_structure_nullable: float_structure_nullable_batch,
+        integer_structure: integer_structure_batch,
+        integer_structure_nullable: integer_structure_nullable_batch,
+    }
+)
+
+# what the scalar hooks raise for invalid values (and cattrs for nested classes),
+# these make `structure_batch` structure the rows again to report them the regular way.
+# anything else (e.g: a bug in a batch hook) is raised as it is.
+VALIDATION_ERRORS = (ValueError, TypeError, KeyError, BaseValidationError)
+
+
+class _BatchHooks:
+    """never structured, its structure hook on a converter holds the converter's batch hooks,
+    converters can't have attributes of their own, and copies of a converter keep them.
+    """
+
+
+def batch_hooks(converter: "Converter") -> Mapping[Callable[..., Any], BatchHook]:
+    """the batch hook of each scalar hook, for `converter`."""
+    try:
+        hook = converter.get_structure_hook(_BatchHooks)
+    except StructureHandlerNotFoundError:
+        return DEFAULT_BATCH_HOOKS
+    return getattr(hook, "batch_hooks", DEFAULT_BATCH_HOOKS)
+
+
+def register_batch_hook(converter: "Converter", handler: Callable[..., Any], batch: BatchHook):
+    """use `batch` for the columns of fields `converter` structures with `handler`.
+
+    `batch` takes `(values, type)`, returns the structured values as a list
+    and raises a `ValueError` for invalid values.
+    """
+    hooks = MappingProxyType({**batch_hooks(converter), handler: batch})
+
+    def structure(val, _):
+        raise TypeError("batch hooks aren't structured")
+
+    structure.batch_hooks = hooks  # type: ignore[attr-defined]
+    converter.register_structure_hook(_BatchHooks, structure)
+
+
+def _column_hook(
+    a: Any, converter: "Converter", hooks: Mapping[Callable[..., Any], BatchHook]
+) -> BatchHook | None:
+    handler = attribute_structure_hook(a, converter)
+    if handler is None:
+        return None
+    batch = hooks.get(handler)
+    if batch is not None:
+        return batch
+    return lambda values, t: [handler(v, t) for v in values]
+
+
+def _structure_columns(columns: Mapping[str, Sequence[Any]], cls: Any, converter: "Converter"):
+    use_alias = getattr(converter, "use_alias", False)
+    hooks = batch_hooks(converter)
+    size = None
+    structured = []
+    for a in fields(cls):
+        if not a.init:
+            continue
+        key = a.alias if use_alias else a.name
+        column = columns.get(key)
+        if column is None:
+            if a.default is NOTHING:
+                raise KeyError(key)
+            continue
+
+        if size is None:
+            size = len(column)
+        elif len(column) != size:
+            raise ValueError("columns have different lengths")
+
+        hook = _column_hook(a, converter, hooks)
+        values = column if hook is None else hook(column, a.type)
+        structured.append((a.alias, values))
+
+    if not structured:
+        raise ValueError("no columns to structure")
+
+    names = [name for name, _ in structured]
+    return [cls(**dict(zip(names, row))) for row in zip(*(values for _, values in structured))]
+
+
+def _rows(columns: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def structure_columns(
+    columns: Mapping[str, Sequence[Any]], cls: Any, converter: "Converter"
+) -> list[Any]:
+    """structure columns (a list of values per field name) into a list of `cls`.
+
+    every row must have a value for every column given, fields without a column use
+    their default.
+    """
+    # `Params(intern="batch")` fields share their strings within the batch
+    with interning():
+        try:
+            return _structure_columns(columns, cls, converter)
+        except VALIDATION_ERRORS:
+            # structure the rows one by one, so the errors are reported the regular way
+            return converter.structure(_rows(columns), list[cls])
+
+
+def structure_batch(
+    rows: Iterable[Mapping[str, Any]], cls: Any, converter: "Converter"
+) -> list[Any]:
+    """same as `converter.structure(rows, list[cls])`, but a column at a time (see `batch_hooks`).
+
+    rows must have the same keys, otherwise they're structured the regular way.
+    instances are made from the fields of `cls`, a structure hook registered for `cls`
+    itself isn't used.
+    """
+    rows = list(rows)
+    with interning():
+        if not rows or getattr(converter, "forbid_extra_keys", False):
+            return converter.structure(rows, list[cls])
+
+        keys = rows[0].keys()
+        if any(row.keys() != keys for row in rows):
+            return converter.structure(rows, list[cls])
+
+        columns = {key: [row[key] for row in rows] for key in keys}
+        try:
+            return _structure_columns(columns, cls, converter)
+        except VALIDATION_ERRORS:
+            return converter.structure(rows, list[cls])
@@ -1,10 +1,13 @@
 import uuid
+from collections.abc import Callable
+from typing import Any, Union, get_args
 
 from django.core import validators
 from django.core.exceptions import ValidationError
 
 from django_cattrs_fields.fields import (
     CharField,
+    Params,
     EmailField,
     SlugField,
     UUIDField,
@@ -15,10 +18,12 @@ from django_cattrs_fields.validators import (
     char_field_validation,
     slug_field_validation,
 )
+from django_cattrs_fields.utils.intern import INTERN_POLICIES, intern_string
 
 
 __all__ = (
     "char_structure",
+    "char_structure_annotated_factory",
     "char_structure_nullable",
     "char_unstructure",
     "email_structure",
@@ -53,6 +58,33 @@ def char_unstructure(val: CharField | None) -> str | None:
     return val
 
 
+def char_structure_annotated_factory(tp: Any) -> Callable[[Any, Any], CharField | SlugField]:
+    """the structure hook of an annotated `CharField` or `SlugField` (or either `| None`),
+    made once per type.
+    """
+    base, *metadata = get_args(tp)
+    structure = {
+        CharField: char_structure,
+        SlugField: slug_structure,
+        Union[CharField, None]: char_structure_nullable,
+        Union[SlugField, None]: slug_structure_nullable,
+    }[base]
+    params = next((m for m in metadata if isinstance(m, Params)), None)
+    policy = params.intern if params is not None else None
+    if policy is None:
+        return structure
+    if policy not in INTERN_POLICIES:
+        raise ValueError(f"intern should be one of {', '.join(INTERN_POLICIES)}, not {policy!r}")
+
+    def structure_interned(val, _) -> str | None:
+        val = structure(val, _)
+        if val is None:
+            return None
+        return intern_string(val, policy)
+
+    return structure_interned
+
+
 # Email hooks
 
 
@@ -98,6 +130,13 @@ def slug_unstructure(val: SlugField | None) -> str | None:
 
 
 def uuid_structure(val, _) -> UUIDField:
+    if isinstance(val, (bytes, bytearray, memoryview)):
+        # binary serializers can carry the 16 raw bytes
+        try:
+            return uuid.UUID(bytes=bytes(val))
+        except ValueError:
+            raise ValueError("a binary uuid must be 16 bytes long")
+
     null_char_validator(val)
 
     if isinstance(val, uuid.UUID):
@@ -0,0 +1,98 @@
+from collections.abc import Callable, Iterator
+from enum import Enum
+from typing import Any, get_args
+
+from django_cattrs_fields.fields import ChoiceField, Params
+
+__all__ = (
+    "choice_structure",
+    "choice_structure_factory",
+    "choice_unstructure",
+    "choice_unstructure_factory",
+    "choices_of",
+)
+
+# the choices of a field are read once per type, into a dict from every accepted input
+# to what it's structured into, so checking a value is a single lookup.
+
+
+def choices_of(tp: Any) -> Any:
+    """the choices of an annotated `ChoiceField`, from its `Params` or an enum class."""
+    for m in get_args(tp)[1:]:
+        if isinstance(m, Params) and m.choices is not None:
+            return m.choices
+        if isinstance(m, type) and issubclass(m, Enum):
+            return m
+    raise TypeError(
+        "ChoiceField needs its choices, e.g: Annotated[ChoiceField, Params(choices=...)]"
+    )
+
+
+def _values(choices: Any) -> Iterator[Any]:
+    for choice in choices:
+        if not isinstance(choice, tuple):
+            yield choice
+        elif isinstance(choice[1], tuple):
+            # a group, `(group name, choices)`
+            yield from _values(choice[1])
+        else:
+            # `(value, label)`
+            yield choice[0]
+
+
+def _lookup(choices: Any) -> tuple[dict[Any, Any], frozenset[type]]:
+    """a dict from every accepted input to what it's structured into, and the accepted types."""
+    if isinstance(choices, type) and issubclass(choices, Enum):
+        values = {member.value: member for member in choices}
+    else:
+        values = {value: value for value in _values(choices)}
+
+    lookup = dict(values)
+    types = {type(value) for value in values}
+    for value, result in values.items():
+        if not isinstance(value, str):
+            # forms, query strings and csv give numbers as strings
+            lookup.setdefault(str(value), result)
+            types.add(str)
+    for result in values.values():
+        if isinstance(result, Enum):
+            lookup.setdefault(result, result)
+            types.add(type(result))
+    return lookup, frozenset(types)
+
+
+def choice_structure(tp: Any) -> Callable[[Any, Any], ChoiceField]:
+    """`ChoiceField` without choices is a mistake, it's raised when the class hook is made."""
+    raise TypeError(
+        "ChoiceField needs its choices, e.g: Annotated[ChoiceField, Params(choices=...)]"
+    )
+
+
+def choice_structure_factory(tp: Any) -> Callable[[Any, Any], ChoiceField | None]:
+    """the structure hook of an annotated `ChoiceField` (or `ChoiceField | None`),
+    made once per type.
+
+    enum choices are structured into their members, other choices into their value.
+    """
+    lookup, types = _lookup(choices_of(tp))
+    nullable = get_args(tp)[0] is not ChoiceField
+
+    def structure(val, _) -> ChoiceField | None:
+        # the type is checked first, `True` and `1.0` are equal (and hash the same) as `1`
+        if type(val) in types and val in lookup:
+            return lookup[val]
+        if val is None and nullable:
+            return None
+        raise ValueError(f"Value {val!r} is not a valid choice.")
+
+    return structure
+
+
+def choice_unstructure(val: ChoiceField | None) -> str | int | None:
+    if isinstance(val, Enum):
+        return val.value
+    return val
+
+
+def choice_unstructure_factory(tp: Any) -> Callable[[Any], str | int | None]:
+    return choice_unstructure
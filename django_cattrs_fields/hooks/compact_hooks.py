@@ -0,0 +1,95 @@
+import base64
+import datetime
+import uuid
+
+from django_cattrs_fields.fields import DateTimeField, UUIDField
+from django_cattrs_fields.hooks.char_hooks import uuid_structure
+from django_cattrs_fields.hooks.date_hooks import datetime_structure
+
+# the compact profile writes datetimes as integer epochs and uuids in a shorter form,
+# see `register_compact_hooks`.
+
+__all__ = (
+    "DATETIME_UNITS",
+    "UUID_FORMATS",
+    "datetime_structure_epoch",
+    "datetime_structure_epoch_nullable",
+    "datetime_unstructure_epoch",
+    "uuid_structure_compact",
+    "uuid_structure_compact_nullable",
+    "uuid_unstructure_compact",
+)
+
+# length of each unit, in microseconds
+DATETIME_UNITS = {"s": 1_000_000, "ms": 1_000, "us": 1}
+
+UUID_FORMATS = ("base64", "bytes", "hex")
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+
+# a uuid's 16 bytes, as url safe base64 without the padding
+BASE64_UUID_LENGTH = 22
+
+
+# DateTime hooks
+
+
+def datetime_unstructure_epoch(val: DateTimeField | None, unit: str = "ms") -> int | None:
+    """the datetime as an integer number of `unit`s since the epoch.
+
+    naive datetimes are taken as UTC.
+    """
+    if val is None:
+        return None
+    if val.tzinfo is None:
+        val = val.replace(tzinfo=datetime.UTC)
+    return (val - EPOCH) // datetime.timedelta(microseconds=DATETIME_UNITS[unit])
+
+
+def datetime_structure_epoch(val, _, unit: str = "ms") -> DateTimeField:
+    """read an epoch written by `datetime_unstructure_epoch` (or a float one, e.g: from javascript),
+    anything else goes to `datetime_structure`.
+    """
+    if isinstance(val, int | float) and not isinstance(val, bool):
+        try:
+            val = EPOCH + datetime.timedelta(microseconds=val * DATETIME_UNITS[unit])
+        except (OverflowError, ValueError):
+            # out of range, or a float nan
+            raise ValueError("Datetime value out of range")
+    return datetime_structure(val, _)
+
+
+def datetime_structure_epoch_nullable(val, _, unit: str = "ms") -> DateTimeField | None:
+    if val is None:
+        return None
+    return datetime_structure_epoch(val, _, unit)
+
+
+# UUID hooks
+
+
+def uuid_unstructure_compact(val: UUIDField | None, format: str = "base64") -> str | bytes | None:
+    if val is None:
+        return None
+    if format == "base64":
+        return base64.urlsafe_b64encode(val.bytes)[:BASE64_UUID_LENGTH].decode("ascii")
+    if format == "hex":
+        return val.hex
+    return val.bytes
+
+
+def uuid_structure_compact(val, _) -> UUIDField:
+    """read any of the compact forms, or a regular uuid"""
+    if isinstance(val, str) and len(val) == BASE64_UUID_LENGTH:
+        try:
+            return uuid.UUID(bytes=base64.urlsafe_b64decode(val + "=="))
+        except ValueError:
+            raise ValueError("badly formed base64 uuid")
+    # hex and raw bytes are understood by `uuid_structure`
+    return uuid_structure(val, _)
+
+
+def uuid_structure_compact_nullable(val, _) -> UUIDField | None:
+    if val is None:
+        return None
+    return uuid_structure_compact(val, _)
@@ -78,6 +78,8 @@ def skip_empty(cls: Any, converter: Converter) -> Callable[[Any], dict[str, Any]
         data = fn(obj)
         return {k: v for k, v in data.items() if v is not Empty}
 
+    # `UnstructuredView` applies the same rule lazily
+    unstructure.skips_empty = True  # type: ignore[attr-defined]
     return unstructure
 
 
@@ -1,3 +1,10 @@
+import io
+import mmap
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Any, get_args
+
 from django.core.files.uploadedfile import (
     InMemoryUploadedFile,
     TemporaryUploadedFile,
@@ -7,11 +14,21 @@ from django.db.models.fields.files import FieldFile
 from django.utils.translation import gettext_lazy as _
 
 from django_cattrs_fields.fields.files import FileField
+from django_cattrs_fields.utils.files import LazyFileURL, file_url, validate_upload
 
 __all__ = (
     "file_structure",
+    "file_structure_annotated",
+    "file_structure_binary",
+    "file_structure_binary_annotated",
+    "file_structure_binary_nullable",
+    "file_structure_lazy",
+    "file_structure_lazy_nullable",
     "file_structure_nullable",
     "file_unstructure",
+    "file_unstructure_binary",
+    "file_unstructure_bytes",
+    "file_buffers",
 )
 
 
@@ -28,12 +45,28 @@ def file_structure(val: FileField | FieldFile, _t) -> FileField | str:
 
     # GET request, return the file url to client
     elif isinstance(val, FieldFile):
-        return val.url
+        return file_url(val)
 
     # if using this field as a client, and we call some API, we get the url back as a string
     return val
 
 
+def file_structure_annotated(val: FileField | FieldFile | None, type) -> FileField | str | None:
+    annotation = get_args(type)
+    if not val and annotation[0] is not FileField:
+        # `Annotated[FileField | None, Params(...)]`
+        return None
+    val = file_structure(val, type)
+    if len(annotation) > 1 and isinstance(val, UploadedFile):
+        validate_upload(
+            val,
+            max_size=getattr(annotation[1], "file_max_size", None),
+            content_types=getattr(annotation[1], "file_content_types", None),
+            hash_name=getattr(annotation[1], "file_hash", None),
+        )
+    return val
+
+
 def file_structure_nullable(
     val: FileField | FieldFile | None,
     _t,
@@ -43,8 +76,24 @@ def file_structure_nullable(
     return file_structure(val, _t)
 
 
+def file_structure_lazy(val: FileField | FieldFile, _t) -> FileField | str | LazyFileURL:
+    """same as `file_structure`, but the url of a `FieldFile` is only worked out when it's used"""
+    if isinstance(val, FieldFile):
+        return LazyFileURL(val)
+    return file_structure(val, _t)
+
+
+def file_structure_lazy_nullable(
+    val: FileField | FieldFile | None,
+    _t,
+) -> FileField | str | LazyFileURL | None:
+    if not val:
+        return None
+    return file_structure_lazy(val, _t)
+
+
 def file_unstructure(
-    val: FileField | FieldFile | str | None,
+    val: FileField | FieldFile | LazyFileURL | str | None,
 ) -> InMemoryUploadedFile | TemporaryUploadedFile | str | None:
     if not val:
         return None
@@ -52,10 +101,135 @@ def file_unstructure(
     if isinstance(val, UploadedFile):
         return val
 
+    elif isinstance(val, LazyFileURL):
+        return str(val)
+
     # normally a structured data doesn't have FieldFile,
     # but just in case user wants to do something manual
     elif isinstance(val, FieldFile):
-        return val.url
+        return file_url(val)
 
     # url
     return val
+
+
+# Binary hooks
+# these embed the content of uploaded files, for binary serializers (msgpack, cbor2, bson)
+
+# the buffers handed out within a `file_buffers()` block, and the mappings behind them
+_open_buffers: ContextVar[list[tuple[memoryview, mmap.mmap | None]] | None] = ContextVar(
+    "open_buffers", default=None
+)
+
+
+@contextmanager
+def file_buffers() -> Iterator[None]:
+    """let `file_buffer` hand out views instead of copies, until the end of this block.
+
+    the views (and the memory mappings of files on disk) are released when the block ends,
+    so whatever reads them (e.g: `msgpack.packb`) has to be done by then.
+    """
+    if _open_buffers.get() is not None:
+        # already in a block
+        yield
+        return
+
+    buffers: list[tuple[memoryview, mmap.mmap | None]] = []
+    token = _open_buffers.set(buffers)
+    try:
+        yield
+    finally:
+        _open_buffers.reset(token)
+        for view, mapping in buffers:
+            # a view still exported somewhere else is left to the garbage collector
+            with suppress(BufferError):
+                view.release()
+                if mapping is not None:
+                    mapping.close()
+
+
+def file_buffer(file: UploadedFile) -> memoryview | bytes:
+    """the content of `file`.
+
+    within a `file_buffers()` block it isn't copied: in memory files give a view of their buffer,
+    files on disk are memory mapped. outside of a block the content is read.
+    """
+    raw = getattr(file, "file", None)
+    buffers = _open_buffers.get()
+
+    if isinstance(raw, io.BytesIO):
+        if buffers is None:
+            return raw.getvalue()
+        view = raw.getbuffer()
+        buffers.append((view, None))
+        return view
+
+    try:
+        fileno = raw.fileno()  # type: ignore[union-attr]
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fileno = None
+
+    if fileno is not None and buffers is not None:
+        raw.flush()  # type: ignore[union-attr]
+        if file.size == 0:
+            return b""
+        mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapping)
+        buffers.append((view, mapping))
+        return view
+
+    file.seek(0)
+    content = file.read()
+    file.seek(0)
+    return content
+
+
+def uploaded_file_from_binary(val: Any) -> Any:
+    """turn an embedded file back into an `InMemoryUploadedFile`, anything else is returned as is"""
+    if isinstance(val, Mapping) and "content" in val:
+        content = val["content"]
+        return InMemoryUploadedFile(
+            file=io.BytesIO(content),  # shares the buffer of `content` until it's written to
+            field_name=None,
+            name=val.get("name"),
+            content_type=val.get("content_type"),
+            size=len(content),
+            charset=None,
+        )
+    return val
+
+
+def file_structure_binary(val: Any, _t) -> FileField | str:
+    return file_structure(uploaded_file_from_binary(val), _t)
+
+
+def file_structure_binary_annotated(val: Any, type) -> FileField | str | None:
+    return file_structure_annotated(uploaded_file_from_binary(val), type)
+
+
+def file_structure_binary_nullable(val: Any, _t) -> FileField | str | None:
+    if not val:
+        return None
+    return file_structure_binary(val, _t)
+
+
+def file_unstructure_binary(
+    val: FileField | FieldFile | LazyFileURL | str | None,
+) -> dict[str, Any] | str | None:
+    """embed uploaded files as a `{"name", "content_type", "content"}` dict,
+    `content` being a buffer of the file (not a copy) within a `file_buffers()` block,
+    urls are left as they are.
+    """
+    if isinstance(val, UploadedFile):
+        return {"name": val.name, "content_type": val.content_type, "content": file_buffer(val)}
+    return file_unstructure(val)  # type: ignore[return-value]
+
+
+def file_unstructure_bytes(
+    val: FileField | FieldFile | LazyFileURL | str | None,
+) -> dict[str, Any] | str | None:
+    """same as `file_unstructure_binary`, for libraries that only take `bytes`"""
+    data = file_unstructure_binary(val)
+    if isinstance(data, dict):
+        data["content"] = bytes(data["content"])
+    return data
@@ -2,8 +2,13 @@ from typing import TYPE_CHECKING, Any, get_args, get_origin
 
 from attrs import has
 
-from django.db.models import Model
-from django.forms.models import model_to_dict
+from django.db.models import QuerySet
+
+from django_cattrs_fields.utils.relations import (
+    apply_related_lookups,
+    prefetch_related,
+    related_fetched,
+)
 
 if TYPE_CHECKING:
     from cattrs.converters import Converter
@@ -22,10 +27,17 @@ def list_structure_hook_factory(cls: Any, converter: "Converter"):
     (elem_type,) = get_args(cls)
 
     def hook(obj, _):
-        return [
-            converter.structure(model_to_dict(item) if isinstance(item, Model) else item, elem_type)
-            for item in obj
-        ]
+        if isinstance(obj, QuerySet):
+            # join or prefetch whatever the nested classes need, before the queryset is evaluated
+            obj = apply_related_lookups(obj, elem_type)
+        else:
+            # model objects that are already fetched get their relations in one go
+            obj = list(obj)
+            prefetch_related(obj, elem_type)
+        # model objects are turned into dicts by the structure hook of `elem_type`,
+        # the lookups above cover nested classes too, so nothing is fetched per object
+        with related_fetched():
+            return [converter.structure(item, elem_type) for item in obj]
 
     return hook
 
@@ -47,8 +47,14 @@ def integer_unstructure(val: IntegerField | None) -> int | None:
 # Decimal hooks
 
 
-def decimal_structure(val: str | Decimal, _, max_digits=None, decimal_places=None) -> DecimalField:
+def decimal_structure(
+    val: str | float | Decimal, _, max_digits=None, decimal_places=None
+) -> DecimalField:
     forbid_falsy_numbers(val)
+    if isinstance(val, float):
+        # json numbers are decoded as floats, `Decimal(0.1)` would carry the float's binary error,
+        # the shortest repr gives back the number as it was written (up to 15 significant digits)
+        val = repr(val)
     try:
         value = Decimal(val)
     except DecimalException:
@@ -62,7 +68,7 @@ def decimal_structure(val: str | Decimal, _, max_digits=None, decimal_places=Non
     return value
 
 
-def decimal_structure_annotated(val: str | Decimal, type) -> DecimalField:
+def decimal_structure_annotated(val: str | float | Decimal, type) -> DecimalField:
     annotation = get_args(type)
     if len(annotation) > 1:
         max_digits: int | None = getattr(annotation[1], "decimal_max_digits", None)
@@ -92,6 +98,22 @@ def decimal_unstructure_str(val: DecimalField | None) -> str | None:
     return str(val.normalize())
 
 
+def decimal_unstructure_number(val: DecimalField | None) -> str | None:
+    """the exact json number of a decimal, for serializers that can write raw json.
+
+    json numbers are decoded as floats, decimals a float can't hold
+    (more than 15 significant digits, or out of its range) are written as json strings instead.
+    """
+    if val is None:
+        return None
+    if not val.is_finite():
+        raise ValueError("infinite values are not supported.")
+    number = format(val, "f")
+    if Decimal(repr(float(val))) != val:
+        return f'"{number}"'
+    return number
+
+
 # Float hooks
 
 
@@ -0,0 +1,114 @@
+from collections.abc import Callable, Sequence
+from types import NoneType
+from typing import Any
+
+import numpy as np
+
+from django_cattrs_fields.hooks.number_hooks import (
+    float_structure,
+    float_structure_nullable,
+    integer_structure,
+    integer_structure_nullable,
+)
+
+# numeric columns as numpy arrays, for code that works on the numbers with numpy.
+# the values are turned into an array once and the finiteness, range and null checks
+# run over the whole array, columns numpy can't take as they are (strings, bools, ...)
+# go through the scalar hooks.
+# these aren't batch hooks, turning the array back into a list is slower than the
+# plain batch hooks in `batch_hooks`.
+
+__all__ = (
+    "float_array",
+    "integer_array",
+)
+
+# how many of the invalid indices are named in the error
+MAX_REPORTED_INDICES = 20
+
+INT64_MIN = int(np.iinfo(np.int64).min)
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def _invalid(indices: Sequence[int]) -> ValueError:
+    shown = ", ".join(str(i) for i in indices[:MAX_REPORTED_INDICES])
+    if len(indices) > MAX_REPORTED_INDICES:
+        shown += f", ... ({len(indices)} in total)"
+    return ValueError(f"invalid values at indices {shown}")
+
+
+def _scalar(values: Sequence[Any], hook: Callable[[Any, Any], Any]) -> list[Any]:
+    """run the scalar hook over the column, collecting the indices it rejects."""
+    result = []
+    invalid = []
+    for i, v in enumerate(values):
+        try:
+            result.append(hook(v, None))
+        except ValueError:
+            invalid.append(i)
+    if invalid:
+        raise _invalid(invalid)
+    return result
+
+
+def _nulls(values: Sequence[Any]) -> np.ndarray:
+    return np.equal(np.array(values, dtype=object), None)
+
+
+def float_array(values: Sequence[Any], nullable: bool = False) -> np.ndarray:
+    """the column as a float64 array, nulls (if `nullable`) become nan.
+
+    raises a `ValueError` naming the indices of the invalid values.
+    """
+    types = set(map(type, values))
+    allowed = {float, int, NoneType} if nullable else {float, int}
+    if not types <= allowed:
+        # the scalar hooks know how to read strings, bools, decimals, ...
+        hook = float_structure_nullable if nullable else float_structure
+        return np.array(_scalar(values, hook), dtype=np.float64)
+
+    try:
+        # `None` becomes nan
+        arr = np.array(values, dtype=np.float64)
+    except OverflowError:
+        # ints too big for a float
+        hook = float_structure_nullable if nullable else float_structure
+        return np.array(_scalar(values, hook), dtype=np.float64)
+
+    bad = ~np.isfinite(arr)
+    if NoneType in types:
+        bad &= ~_nulls(values)
+    if bad.any():
+        raise _invalid(np.flatnonzero(bad).tolist())
+    return arr
+
+
+def integer_array(values: Sequence[Any], nullable: bool = False) -> np.ndarray:
+    """the column as an int64 array, a masked array (nulls masked) if `nullable`.
+
+    values that don't fit in 64 bits are invalid, the indices of the invalid values
+    are named in the `ValueError` raised.
+    """
+    types = set(map(type, values))
+    allowed = {int, NoneType} if nullable else {int}
+    if not types <= allowed:
+        hook = integer_structure_nullable if nullable else integer_structure
+        values = _scalar(values, hook)
+        types = set(map(type, values))
+
+    nulls = _nulls(values) if NoneType in types else None
+    try:
+        if nulls is None:
+            arr = np.array(values, dtype=np.int64)
+        else:
+            obj = np.array(values, dtype=object)
+            obj[nulls] = 0
+            arr = obj.astype(np.int64)
+    except OverflowError:
+        raise _invalid(
+            [i for i, v in enumerate(values) if v is not None and not INT64_MIN <= v <= INT64_MAX]
+        ) from None
+
+    if nullable:
+        return np.ma.masked_array(arr, mask=nulls if nulls is not None else False)
+    return arr
@@ -0,0 +1,228 @@
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache
+from operator import attrgetter, call
+from typing import TYPE_CHECKING, Any
+
+from attrs import NOTHING, fields
+
+from cattrs.errors import (
+    AttributeValidationNote,
+    ClassValidationError,
+    StructureHandlerNotFoundError,
+)
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+
+from django_cattrs_fields.utils.relations import relation_fields
+
+if TYPE_CHECKING:
+    from cattrs.converters import Converter
+
+# `.values()` and `model_to_dict` build a dict per row before cattrs even looks at it,
+# for big result sets that's a lot of garbage.
+# the functions here read positional rows (`values_list`, raw cursors) instead,
+# the column positions are worked out once per result set, not once per row.
+
+__all__ = (
+    "attribute_structure_hook",
+    "cursor_columns",
+    "make_row_structure_fn",
+    "make_row_unstructure_fn",
+    "structure_table",
+    "structure_rows",
+    "structure_values_list",
+    "unstructure_rows",
+    "unstructure_table",
+)
+
+
+def attribute_structure_hook(a: Any, converter: "Converter") -> Callable[[Any, Any], Any] | None:
+    """the hook structuring the attrs attribute `a`, like the ones cattrs generates use.
+
+    `None` when the attribute's own attrs converter takes the value as it is.
+    """
+    if a.type is None:
+        # untyped fields are dispatched on their value
+        return converter.structure
+    try:
+        return converter.get_structure_hook(a.type)
+    except StructureHandlerNotFoundError:
+        if a.converter is not None:
+            return None
+        raise
+    except RecursionError:
+        # a class referring to itself, looked up when it's used
+        return converter.structure
+
+
+def make_row_structure_fn(
+    cls: Any, columns: Sequence[str], converter: "Converter"
+) -> Callable[[Sequence[Any]], Any]:
+    """make a function that structures one positional row into `cls`.
+
+    `columns` holds the field name of each position in the row, columns not in `cls` are ignored.
+    fields of `cls` without a column must have a default.
+    """
+    positions = {name: i for i, name in enumerate(columns)}
+    plan = []
+    for a in fields(cls):
+        if not a.init:
+            continue
+        if a.name not in positions:
+            if a.default is NOTHING:
+                raise ValueError(f"no column for the required field {a.name!r} of {cls.__name__}")
+            continue
+
+        handler = attribute_structure_hook(a, converter)
+        plan.append((a.name, a.alias, positions[a.name], handler, a.type))
+
+    if not converter.detailed_validation:
+
+        def structure(row: Sequence[Any]) -> Any:
+            return cls(
+                **{
+                    alias: row[i] if handler is None else handler(row[i], t)
+                    for _, alias, i, handler, t in plan
+                }
+            )
+
+        return structure
+
+    note = f"Structuring class {cls.__qualname__} @ attribute "
+
+    def structure_detailed(row: Sequence[Any]) -> Any:
+        kwargs = {}
+        errors = []
+        for name, alias, i, handler, t in plan:
+            try:
+                kwargs[alias] = row[i] if handler is None else handler(row[i], t)
+            except Exception as e:
+                e.__notes__ = [
+                    *getattr(e, "__notes__", []),
+                    AttributeValidationNote(note + name, name, t),
+                ]
+                errors.append(e)
+        if errors:
+            raise ClassValidationError(f"While structuring {cls.__name__}", errors, cls)
+        return cls(**kwargs)
+
+    return structure_detailed
+
+
+def make_row_unstructure_fn(
+    cls: Any, converter: "Converter", columns: Sequence[str] | None = None
+) -> Callable[[Any], tuple[Any, ...]]:
+    """make a function that unstructures an instance of `cls` into a positional row.
+
+    `columns` holds the field name of each position, all the fields of `cls` by default.
+    """
+    if columns is None:
+        columns = [a.name for a in fields(cls)]
+    if not columns:
+        raise ValueError("no columns to unstructure")
+    attributes = {a.name: a for a in fields(cls)}
+    hooks = []
+    for name in columns:
+        a = attributes.get(name)
+        if a is None:
+            raise ValueError(f"{cls.__name__} has no field {name!r}")
+        # untyped fields are dispatched on their value, like cattrs does
+        hooks.append(
+            converter.get_unstructure_hook(a.type) if a.type is not None else converter.unstructure
+        )
+
+    get = attrgetter(*columns)
+    if len(columns) == 1:
+        (hook,) = hooks
+        return lambda obj: (hook(get(obj)),)
+
+    def unstructure(obj: Any) -> tuple[Any, ...]:
+        return tuple(map(call, hooks, get(obj)))
+
+    return unstructure
+
+
+def structure_rows(
+    rows: Iterable[Sequence[Any]], cls: Any, columns: Sequence[str], converter: "Converter"
+) -> list[Any]:
+    """structure positional rows, like the ones `values_list` or a db cursor return."""
+    structure = make_row_structure_fn(cls, columns, converter)
+    return [structure(row) for row in rows]
+
+
+def cursor_columns(cursor) -> list[str]:
+    """column names of the last query run on a db cursor."""
+    return [col[0] for col in cursor.description]
+
+
+def structure_values_list(queryset: QuerySet, cls: Any, converter: "Converter") -> list[Any]:
+    """structure `queryset` without creating model objects or per row dicts.
+
+    the columns are the fields of `cls` found on the model (or in the queryset's annotations),
+    nested classes are skipped, since they can't come out of a single row.
+
+    note that these are raw column values,
+    e.g. a `FileField` gives the file name, not a `FieldFile`.
+    """
+    model = queryset.model
+    annotations = queryset.query.annotations
+    relations = relation_fields(cls)
+    columns = []
+    for a in fields(cls):
+        if not a.init or a.name in relations:
+            continue
+        if a.name not in annotations:
+            try:
+                model._meta.get_field(a.name)
+            except FieldDoesNotExist:
+                continue
+        columns.append(a.name)
+
+    return structure_rows(queryset.values_list(*columns), cls, columns, converter)
+
+
+# Tables
+# a list of dicts repeats every key in every row, a table gives the keys once:
+# `{"fields": ["name", "age"], "rows": [["bob", 25], ...]}`
+
+
+# columns can come from clients, so the number of row functions kept is bounded
+ROW_FN_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=ROW_FN_CACHE_SIZE)
+def _row_unstructure_fn(
+    cls: Any, converter: "Converter", columns: tuple[str, ...] | None
+) -> Callable[[Any], tuple[Any, ...]]:
+    return make_row_unstructure_fn(cls, converter, columns)
+
+
+def unstructure_rows(
+    objs: Iterable[Any], cls: Any, converter: "Converter", columns: Sequence[str] | None = None
+) -> list[tuple[Any, ...]]:
+    """unstructure `objs` (instances of `cls`) into positional rows, in the order of `columns`.
+
+    the row function is made once per class, converter and columns
+    (the last `ROW_FN_CACHE_SIZE` of them are kept).
+    """
+    unstructure = _row_unstructure_fn(cls, converter, None if columns is None else tuple(columns))
+    return list(map(unstructure, objs))
+
+
+def unstructure_table(
+    objs: Iterable[Any], cls: Any, converter: "Converter", columns: Sequence[str] | None = None
+) -> dict[str, list[Any]]:
+    """unstructure `objs` into a `{"fields": [...], "rows": [[...], ...]}` table."""
+    if columns is None:
+        columns = [a.name for a in fields(cls)]
+    return {"fields": list(columns), "rows": unstructure_rows(objs, cls, converter, columns)}
+
+
+def structure_table(data: Mapping[str, Any], cls: Any, converter: "Converter") -> list[Any]:
+    """structure a table made by `unstructure_table` into a list of `cls`."""
+    try:
+        columns, rows = data["fields"], data["rows"]
+    except (KeyError, TypeError):
+        raise ValueError("a table needs `fields` and `rows`") from None
+    return structure_rows(rows, cls, columns, converter)
@@ -0,0 +1,108 @@
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from attrs import fields
+
+from cattrs._compat import is_annotated
+
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.utils.translation import gettext_lazy as _
+
+from django_cattrs_fields.fields import Params
+from django_cattrs_fields.fields.files import FileField
+from django_cattrs_fields.utils.files import MAGIC_HEAD_SIZE, matches_magic
+
+
+@cache
+def file_params(cls: Any) -> dict[str, Params]:
+    """map the name of each `Annotated[FileField, Params(...)]` field of `cls` to its params."""
+    params = {}
+    for a in fields(cls):
+        tp = a.type
+        if get_origin(tp) in (Union, UnionType):
+            args = [arg for arg in get_args(tp) if arg is not NoneType]
+            tp = args[0] if len(args) == 1 else None
+        if is_annotated(tp) and get_args(tp)[0] in (FileField, Union[FileField, None]):
+            param = next((arg for arg in get_args(tp)[1:] if isinstance(arg, Params)), None)
+            if param is not None:
+                params[a.name] = param
+    return params
+
+
+class ParamsUploadHandler(FileUploadHandler):
+    """checks uploads against the FileField params (`file_max_size`, `file_content_types`)
+    of an attrs class while they are being received.
+
+    as soon as a check fails the upload is stopped, the rest of the request isn't read
+    and the failure is recorded in `errors`, by field name.
+
+    this handler doesn't store anything, it must come before the handlers that do:
+
+        handler = ParamsUploadHandler(request, MyData)
+        request.upload_handlers.insert(0, handler)
+    """
+
+    def __init__(self, request=None, cls: Any = None):
+        super().__init__(request)
+        self.params = file_params(cls) if cls is not None else {}
+        self.errors: dict[str, str] = {}
+        self.current_params: Params | None = None
+        self.received = 0
+        self.head = b""
+
+    def reject(self, message: str):
+        self.errors[self.field_name] = message
+        raise StopUpload(connection_reset=True)
+
+    def new_file(self, field_name, file_name, content_type, content_length, *args, **kwargs):
+        super().new_file(field_name, file_name, content_type, content_length, *args, **kwargs)
+        self.current_params = params = self.params.get(field_name)
+        self.received = 0
+        self.head = b""
+        if params is None:
+            return
+
+        if params.file_content_types is not None and content_type not in params.file_content_types:
+            self.reject(_("File type “%(type)s” is not allowed.") % {"type": content_type})
+        if (
+            params.file_max_size is not None
+            and content_length is not None
+            and content_length > params.file_max_size
+        ):
+            self.reject(_("File is larger than %(max)s bytes.") % {"max": params.file_max_size})
+
+    def receive_data_chunk(self, raw_data, start):
+        params = self.current_params
+        if params is None:
+            return raw_data
+
+        self.received += len(raw_data)
+        if params.file_max_size is not None and self.received > params.file_max_size:
+            self.reject(_("File is larger than %(max)s bytes.") % {"max": params.file_max_size})
+
+        if params.file_content_types is not None and len(self.head) < MAGIC_HEAD_SIZE:
+            self.head += raw_data[: MAGIC_HEAD_SIZE - len(self.head)]
+            if len(self.head) == MAGIC_HEAD_SIZE:
+                self.check_magic()
+
+        return raw_data
+
+    def check_magic(self):
+        if not matches_magic(self.content_type, self.head):
+            self.reject(
+                _("File content doesn't match its type “%(type)s”.") % {"type": self.content_type}
+            )
+
+    def file_complete(self, file_size):
+        params = self.current_params
+        if (
+            params is not None
+            and params.file_content_types is not None
+            and len(self.head) < MAGIC_HEAD_SIZE
+        ):
+            # files smaller than the magic head haven't been checked yet
+            self.check_magic()
+        self.current_params = None
+        # let the next handler create the file
+        return None
@@ -0,0 +1,220 @@
+import hashlib
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Collection
+from typing import Any, Protocol
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.db.models.fields.files import FieldFile
+from django.utils.translation import gettext_lazy as _
+
+
+class URLCache(Protocol):
+    """anything that can be used as a file url cache, see `set_file_url_cache`."""
+
+    def get(self, storage: Any, name: str) -> str | None: ...
+
+    def set(self, storage: Any, name: str, url: str) -> None: ...
+
+
+class FileURLCache:
+    """a bounded, thread safe LRU cache for file urls, keyed by (storage, name).
+
+    entries older than `ttl` seconds are dropped, keep this lower than the expiry time
+    of signed urls if your storage uses them.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[tuple[Any, str], tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, storage: Any, name: str) -> str | None:
+        key = (storage, name)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, url = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return url
+
+    def set(self, storage: Any, name: str, url: str) -> None:
+        key = (storage, name)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, url)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+file_url_cache: URLCache | None = None
+
+if getattr(settings, "DCF_FILE_URL_CACHE", False):
+    file_url_cache = FileURLCache(
+        maxsize=getattr(settings, "DCF_FILE_URL_CACHE_SIZE", 1024),
+        ttl=getattr(settings, "DCF_FILE_URL_CACHE_TTL", 300.0),
+    )
+
+
+def set_file_url_cache(cache: URLCache | None) -> None:
+    """replace the file url cache, `None` disables caching."""
+    global file_url_cache
+    file_url_cache = cache
+
+
+def file_url(file: FieldFile) -> str:
+    """`file.url`, served from the file url cache when there is one."""
+    cache = file_url_cache
+    if cache is None:
+        return file.url
+
+    url = cache.get(file.storage, file.name)
+    if url is None:
+        url = file.url
+        cache.set(file.storage, file.name, url)
+    return url
+
+
+class LazyFileURL:
+    """the url of a `FieldFile`, only worked out the first time it's used.
+
+    it compares equal to the url string, call `str()` on it to get the actual url.
+    """
+
+    __slots__ = ("_file", "_url")
+
+    def __init__(self, file: FieldFile):
+        self._file = file
+        self._url: str | None = None
+
+    @property
+    def resolved(self) -> bool:
+        return self._url is not None
+
+    def __str__(self) -> str:
+        if self._url is None:
+            self._url = file_url(self._file)
+        return self._url
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyFileURL):
+            other = str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        if self._url is None:
+            return f"LazyFileURL({self._file.name!r})"
+        return f"LazyFileURL({self._url!r})"
+
+
+# leading bytes of some common file types, used to check a file is what its content type claims
+MAGIC_NUMBERS: dict[str, tuple[bytes, ...]] = {
+    "application/gzip": (b"\x1f\x8b",),
+    "application/pdf": (b"%PDF-",),
+    "application/zip": (b"PK\x03\x04", b"PK\x05\x06"),
+    "image/gif": (b"GIF87a", b"GIF89a"),
+    "image/jpeg": (b"\xff\xd8\xff",),
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/webp": (b"RIFF",),
+}
+
+# enough to hold any of the magic numbers above
+MAGIC_HEAD_SIZE = 16
+
+
+def matches_magic(content_type: str, head: bytes) -> bool:
+    """check the leading bytes of a file against its content type,
+    content types we don't know the magic number of always match.
+    """
+    magic = MAGIC_NUMBERS.get(content_type)
+    if magic is None:
+        return True
+    if content_type == "image/webp":
+        return head.startswith(magic) and head[8:12] == b"WEBP"
+    return head.startswith(magic)
+
+
+def validate_upload(
+    file: UploadedFile,
+    max_size: int | None = None,
+    content_types: Collection[str] | None = None,
+    hash_name: str | None = None,
+) -> None:
+    """validate an uploaded file, reading it at most once.
+
+    the file is streamed chunk by chunk (or memory mapped, for files on disk),
+    so it's never loaded into memory as a whole.
+    """
+    if max_size is not None and file.size is not None and file.size > max_size:
+        raise ValueError(_("File is larger than %(max)s bytes.") % {"max": max_size})
+
+    if content_types is not None and file.content_type not in content_types:
+        raise ValueError(_("File type “%(type)s” is not allowed.") % {"type": file.content_type})
+
+    if hash_name is None and content_types is None and file.size is not None:
+        # nothing left that needs the content
+        return
+
+    hasher = hashlib.new(hash_name) if hash_name is not None else None
+
+    if hasher is None and file.size is not None:
+        # only the leading bytes are needed
+        file.seek(0)
+        head = file.read(MAGIC_HEAD_SIZE)
+        file.seek(0)
+        size = file.size
+    elif isinstance(file, TemporaryUploadedFile):
+        file.file.flush()
+        fileno = file.file.fileno()
+        size = os.fstat(fileno).st_size
+        if size:
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as buffer:
+                head = buffer[:MAGIC_HEAD_SIZE]
+                if hasher is not None:
+                    hasher.update(buffer)
+        else:
+            head = b""
+    else:
+        head = b""
+        size = 0
+        for chunk in file.chunks():
+            if len(head) < MAGIC_HEAD_SIZE:
+                head += chunk[: MAGIC_HEAD_SIZE - len(head)]
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise ValueError(_("File is larger than %(max)s bytes.") % {"max": max_size})
+            if hasher is not None:
+                hasher.update(chunk)
+        file.seek(0)
+
+    if max_size is not None and size > max_size:
+        raise ValueError(_("File is larger than %(max)s bytes.") % {"max": max_size})
+
+    if content_types is not None and not matches_magic(file.content_type, head):
+        raise ValueError(
+            _("File content doesn't match its type “%(type)s”.") % {"type": file.content_type}
+        )
+
+    if hasher is not None:
+        file.checksum = hasher.hexdigest()  # type: ignore[attr-defined]
@@ -0,0 +1,26 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cattrs.converters import Converter
+
+__all__ = ("is_default_unstructure_hook",)
+
+
+def _code(hook: Any) -> tuple[Any, ...] | None:
+    code = getattr(hook, "__code__", None)
+    return None if code is None else (code.co_code, code.co_consts, code.co_names)
+
+
+def is_default_unstructure_hook(hook: Any, cls: Any, converter: "Converter") -> bool:
+    """whether `hook` is the dict hook the converter makes for the attrs class `cls` by itself.
+
+    the converter's own hook is made again and compared to `hook`, hooks registered for `cls`
+    (or made with overrides, a different `omit_if_default`, ...) aren't the default one.
+    """
+    make_default = getattr(converter, "gen_unstructure_attrs_fromdict", None)
+    # cattrs puts the overrides of the hooks it generates on them
+    overrides = getattr(hook, "overrides", None)
+    if make_default is None or overrides is None:
+        return False
+    default = make_default(cls)
+    return overrides == default.overrides and _code(hook) == _code(default)
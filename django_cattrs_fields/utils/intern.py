@@ -0,0 +1,68 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+# structuring gives every value its own string object, even when thousands of rows hold the same
+# status code or category. interning keeps one object per distinct value instead.
+# `Params(intern="batch")` shares strings within an `interning()` block (and `structure_batch`),
+# `Params(intern="global")` shares them process wide, through a bounded table.
+
+__all__ = ("INTERN_POLICIES", "InternTable", "global_table", "intern_string", "interning")
+
+INTERN_POLICIES = ("batch", "global")
+
+
+class InternTable:
+    """a bounded table of strings, once it's full new strings are no longer added,
+    the ones already in it are still shared.
+    """
+
+    __slots__ = ("_strings", "maxsize")
+
+    def __init__(self, maxsize: int | None = None):
+        self._strings: dict[str, str] = {}
+        self.maxsize = maxsize
+
+    def intern(self, val: str) -> str:
+        strings = self._strings
+        if self.maxsize is None or len(strings) < self.maxsize:
+            return strings.setdefault(val, val)
+        return strings.get(val, val)
+
+    def clear(self) -> None:
+        self._strings.clear()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+global_table = InternTable(getattr(settings, "DCF_INTERN_TABLE_SIZE", 10_000))
+
+_batch_table: ContextVar[InternTable | None] = ContextVar("batch_table", default=None)
+
+
+@contextmanager
+def interning() -> Iterator[InternTable]:
+    """share the strings of `Params(intern="batch")` fields structured within this block."""
+    table = _batch_table.get()
+    if table is not None:
+        # already in a batch
+        yield table
+        return
+
+    table = InternTable()
+    token = _batch_table.set(table)
+    try:
+        yield table
+    finally:
+        _batch_table.reset(token)
+
+
+def intern_string(val: str, policy: str) -> str:
+    if policy == "global":
+        return global_table.intern(val)
+    table = _batch_table.get()
+    # outside of a batch there's nothing to share with
+    return val if table is None else table.intern(val)
@@ -0,0 +1,132 @@
+import weakref
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from attrs import NOTHING, Factory, fields, has
+
+from django_cattrs_fields.fields import Empty
+from django_cattrs_fields.utils.hooks import is_default_unstructure_hook
+
+if TYPE_CHECKING:
+    from cattrs.converters import Converter
+
+# `converter.unstructure` runs the hook of every field up front,
+# `UnstructuredView` runs them one at a time, the first time a key is read.
+# that's only done for classes unstructured by cattrs' own dict hook (or `skip_empty`),
+# the view can't know what any other class hook does, so it's run up front.
+
+__all__ = ("UnstructuredView", "unstructure_lazy")
+
+# the plan of each class hook, a hook registered later is a new key.
+# plans don't hold the converter (the field hooks are looked up when they run),
+# so a converter isn't kept alive by its hooks being in here.
+_plans: "weakref.WeakKeyDictionary[Any, tuple[dict[str, Any], bool] | None]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _make_plan(cls: Any, hook: Any, converter: "Converter") -> tuple[dict[str, Any], bool] | None:
+    skips_empty = getattr(hook, "skips_empty", False)
+    if not skips_empty and not is_default_unstructure_hook(hook, cls, converter):
+        return None
+
+    use_alias = getattr(converter, "use_alias", False)
+    return {(a.alias if use_alias else a.name): a for a in fields(cls)}, skips_empty
+
+
+def _view_plan(cls: Any, converter: "Converter") -> tuple[dict[str, Any], bool] | None:
+    """the fields of the view and whether `Empty` values are skipped,
+    `None` if the class hook has to run as a whole.
+    """
+    hook = converter.get_unstructure_hook(cls)
+    try:
+        return _plans[hook]
+    except KeyError:
+        plan = _plans[hook] = _make_plan(cls, hook, converter)
+        return plan
+    except TypeError:
+        # hooks that can't be weakly referenced
+        return _make_plan(cls, hook, converter)
+
+
+def _is_default(a: Any, value: Any) -> bool:
+    if a.default is NOTHING:
+        return False
+    if isinstance(a.default, Factory):
+        # factories taking self can't be compared without the instance, cattrs skips them too
+        return not a.default.takes_self and value == a.default.factory()
+    return value == a.default
+
+
+class UnstructuredView(Mapping):
+    """a read-only mapping of what `converter.unstructure(obj)` would return.
+
+    the unstructure hook of a field runs the first time its key is read, then its result is kept.
+    it can be used where a dict is read (`Model(**view)`, templates, `dict(view)`),
+    encoders that only accept dicts (e.g: json) need `dict(view)`.
+    """
+
+    __slots__ = ("_obj", "_converter", "_keys", "_values")
+
+    def __init__(self, obj: Any, converter: "Converter", unstructure_as: Any = None):
+        cls = unstructure_as or obj.__class__
+        self._obj = obj
+        self._converter = converter
+        self._values: dict[str, Any] = {}
+        plan = _view_plan(cls, converter)
+        if plan is None:
+            self._values = converter.get_unstructure_hook(cls)(obj)
+            self._keys = dict.fromkeys(self._values)
+            return
+
+        self._keys, skips_empty = plan
+        if skips_empty:
+            # `skip_empty` doesn't omit defaults, the hooks of empty fields give back `Empty`
+            self._keys = {
+                key: a for key, a in self._keys.items() if getattr(obj, a.name) is not Empty
+            }
+        elif converter.omit_if_default:
+            self._keys = {
+                key: a for key, a in self._keys.items() if not _is_default(a, getattr(obj, a.name))
+            }
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        a = self._keys[key]
+        if a.type is None:
+            # untyped fields are dispatched on their value, like cattrs does
+            value = self._converter.unstructure(getattr(self._obj, a.name))
+        else:
+            value = self._converter.get_unstructure_hook(a.type)(getattr(self._obj, a.name))
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __repr__(self) -> str:
+        return f"UnstructuredView({self._obj.__class__.__name__}, {sorted(self._values)})"
+
+
+def unstructure_lazy(obj: Any, converter: "Converter", unstructure_as: Any = None) -> Any:
+    """like `converter.unstructure`, but attrs instances become an `UnstructuredView`.
+
+    lists of attrs instances become lists of views,
+    classes with their own unstructure hook are unstructured as usual.
+    """
+    if isinstance(obj, (list, tuple)):
+        return [unstructure_lazy(item, converter) for item in obj]
+    cls = unstructure_as or obj.__class__
+    if has(cls) and _view_plan(cls, converter) is not None:
+        return UnstructuredView(obj, converter, unstructure_as)
+    return converter.unstructure(obj, unstructure_as=unstructure_as)
@@ -0,0 +1,156 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from attrs import fields, has
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Manager, Model, QuerySet, prefetch_related_objects
+from django.forms.models import model_to_dict
+
+
+def nested_attrs_type(tp: Any) -> tuple[Any, bool] | None:
+    """unwrap `Cls`, `Cls | None` and `list[Cls]` annotations.
+
+    returns a `(Cls, many)` tuple, or `None` if the annotation isn't a nested attrs class.
+    """
+    if get_origin(tp) in (Union, UnionType):
+        args = [arg for arg in get_args(tp) if arg is not NoneType]
+        if len(args) != 1:
+            return None
+        tp = args[0]
+
+    if has(tp):
+        return tp, False
+    if get_origin(tp) is list and has(get_args(tp)[0]):
+        return get_args(tp)[0], True
+    return None
+
+
+@cache
+def relation_fields(cls: Any) -> tuple[str, ...]:
+    """names of the fields of `cls` that hold nested attrs classes."""
+    return tuple(a.name for a in fields(cls) if nested_attrs_type(a.type) is not None)
+
+
+@cache
+def model_relations(model: type[Model]) -> dict[str, Any]:
+    """map the attribute name of each relation on `model` to its field.
+
+    reverse relations are keyed by their accessor name (`related_name` or `<model>_set`).
+    """
+    relations = {}
+    for field in model._meta.get_fields():
+        if not field.is_relation or field.related_model is None:
+            continue
+        if field.auto_created and not field.concrete:
+            relations[field.get_accessor_name()] = field
+        else:
+            relations[field.name] = field
+    return relations
+
+
+def _walk(cls, model, prefix, select, prefetch, in_prefetch):
+    relations = model_relations(model)
+    for name in relation_fields(cls):
+        field = relations.get(name)
+        if field is None:
+            continue
+
+        target, many = nested_attrs_type(getattr(fields(cls), name).type)
+        path = f"{prefix}{name}"
+
+        if many and (field.one_to_many or field.many_to_many):
+            prefetch.append(path)
+            _walk(target, field.related_model, f"{path}__", select, prefetch, True)
+        elif not many and (field.many_to_one or field.one_to_one):
+            # anything reached through a prefetch has to be prefetched as well
+            (prefetch if in_prefetch else select).append(path)
+            _walk(target, field.related_model, f"{path}__", select, prefetch, in_prefetch)
+
+
+@cache
+def related_lookups(cls: Any, model: type[Model]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """work out the `select_related` and `prefetch_related` lookups needed
+    to structure `model` objects into `cls` without hitting the database per row.
+
+    returns a `(select_related, prefetch_related)` tuple.
+    """
+    select: list[str] = []
+    prefetch: list[str] = []
+    _walk(cls, model, "", select, prefetch, False)
+    return tuple(select), tuple(prefetch)
+
+
+def apply_related_lookups(queryset: QuerySet, cls: Any) -> QuerySet:
+    """add the lookups from `related_lookups` to `queryset`.
+
+    `values()` and `values_list()` querysets don't yield model objects and are returned untouched.
+    """
+    if queryset.query.values_select:
+        return queryset
+
+    select, prefetch = related_lookups(cls, queryset.model)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+# set while the objects of a list are structured, their relations are fetched already
+_related_fetched: ContextVar[bool] = ContextVar("related_fetched", default=False)
+
+
+@contextmanager
+def related_fetched() -> Iterator[None]:
+    """skip `prefetch_related` until the end of this block,
+    the objects structured in it were fetched along with everything their classes need.
+    """
+    token = _related_fetched.set(True)
+    try:
+        yield
+    finally:
+        _related_fetched.reset(token)
+
+
+def prefetch_related(objs: list[Any], cls: Any) -> None:
+    """fetch the related objects `cls` needs for the model objects in `objs`, in one go.
+
+    relations that are already fetched (e.g. by `apply_related_lookups`) aren't fetched again,
+    inside a `related_fetched` block nothing is fetched.
+    """
+    if _related_fetched.get():
+        return
+    instances = [obj for obj in objs if isinstance(obj, Model)]
+    if not instances:
+        return
+    select, prefetch = related_lookups(cls, type(instances[0]))
+    if select or prefetch:
+        prefetch_related_objects(instances, *select, *prefetch)
+
+
+def model_to_dict_related(instance: Model, relations: tuple[str, ...]) -> dict[str, Any]:
+    """`model_to_dict`, but related objects named in `relations` are kept as objects
+    (or lists of them for to-many relations), so they can be structured into nested classes.
+    """
+    # names that aren't relations of the model are left to `model_to_dict`
+    model_relation_names = model_relations(type(instance))
+    relations = tuple(name for name in relations if name in model_relation_names)
+
+    data = model_to_dict(instance, exclude=relations)
+    for name in relations:
+        try:
+            value = getattr(instance, name)
+        except ObjectDoesNotExist:
+            # a missing reverse one-to-one
+            value = None
+
+        if isinstance(value, Manager):
+            # a list, so prefetched objects are used as they are
+            value = list(value.all())
+        data[name] = value
+    return data
@@ -8,3 +8,27 @@ class Book(models.Model):  # noqa: DJ008
 class Human(models.Model):  # noqa: DJ008
     name = models.CharField()
     age = models.IntegerField()
+
+
+class Publisher(models.Model):  # noqa: DJ008
+    name = models.CharField()
+
+
+class Author(models.Model):  # noqa: DJ008
+    name = models.CharField()
+    publisher = models.ForeignKey(Publisher, on_delete=models.CASCADE, null=True)
+
+
+class Tag(models.Model):  # noqa: DJ008
+    name = models.CharField()
+
+
+class Novel(models.Model):  # noqa: DJ008
+    title = models.CharField()
+    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name="novels")
+    tags = models.ManyToManyField(Tag)
+
+
+class Chapter(models.Model):  # noqa: DJ008
+    title = models.CharField()
+    novel = models.ForeignKey(Novel, on_delete=models.CASCADE, related_name="chapters")
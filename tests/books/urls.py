@@ -1,6 +1,9 @@
 from django.urls import path
 
-from tests.books.views import view
+from tests.books.views import upload_view, view
 
 
-urlpatterns = [path(route="", view=view, name="simple-view")]
+urlpatterns = [
+    path(route="", view=view, name="simple-view"),
+    path(route="upload/", view=upload_view, name="upload-view"),
+]
@@ -1,3 +1,5 @@
+from typing import Annotated
+
 from django.core.files.uploadedfile import UploadedFile
 from django.http import HttpResponseBadRequest, HttpResponseBase
 from django.http.request import HttpRequest
@@ -7,7 +9,9 @@ import attrs
 
 from django_cattrs_fields.converters import converter
 from django_cattrs_fields.converters.json import serializer as json_serializer
+from django_cattrs_fields.fields import Params
 from django_cattrs_fields.fields.files import FileField
+from django_cattrs_fields.uploadhandler import ParamsUploadHandler
 
 from .models import Book
 
@@ -17,6 +21,11 @@ class BookData:
     pdf: FileField
 
 
+@attrs.define
+class ImageData:
+    image: Annotated[FileField, Params(file_max_size=1024, file_content_types=("image/png",))]
+
+
 def view(request: HttpRequest) -> HttpResponseBase:
     if request.method == "POST":
         exp = None
@@ -46,3 +55,20 @@ def view(request: HttpRequest) -> HttpResponseBase:
     else:
         data = None
     return HttpResponse(data)
+
+
+def upload_view(request: HttpRequest) -> HttpResponseBase:
+    handler = ParamsUploadHandler(request, ImageData)
+    request.upload_handlers.insert(0, handler)
+
+    exp = None
+    try:
+        converter.structure({**request.POST.dict(), **request.FILES.dict()}, ImageData)
+    except* (ValueError, KeyError) as e:
+        exp = e
+
+    if handler.errors:
+        return HttpResponseBadRequest(handler.errors["image"])
+    if exp:
+        return HttpResponseBadRequest("invalid")
+    return HttpResponse("done")
@@ -1,3 +1,5 @@
+import tempfile
+
 SECRET_KEY = "django_tests_secret_key"  # noqa: S105
 PASSWORD_HASHERS = ("django.contrib.auth.hashers.MD5PasswordHasher",)
 
@@ -24,4 +26,8 @@ DATABASES = {
 }
 
 ROOT_URLCONF = "tests.conf.urls"
+
+# files saved by the tests go to a temporary directory, not the repository
+MEDIA_ROOT = tempfile.mkdtemp(prefix="dcf_media_")
+
 DCF_EMPTY_HOOKS = False
@@ -0,0 +1,162 @@
+import datetime
+import uuid
+from decimal import Decimal
+from typing import Annotated
+
+import pytest
+
+from attrs import define
+
+from django_cattrs_fields.fields import (
+    BooleanField,
+    CharField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    EmailField,
+    FloatField,
+    IntegerField,
+    Params,
+    TimeField,
+    UUIDField,
+)
+from django_cattrs_fields.fields.files import FileField
+
+pa = pytest.importorskip("pyarrow")
+
+from django_cattrs_fields.converters.arrow import (  # noqa: E402
+    from_table,
+    read_ipc,
+    read_parquet,
+    schema_for,
+    serializer,
+    to_batches,
+    to_table,
+    write_ipc,
+    write_parquet,
+)
+
+
+@define
+class Reading:
+    id: UUIDField
+    sensor: CharField
+    owner: EmailField
+    active: BooleanField
+    count: IntegerField
+    value: FloatField
+    price: Annotated[DecimalField, Params(decimal_max_digits=10, decimal_places=2)]
+    rate: DecimalField
+    day: DateField
+    at: DateTimeField
+    time: TimeField
+    note: CharField | None = None
+    total: IntegerField | None = None
+
+
+@define
+class WithFile:
+    file: FileField
+
+
+def readings(n):
+    return [
+        Reading(
+            id=uuid.uuid4(),
+            sensor=f"s{i}",
+            owner="a@example.com",
+            active=bool(i % 2),
+            count=i,
+            value=i / 3,
+            price=Decimal("12.50"),
+            rate=Decimal("0.125"),
+            day=datetime.date(2024, 1, 2),
+            at=datetime.datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=datetime.UTC),
+            time=datetime.time(3, 4, 5),
+            note=None if i % 2 else "note",
+            total=None if i % 3 else i,
+        )
+        for i in range(n)
+    ]
+
+
+def test_schema():
+    schema = schema_for(Reading)
+
+    assert schema.field("id").type == pa.binary(16)
+    assert schema.field("price").type == pa.decimal128(10, 2)
+    assert schema.field("rate").type == pa.string()
+    assert schema.field("at").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("note").nullable
+    assert not schema.field("sensor").nullable
+
+
+def test_schema_unsupported():
+    with pytest.raises(TypeError):
+        schema_for(WithFile)
+
+
+def test_table_round_trip():
+    data = readings(10)
+
+    table = to_table(data, Reading)
+
+    assert table.num_rows == 10
+    assert from_table(table, Reading) == data
+
+
+def test_batches():
+    batches = list(to_batches(readings(10), Reading, batch_size=4))
+
+    assert [b.num_rows for b in batches] == [4, 4, 2]
+
+
+def test_naive_datetime_is_utc():
+    (reading,) = readings(1)
+    reading.at = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+    (result,) = from_table(to_table([reading], Reading), Reading)
+
+    assert result.at == datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC)
+
+
+def test_dumps_loads():
+    data = readings(5)
+
+    dump = serializer.dumps(data)
+
+    assert isinstance(dump, bytes)
+    assert serializer.loads(dump, list[Reading]) == data
+    assert serializer.loads(serializer.dumps(data[0]), Reading) == data[0]
+    assert serializer.loads(serializer.dumps([], unstructure_as=list[Reading]), list[Reading]) == []
+
+    with pytest.raises(ValueError):
+        serializer.dumps([])
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_ipc_file(tmp_path, memory_map):
+    data = readings(20)
+    path = tmp_path / "readings.arrow"
+
+    write_ipc(path, data, Reading, batch_size=8)
+
+    assert read_ipc(path, Reading, memory_map=memory_map) == data
+
+
+def test_parquet_file(tmp_path):
+    data = readings(20)
+    path = tmp_path / "readings.parquet"
+
+    write_parquet(path, data, Reading)
+
+    assert read_parquet(path, Reading) == data
+
+
+def test_validation():
+    table = to_table(readings(2), Reading).set_column(
+        1, "sensor", pa.array(["", "x"], type=pa.string())
+    )
+
+    with pytest.raises(Exception):
+        from_table(table, Reading)
@@ -0,0 +1,186 @@
+import pytest
+
+from attrs import define
+
+from cattrs.converters import Converter
+from cattrs.errors import ClassValidationError
+from cattrs import transform_error
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.converters.register_hooks import register_structure_hooks
+from django_cattrs_fields.fields import (
+    CharField,
+    DateField,
+    EmailField,
+    FloatField,
+    IntegerField,
+)
+from django_cattrs_fields.hooks.batch_hooks import (
+    DEFAULT_BATCH_HOOKS,
+    batch_hooks,
+    char_structure_batch,
+    char_structure_nullable_batch,
+    float_structure_batch,
+    float_structure_nullable_batch,
+    integer_structure_batch,
+    integer_structure_nullable_batch,
+    register_batch_hook,
+    structure_batch,
+    structure_columns,
+)
+from django_cattrs_fields.hooks.number_hooks import integer_structure
+
+
+@define
+class Reading:
+    sensor: CharField
+    value: FloatField
+    count: IntegerField
+    day: DateField
+    email: EmailField | None
+    note: CharField | None = None
+    weight: IntegerField = 1
+
+
+rows = [
+    {
+        "sensor": f"s{i}",
+        "value": i / 3,
+        "count": i,
+        "day": "2024-01-02",
+        "email": None if i % 2 else "a@example.com",
+    }
+    for i in range(50)
+]
+
+
+def test_structure_batch():
+    assert structure_batch(rows, Reading, converter) == converter.structure(rows, list[Reading])
+
+
+def test_structure_batch_converts():
+    data = [{**row, "count": str(row["count"]), "value": str(row["value"])} for row in rows]
+
+    assert structure_batch(data, Reading, converter) == converter.structure(rows, list[Reading])
+
+
+def test_structure_batch_empty():
+    assert structure_batch([], Reading, converter) == []
+
+
+def test_structure_batch_different_keys():
+    data = [rows[0], {**rows[1], "weight": 5}]
+
+    result = structure_batch(data, Reading, converter)
+
+    assert [r.weight for r in result] == [1, 5]
+
+
+def test_structure_batch_errors_match():
+    data = [rows[0], {**rows[1], "count": "many", "sensor": ""}, {**rows[2], "value": "inf"}]
+
+    with pytest.raises(ClassValidationError) as batch_info:
+        structure_batch(data, Reading, converter)
+    with pytest.raises(ClassValidationError) as info:
+        converter.structure(data, list[Reading])
+
+    assert transform_error(batch_info.value) == transform_error(info.value)
+
+
+def test_structure_columns():
+    columns = {
+        "sensor": ["a", "b"],
+        "value": [1.5, 2.5],
+        "count": [1, 2],
+        "day": ["2024-01-02", "2024-01-03"],
+        "email": [None, None],
+    }
+
+    result = structure_columns(columns, Reading, converter)
+
+    assert [(r.sensor, r.value, r.count, r.weight) for r in result] == [
+        ("a", 1.5, 1, 1),
+        ("b", 2.5, 2, 1),
+    ]
+
+
+def test_structure_columns_errors():
+    columns = {"sensor": ["a", ""], "value": [1.5, 2.5], "count": [1, 2], "day": ["x", "y"]}
+
+    with pytest.raises(ClassValidationError):
+        structure_columns(columns, Reading, converter)
+
+
+def test_custom_hook_isnt_batched():
+    conv = Converter()
+    register_structure_hooks(conv)
+    conv.register_structure_hook(IntegerField, lambda v, _: int(v) * 10)
+
+    result = structure_batch(rows[:2], Reading, conv)
+
+    assert [r.count for r in result] == [0, 10]
+
+
+def test_batch_hooks_registry():
+    assert DEFAULT_BATCH_HOOKS[integer_structure] is integer_structure_batch
+    assert batch_hooks(converter) is DEFAULT_BATCH_HOOKS
+
+
+def test_register_batch_hook():
+    conv = Converter()
+    register_structure_hooks(conv)
+
+    def double(v, _):
+        return int(v) * 2
+
+    conv.register_structure_hook(IntegerField, double)
+    register_batch_hook(conv, double, lambda values, _: [int(v) * 2 for v in values])
+
+    assert batch_hooks(conv.copy())[double] is batch_hooks(conv)[double]
+    assert double not in batch_hooks(converter)
+    assert [r.count for r in structure_batch(rows[:3], Reading, conv)] == [0, 2, 4]
+
+
+def test_batch_hook_bugs_are_raised():
+    conv = Converter()
+    register_structure_hooks(conv)
+
+    def broken(values, _):
+        raise AttributeError("a bug")
+
+    register_batch_hook(conv, integer_structure, broken)
+
+    with pytest.raises(AttributeError):
+        structure_batch(rows, Reading, conv)
+
+
+@pytest.mark.parametrize(
+    "hook, values",
+    [
+        (integer_structure_batch, [1, ""]),
+        (integer_structure_nullable_batch, [None, "x"]),
+        (float_structure_batch, [1.0, float("nan")]),
+        (float_structure_nullable_batch, [None, float("inf")]),
+        (char_structure_batch, ["a", ""]),
+        (char_structure_batch, ["a", "b\x00"]),
+        (char_structure_nullable_batch, [None, 5]),
+    ],
+)
+def test_batch_hooks_invalid(hook, values):
+    with pytest.raises(ValueError):
+        hook(values, None)
+
+
+@pytest.mark.parametrize(
+    "hook, values, expected",
+    [
+        (integer_structure_batch, [1, "2", 3.0], [1, 2, 3]),
+        (integer_structure_nullable_batch, [None, "2"], [None, 2]),
+        (float_structure_batch, [1, "2.5"], [1.0, 2.5]),
+        (float_structure_nullable_batch, [None, 2.5], [None, 2.5]),
+        (char_structure_batch, ["a", "b"], ["a", "b"]),
+        (char_structure_nullable_batch, [None, "b"], [None, "b"]),
+    ],
+)
+def test_batch_hooks(hook, values, expected):
+    assert hook(values, None) == expected
@@ -0,0 +1,119 @@
+import io
+import uuid
+from decimal import Decimal
+
+import bson
+import pytest
+
+from attrs import Factory, define
+
+from cattrs.errors import ClassValidationError
+
+from django_cattrs_fields.converters.bson import LazyDocument, serializer
+from django_cattrs_fields.fields import CharField, DecimalField, EmailField, UUIDField
+
+
+@define
+class Address:
+    city: CharField
+
+
+@define
+class Customer:
+    name: CharField
+    email: EmailField
+    uid: UUIDField
+    balance: DecimalField
+    address: Address
+    tags: list[CharField] = Factory(list)
+
+
+def make_customer(i=0):
+    return Customer(
+        name=f"bob{i}",
+        email=f"bob{i}@example.com",
+        uid=uuid.uuid4(),
+        balance=Decimal("10.5"),
+        address=Address(city="tehran"),
+        tags=["a"],
+    )
+
+
+def test_dumps_list():
+    customers = [make_customer(i) for i in range(3)]
+
+    dump = serializer.dumps(customers, unstructure_as=list[Customer])
+
+    assert bson.decode(dump) == {"items": serializer.unstructure(customers, list[Customer])}
+    assert serializer.loads(dump, list[Customer]) == customers
+
+
+def test_dumps_document():
+    customer = make_customer()
+
+    dump = serializer.dumps(customer)
+
+    assert "items" not in bson.decode(dump)
+    assert serializer.loads(dump, Customer) == customer
+
+
+def test_loads_lazy():
+    customer = make_customer()
+
+    lazy = serializer.loads_lazy(serializer.dumps(customer), Customer)
+
+    assert isinstance(lazy, LazyDocument)
+    assert lazy.name == customer.name
+    assert lazy.uid == customer.uid
+    assert lazy.address == customer.address
+    assert lazy.balance == customer.balance
+    assert lazy.structure() == customer
+
+
+def test_loads_lazy_only_accessed_fields():
+    customer = {
+        "name": "bob",
+        "email": "not an email",
+        "uid": "not a uuid",
+        "balance": "10",
+        "address": {"city": "tehran"},
+    }
+
+    lazy = serializer.loads_lazy(bson.encode(customer), Customer)
+
+    # invalid fields don't matter until they are accessed
+    assert lazy.name == "bob"
+    assert lazy.tags == []
+    with pytest.RaisesGroup(ValueError):
+        lazy.email
+    with pytest.raises(ClassValidationError):
+        lazy.structure()
+
+
+def test_loads_lazy_missing():
+    lazy = serializer.loads_lazy(bson.encode({"name": "bob"}), Customer)
+
+    with pytest.RaisesGroup(KeyError):
+        lazy.email
+    with pytest.raises(AttributeError):
+        lazy.not_a_field
+
+
+def test_loads_lazy_list():
+    customers = [make_customer(i) for i in range(3)]
+
+    lazy = serializer.loads_lazy(
+        serializer.dumps(customers, unstructure_as=list[Customer]), list[Customer]
+    )
+
+    assert [c.name for c in lazy] == ["bob0", "bob1", "bob2"]
+    assert [c.structure() for c in lazy] == customers
+
+
+def test_iter_lazy():
+    customers = [make_customer(i) for i in range(3)]
+    file = io.BytesIO(b"".join(serializer.dumps(c) for c in customers))
+
+    lazy = serializer.iter_lazy(file, Customer)
+
+    assert [c.name for c in lazy] == ["bob0", "bob1", "bob2"]
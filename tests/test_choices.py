@@ -0,0 +1,159 @@
+from typing import Annotated, Union
+
+import pytest
+
+from attrs import define
+
+from cattrs.errors import ClassValidationError
+
+from django.db import models
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.converters.json import serializer as json_serializer
+from django_cattrs_fields.fields import ChoiceField, Params
+
+
+class Status(models.TextChoices):
+    DRAFT = "draft"
+    PUBLISHED = "published"
+
+
+class Priority(models.IntegerChoices):
+    LOW = 1
+    HIGH = 2
+
+
+@define
+class Post:
+    status: Annotated[ChoiceField, Status]
+    priority: Annotated[ChoiceField, Params(choices=Priority)]
+    kind: Annotated[ChoiceField, Params(choices=[("a", "Article"), ("n", "News")])]
+    size: Annotated[ChoiceField, Params(choices=[10, 20])]
+    tag: Annotated[ChoiceField, Status] | None = None
+
+
+def data(**kwargs):
+    return {"status": "draft", "priority": 1, "kind": "a", "size": 10, **kwargs}
+
+
+def test_structure():
+    post = converter.structure(data(tag="published"), Post)
+
+    assert post.status is Status.DRAFT
+    assert post.priority is Priority.LOW
+    assert post.kind == "a"
+    assert post.size == 10
+    assert post.tag is Status.PUBLISHED
+
+
+def test_structure_members_and_strings():
+    post = converter.structure(data(status=Status.PUBLISHED, priority="2", size="20"), Post)
+
+    assert post.status is Status.PUBLISHED
+    assert post.priority is Priority.HIGH
+    assert post.size == 20
+
+
+def test_nullable():
+    assert converter.structure(data(), Post).tag is None
+    assert converter.structure(data(tag=None), Post).tag is None
+
+
+def test_inner_nullable():
+    @define
+    class Review:
+        status: Annotated[ChoiceField | None, Status]
+        priority: Annotated[ChoiceField | None, Params(choices=Priority)] = None
+
+    assert converter.structure({"status": None}, Review) == Review(status=None)
+    review = converter.structure({"status": "draft", "priority": "2"}, Review)
+    assert review == Review(status=Status.DRAFT, priority=Priority.HIGH)
+    assert converter.unstructure(review) == {"status": "draft", "priority": 2}
+    assert json_serializer.loads(json_serializer.dumps(review), Review) == review
+    with pytest.raises(ClassValidationError):
+        converter.structure({"status": "archived"}, Review)
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("status", "archived"),
+        ("priority", 3),
+        ("kind", "Article"),
+        ("size", 30),
+        ("size", [10]),
+        ("tag", "draft "),
+    ],
+)
+def test_invalid(field, value):
+    with pytest.raises(ClassValidationError) as exc_info:
+        converter.structure(data(**{field: value}), Post)
+
+    exc = exc_info.value.exceptions[0]
+    assert isinstance(exc, ValueError)
+    assert str(exc) == f"Value {value!r} is not a valid choice."
+
+
+@pytest.mark.parametrize("value", [True, False, 1.0, 2.0])
+def test_equal_values_of_other_types(value):
+    with pytest.raises(ClassValidationError):
+        converter.structure(data(priority=value), Post)
+    with pytest.raises(ClassValidationError):
+        converter.structure(data(size=10.0), Post)
+
+
+MEDIA = [
+    ("Audio", [("vinyl", "Vinyl"), ("cd", "CD")]),
+    ("Video", (("vhs", "VHS Tape"), ("dvd", "DVD"))),
+    ("unknown", "Unknown"),
+]
+
+
+@pytest.mark.parametrize("choices", [MEDIA, {"Audio": {"vinyl": "Vinyl", "cd": "CD"}}])
+def test_grouped_choices(choices):
+    @define
+    class Record:
+        media: Annotated[ChoiceField, Params(choices=choices)]
+
+    assert converter.structure({"media": "cd"}, Record).media == "cd"
+    with pytest.raises(ClassValidationError):
+        converter.structure({"media": "Audio"}, Record)
+
+
+def test_grouped_choices_values():
+    @define
+    class Record:
+        media: Annotated[ChoiceField, Params(choices=MEDIA)]
+
+    for media in ("vinyl", "vhs", "dvd", "unknown"):
+        assert converter.structure({"media": media}, Record).media == media
+
+
+@pytest.mark.parametrize("tp", [ChoiceField, ChoiceField | None, Union[ChoiceField, None]])
+def test_choices_required(tp):
+    @define
+    class NoChoices:
+        status: tp
+
+    # raised before any data is looked at
+    with pytest.raises(TypeError, match="ChoiceField needs its choices"):
+        converter.structure({"status": None}, NoChoices)
+
+
+def test_unstructure():
+    post = converter.structure(data(tag="published"), Post)
+
+    assert converter.unstructure(post) == {
+        "status": "draft",
+        "priority": 1,
+        "kind": "a",
+        "size": 10,
+        "tag": "published",
+    }
+
+
+def test_serializer_round_trip():
+    post = converter.structure(data(), Post)
+
+    dumped = json_serializer.dumps(post)
+    assert json_serializer.loads(dumped, Post) == post
@@ -0,0 +1,123 @@
+import datetime
+import json
+import uuid
+
+import msgpack
+import pytest
+
+from attrs import define
+
+from django.utils import timezone
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.converters.json import serializer as json_serializer
+from django_cattrs_fields.converters.msgpack import serializer as msgpack_serializer
+from django_cattrs_fields.converters.orjson import serializer as orjson_serializer
+from django_cattrs_fields.converters.register_hooks import register_compact_hooks
+from django_cattrs_fields.fields import DateTimeField, UUIDField
+
+UID = uuid.UUID("5c9a0a2e-8d6b-4d5e-9d4a-6b1c1ad7b6f1")
+AT = datetime.datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=datetime.UTC)
+
+
+@define
+class Event:
+    uid: UUIDField
+    at: DateTimeField
+    parent: UUIDField | None = None
+    done_at: DateTimeField | None = None
+
+
+def compact(base, **options):
+    c = base.copy()
+    register_compact_hooks(c, **options)
+    return c
+
+
+@pytest.mark.parametrize(
+    "unit, expected",
+    [("s", 1714979289), ("ms", 1714979289123), ("us", 1714979289123456)],
+)
+def test_datetime_units(unit, expected):
+    c = compact(json_serializer, datetime_unit=unit)
+
+    assert json.loads(c.dumps(Event(uid=UID, at=AT)))["at"] == expected
+
+
+@pytest.mark.parametrize(
+    "uuid_format, expected",
+    [("base64", "XJoKLo1rTV6dSmscGte28Q"), ("hex", UID.hex)],
+)
+def test_uuid_formats(uuid_format, expected):
+    c = compact(json_serializer, uuid_format=uuid_format)
+
+    assert json.loads(c.dumps(Event(uid=UID, at=AT)))["uid"] == expected
+
+
+def test_uuid_bytes():
+    c = compact(msgpack_serializer, uuid_format="bytes")
+
+    assert msgpack.unpackb(c.dumps(Event(uid=UID, at=AT)))["uid"] == UID.bytes
+
+
+@pytest.mark.parametrize("base", [json_serializer, orjson_serializer])
+def test_uuid_bytes_text_serializer(base):
+    with pytest.raises(ValueError, match="binary serializer"):
+        compact(base, uuid_format="bytes")
+
+
+def test_float_epoch():
+    c = compact(json_serializer, datetime_unit="s")
+
+    assert c.structure({"uid": UID.hex, "at": AT.timestamp()}, Event).at == AT
+    with pytest.RaisesGroup(ValueError):
+        c.structure({"uid": UID.hex, "at": float("nan")}, Event)
+
+
+@pytest.mark.parametrize("base", [json_serializer, orjson_serializer, msgpack_serializer])
+@pytest.mark.parametrize("unit", ["ms", "us"])
+@pytest.mark.parametrize("uuid_format", ["base64", "hex"])
+def test_dump_then_load(base, unit, uuid_format):
+    c = compact(base, datetime_unit=unit, uuid_format=uuid_format)
+    event = Event(uid=UID, at=AT, parent=uuid.uuid4(), done_at=timezone.now())
+
+    load = c.loads(c.dumps(event), Event)
+
+    at = AT if unit == "us" else AT.replace(microsecond=123000)
+    assert load == Event(uid=UID, at=at, parent=event.parent, done_at=load.done_at)
+    assert abs(load.done_at - event.done_at) < datetime.timedelta(milliseconds=1)
+    assert load.at.tzinfo == timezone.get_current_timezone()
+
+
+def test_smaller():
+    event = Event(uid=UID, at=AT)
+
+    assert len(compact(json_serializer).dumps(event)) < len(json_serializer.dumps(event))
+
+
+def test_loads_regular_values():
+    c = compact(json_serializer)
+
+    load = c.loads(json_serializer.dumps(Event(uid=UID, at=AT)), Event)
+
+    assert load.uid == UID
+    assert load.at == AT
+
+
+def test_nullable():
+    c = compact(json_serializer)
+
+    assert c.loads(c.dumps(Event(uid=UID, at=AT)), Event).parent is None
+
+
+def test_invalid():
+    c = compact(json_serializer)
+
+    with pytest.RaisesGroup(ValueError):
+        c.structure({"uid": "!" * 22, "at": 1}, Event)
+    with pytest.RaisesGroup(ValueError):
+        c.structure({"uid": UID.hex, "at": 10**20}, Event)
+    with pytest.raises(ValueError):
+        register_compact_hooks(converter.copy(), datetime_unit="ns")
+    with pytest.raises(ValueError):
+        register_compact_hooks(converter.copy(), uuid_format="base32")
@@ -0,0 +1,142 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from attrs import define
+
+from cattrs.errors import ClassValidationError
+
+from django.http import StreamingHttpResponse
+
+from django_cattrs_fields.converters.csv import iter_csv, serializer, structure_iter, write_csv
+from django_cattrs_fields.fields import (
+    BooleanField,
+    CharField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    FloatField,
+    IntegerField,
+    TimeField,
+    UUIDField,
+)
+from django_cattrs_fields.hooks.row_hooks import make_row_unstructure_fn
+
+
+@define
+class Order:
+    id: UUIDField
+    customer: CharField
+    paid: BooleanField
+    quantity: IntegerField
+    weight: FloatField
+    price: DecimalField
+    day: DateField
+    at: DateTimeField
+    time: TimeField
+    note: CharField | None = None
+    discount: DecimalField | None = None
+
+
+def orders(n):
+    return [
+        Order(
+            id=uuid.uuid4(),
+            customer=f"customer, {i}",
+            paid=bool(i % 2),
+            quantity=i,
+            weight=i / 4,
+            price=Decimal("12.5"),
+            day=datetime.date(2024, 1, 2),
+            at=datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC),
+            time=datetime.time(3, 4, 5),
+            note=None if i % 2 else 'say "hi"\nthere',
+            discount=None if i % 3 else Decimal("1.5"),
+        )
+        for i in range(n)
+    ]
+
+
+def test_dumps_loads():
+    data = orders(10)
+
+    dump = serializer.dumps(data)
+
+    assert dump.splitlines()[0] == (
+        "id,customer,paid,quantity,weight,price,day,at,time,note,discount"
+    )
+    assert serializer.loads(dump, list[Order]) == data
+    assert serializer.loads(serializer.dumps(data[0]), Order) == data[0]
+
+
+def test_zero_decimals():
+    # zero isn't an empty cell, which would be read back as a null
+    order = orders(1)[0]
+    order.price = Decimal("0")
+    order.discount = Decimal("0.00")
+
+    dump = serializer.dumps([order])
+
+    assert serializer.loads(dump, list[Order]) == [order]
+
+
+def test_write_and_structure_iter():
+    data = orders(5)
+    file = io.StringIO(newline="")
+
+    write_csv(file, iter(data), Order)
+    file.seek(0)
+
+    rows = structure_iter(file, Order)
+    assert next(rows) == data[0]
+    assert list(rows) == data[1:]
+
+
+def test_structure_iter_is_lazy():
+    def lines():
+        yield "customer,quantity\r\n"
+        yield "a,1\r\n"
+        raise AssertionError("read too far")
+
+    @define
+    class Small:
+        customer: CharField
+        quantity: IntegerField
+
+    assert next(structure_iter(lines(), Small)) == Small(customer="a", quantity=1)
+
+
+def test_structure_iter_empty():
+    assert list(structure_iter([], Order)) == []
+
+
+def test_structure_iter_errors():
+    dump = serializer.dumps(orders(3)).replace("12.5", "nope", 2)
+
+    with pytest.raises(ClassValidationError) as exc_info:
+        list(structure_iter(io.StringIO(dump, newline=""), Order))
+
+    # the first row after the header
+    assert "csv row 1" in exc_info.value.__notes__
+
+
+def test_iter_csv_streaming_response():
+    data = orders(3)
+
+    response = StreamingHttpResponse(iter_csv(data, Order), content_type="text/csv")
+    content = b"".join(response.streaming_content).decode()
+
+    assert content == serializer.dumps(data)
+
+
+def test_make_row_unstructure_fn():
+    (order,) = orders(1)
+    unstructure = make_row_unstructure_fn(Order, serializer, ["customer", "paid", "id"])
+
+    assert unstructure(order) == ("customer, 0", "false", str(order.id))
+
+    with pytest.raises(ValueError):
+        make_row_unstructure_fn(Order, serializer, ["nope"])
@@ -23,6 +23,7 @@ from django_cattrs_fields.converters.msgpack import serializer as msgpack_serial
 from django_cattrs_fields.converters.msgspec import serializer as msgspec_serializer
 from django_cattrs_fields.converters.orjson import serializer as orjson_serializer
 from django_cattrs_fields.converters.pyyaml import serializer as pyyaml_serializer
+from django_cattrs_fields.converters.toml import serializer as toml_serializer
 from django_cattrs_fields.converters.tomlkit import serializer as tomlkit_serializer
 from django_cattrs_fields.converters.ujson import serializer as ujson_serializer
 from django_cattrs_fields.fields import DateField, DateTimeField, TimeField
@@ -144,6 +145,7 @@ def test_unstructure_nullable(b, d, t):
         (msgspec_serializer, msgspec_json.encode),
         (orjson_serializer, orjson.dumps),
         (pyyaml_serializer, yaml.safe_dump),
+        (toml_serializer, tomlkit.dumps),
         (tomlkit_serializer, tomlkit.dumps),
         (ujson_serializer, ujson.dumps),
     ],
@@ -264,6 +266,7 @@ def test_dumps_nullable(converter, dumps, b, d, t):
         (msgspec_serializer, msgspec_json.encode),
         (orjson_serializer, orjson.dumps),
         (pyyaml_serializer, yaml.safe_dump),
+        (toml_serializer, tomlkit.dumps),
         (tomlkit_serializer, tomlkit.dumps),
         (ujson_serializer, ujson.dumps),
     ],
@@ -328,6 +331,7 @@ def test_loads_nullable(converter, dumps, b, d, t):
         (msgspec_serializer),
         (orjson_serializer),
         (pyyaml_serializer),
+        (toml_serializer),
         (tomlkit_serializer),
         (ujson_serializer),
     ],
@@ -0,0 +1,110 @@
+import json
+from decimal import Decimal
+from typing import Annotated
+
+import pytest
+
+from attrs import define
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.converters.msgspec import (
+    register_decimal_number_hooks as register_msgspec_decimal_number_hooks,
+    serializer as msgspec_serializer,
+    struct_loads,
+)
+from django_cattrs_fields.converters.orjson import (
+    direct_dumps,
+    register_decimal_number_hooks as register_orjson_decimal_number_hooks,
+    serializer as orjson_serializer,
+)
+from django_cattrs_fields.fields import DecimalField, Params
+
+
+@define
+class Price:
+    amount: Annotated[DecimalField, Params(decimal_max_digits=24, decimal_places=4)]
+    discount: DecimalField | None = None
+
+
+@pytest.fixture(params=["orjson", "msgspec"])
+def serializer(request):
+    if request.param == "orjson":
+        c = orjson_serializer.copy()
+        register_orjson_decimal_number_hooks(c)
+    else:
+        c = msgspec_serializer.copy()
+        register_msgspec_decimal_number_hooks(c)
+    return c
+
+
+@pytest.mark.parametrize(
+    "amount, expected",
+    [
+        ("12.50", b"12.50"),
+        ("0", b"0"),
+        ("-3.1415", b"-3.1415"),
+        ("1E+3", b"1000"),
+        ("123456789012345.6", b"123456789012345.6"),
+        # too long for a float
+        ("12345678901234567.1234", b'"12345678901234567.1234"'),
+        ("1E-400", b'"' + b"0." + b"0" * 399 + b'1"'),
+    ],
+)
+def test_dumps(serializer, amount, expected):
+    dump = serializer.dumps(Price(amount=Decimal(amount)))
+
+    assert dump == b'{"amount":' + expected + b',"discount":null}'
+    # precision is kept
+    assert Decimal(json.loads(dump, parse_float=Decimal)["amount"]) == Decimal(amount)
+
+
+def test_dumps_nullable(serializer):
+    dump = serializer.dumps(Price(amount=Decimal("1.5"), discount=Decimal("0.25")))
+
+    assert dump == b'{"amount":1.5,"discount":0.25}'
+
+
+def test_dumps_not_finite(serializer):
+    with pytest.raises(ValueError):
+        serializer.dumps(Price(amount=Decimal("NaN")))
+
+
+@pytest.mark.parametrize("amount", ["12.50", "0.1", "-3.1415", "123456789.123"])
+def test_loads(serializer, amount):
+    dump = serializer.dumps(Price(amount=Decimal(amount)))
+
+    assert serializer.loads(dump, Price).amount == Decimal(amount)
+
+
+@define
+class Balance:
+    amount: Annotated[DecimalField, Params(decimal_max_digits=20, decimal_places=2)]
+
+
+@pytest.mark.parametrize(
+    "amount", ["123456789012345678.91", "-999999999999999999.99", "0.01", "1234567890123.45"]
+)
+def test_round_trip_max_digits(serializer, amount):
+    dump = serializer.dumps(Balance(amount=Decimal(amount)))
+
+    assert serializer.loads(dump, Balance).amount == Decimal(amount)
+
+
+def test_struct_loads_exact():
+    amount = Decimal("12345678901234567.1234")
+    c = msgspec_serializer.copy()
+    register_msgspec_decimal_number_hooks(c)
+
+    assert struct_loads(c.dumps(Price(amount=amount)), Price).amount == amount
+
+
+def test_strings_by_default():
+    price = Price(amount=Decimal("1.50"))
+
+    assert orjson_serializer.dumps(price) == b'{"amount":"1.5","discount":null}'
+    assert direct_dumps(price) == b'{"amount":"1.5","discount":null}'
+
+
+def test_structure_float():
+    # the float's binary error doesn't leak into the decimal
+    assert converter.structure({"amount": 0.1}, Price).amount == Decimal("0.1")
@@ -0,0 +1,118 @@
+import pytest
+
+from attrs import define
+
+from cattrs import transform_error
+from cattrs.converters import Converter
+from cattrs.errors import ClassValidationError
+
+from django_cattrs_fields.converters.fail_fast import FailFastConverter
+from django_cattrs_fields.converters.register_hooks import register_structure_hooks
+from django_cattrs_fields.fields import CharField, EmailField, IntegerField, SlugField
+
+
+@define
+class Address:
+    city: CharField
+    slug: SlugField
+
+
+@define
+class Human:
+    name: CharField
+    email: EmailField
+    age: IntegerField
+    address: Address
+
+
+valid = {
+    "name": "bob",
+    "email": "bob@example.com",
+    "age": 25,
+    "address": {"city": "tehran", "slug": "tehran"},
+}
+invalid = {
+    "name": "",
+    "email": "not an email",
+    "age": "old",
+    "address": {"city": "", "slug": "not a slug"},
+}
+
+
+@pytest.fixture
+def fail_fast():
+    converter = FailFastConverter()
+    register_structure_hooks(converter)
+    return converter
+
+
+@pytest.fixture
+def detailed():
+    converter = Converter()
+    register_structure_hooks(converter)
+    return converter
+
+
+def test_structure(fail_fast, detailed):
+    assert fail_fast.structure(valid, Human) == detailed.structure(valid, Human)
+    assert fail_fast.fast.detailed_validation is False
+
+
+def test_errors_match_detailed(fail_fast, detailed):
+    with pytest.raises(ClassValidationError) as fast_info:
+        fail_fast.structure(invalid, Human)
+    with pytest.raises(ClassValidationError) as detailed_info:
+        detailed.structure(invalid, Human)
+
+    assert transform_error(fast_info.value) == transform_error(detailed_info.value)
+    assert len(transform_error(fast_info.value)) == 5
+
+
+def test_max_errors(fail_fast):
+    fail_fast.max_errors = 2
+
+    with pytest.raises(ClassValidationError) as exc_info:
+        fail_fast.structure(invalid, Human)
+
+    assert transform_error(exc_info.value) == [
+        "invalid value for type, expected CharField @ $.name",
+        "invalid value for type, expected EmailField @ $.email",
+    ]
+    assert exc_info.value.__notes__ == ["3 more errors were left out"]
+
+
+def test_max_errors_zero(fail_fast):
+    fail_fast.max_errors = 0
+
+    with pytest.raises(ValueError) as exc_info:
+        fail_fast.structure(invalid, Human)
+
+    assert not isinstance(exc_info.value, ClassValidationError)
+
+
+def test_registering_hooks_resets_fast_copy(fail_fast):
+    fast = fail_fast.fast
+
+    @fail_fast.register_structure_hook_factory(lambda t: t is Address)
+    def factory(t):
+        return lambda v, _: Address(city="y", slug="y")
+
+    assert fail_fast.fast is not fast
+    assert fail_fast.structure(valid, Human).address == Address(city="y", slug="y")
+
+    fast = fail_fast.fast
+
+    fail_fast.register_structure_hook(Address, lambda v, _: Address(city="x", slug="x"))
+
+    assert fail_fast.fast is not fast
+    assert fail_fast.structure(valid, Human).address == Address(city="x", slug="x")
+
+
+def test_copy(fail_fast):
+    fail_fast.max_errors = 3
+
+    copy = fail_fast.copy()
+
+    assert isinstance(copy, FailFastConverter)
+    assert copy.max_errors == 3
+    assert copy.structure(valid, Human) == fail_fast.structure(valid, Human)
@@ -0,0 +1,88 @@
+import pytest
+
+from attrs import define, field
+
+from cattrs.errors import ClassValidationError
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.fields import CharField, EmailField, IntegerField
+from django_cattrs_fields.utils import fieldsets
+from django_cattrs_fields.utils.fieldsets import project, structure_fields, unstructure_fields
+
+
+@define
+class Address:
+    city: CharField
+
+
+@define
+class Human:
+    id: IntegerField
+    name: CharField
+    email: EmailField
+    address: Address
+    age: IntegerField = field(default=18)
+
+
+human = Human(id=1, name="bob", email="bob@example.com", address=Address(city="tehran"))
+
+
+def test_project():
+    projected = project(Human, "id, name")
+
+    assert [a.name for a in projected.__attrs_attrs__] == ["id", "name"]
+    assert projected.__name__ == "Human"
+    assert project(Human, ["name", "id"]) is projected
+    assert project(list[Human], "id,name") == list[projected]
+
+
+def test_project_unknown_field():
+    with pytest.raises(ValueError, match="Human has no fields named nope"):
+        project(Human, "id,nope")
+
+
+def test_projections_are_bounded():
+    fieldsets._project.cache_clear()
+    before = fieldsets._project.cache_info().currsize
+
+    with pytest.raises(ValueError):
+        project(Human, "id,nope")
+    assert fieldsets._project.cache_info().currsize == before
+
+    assert fieldsets._project.cache_info().maxsize == fieldsets.CACHE_SIZE
+
+
+def test_unstructure_fields():
+    assert unstructure_fields(human, Human, "id,name", converter) == {"id": 1, "name": "bob"}
+    assert unstructure_fields(human, Human, ["address", "age"], converter) == {
+        "address": {"city": "tehran"},
+        "age": 18,
+    }
+    assert unstructure_fields([human, human], list[Human], "name", converter) == [
+        {"name": "bob"},
+        {"name": "bob"},
+    ]
+
+
+def test_structure_fields():
+    # the email isn't requested, so it's never validated
+    data = {"id": "1", "name": "bob", "email": "not an email"}
+
+    obj = structure_fields(data, Human, "id,name", converter)
+
+    assert (obj.id, obj.name) == (1, "bob")
+    assert not hasattr(obj, "email")
+
+    objs = structure_fields([data, data], list[Human], "name", converter)
+    assert [o.name for o in objs] == ["bob", "bob"]
+
+
+def test_structure_fields_default():
+    obj = structure_fields({"name": "bob"}, Human, "name,age", converter)
+
+    assert obj.age == 18
+
+
+def test_structure_fields_validation():
+    with pytest.raises(ClassValidationError):
+        structure_fields({"id": 1, "email": "not an email"}, Human, "id,email", converter)
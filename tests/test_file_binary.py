@@ -0,0 +1,154 @@
+import io
+
+import bson
+import cbor2
+import msgpack
+import pytest
+
+from attrs import define
+
+from django.core.files.uploadedfile import (
+    InMemoryUploadedFile,
+    SimpleUploadedFile,
+    TemporaryUploadedFile,
+)
+
+from django_cattrs_fields.converters.bson import serializer as bson_serializer
+from django_cattrs_fields.converters.cbor2 import serializer as cbor2_serializer
+from django_cattrs_fields.converters.msgpack import serializer as msgpack_serializer
+from django_cattrs_fields.converters.register_hooks import register_binary_file_hooks
+from django_cattrs_fields.fields.files import FileField
+from django_cattrs_fields.hooks.file_hooks import file_buffer, file_buffers
+
+PDF_CONTENT = b"%PDF-1.4 wheeee"
+
+
+@define
+class PDF:
+    pdf: FileField
+
+
+@define
+class PDFNullable:
+    pdf: FileField | None
+
+
+@pytest.fixture
+def simple_file():
+    return SimpleUploadedFile(name="test.pdf", content=PDF_CONTENT, content_type="application/pdf")
+
+
+@pytest.fixture
+def memory_file():
+    return InMemoryUploadedFile(
+        file=io.BytesIO(PDF_CONTENT),
+        field_name="pdf",
+        name="test.pdf",
+        content_type="application/pdf",
+        size=len(PDF_CONTENT),
+        charset=None,
+    )
+
+
+@pytest.fixture
+def temp_file():
+    file = TemporaryUploadedFile(
+        name="test.pdf", content_type="application/pdf", size=0, charset=None
+    )
+    file.write(PDF_CONTENT)
+    file.seek(0)
+    file.size = len(PDF_CONTENT)
+    yield file
+    file.close()
+
+
+serializers = {
+    "msgpack": (msgpack_serializer, False, msgpack.unpackb),
+    "cbor2": (cbor2_serializer, True, cbor2.loads),
+    "bson": (bson_serializer, True, bson.decode),
+}
+
+
+@pytest.fixture(params=list(serializers))
+def serializer(request):
+    base, as_bytes, raw_loads = serializers[request.param]
+    c = base.copy()
+    register_binary_file_hooks(c, as_bytes=as_bytes)
+    return c, raw_loads
+
+
+@pytest.mark.parametrize("fixture", ["simple_file", "memory_file", "temp_file"])
+def test_buffer(fixture, request):
+    file = request.getfixturevalue(fixture)
+
+    with file_buffers():
+        buffer = file_buffer(file)
+
+        assert isinstance(buffer, memoryview)
+        assert buffer == PDF_CONTENT
+
+    # released with the block
+    with pytest.raises(ValueError):
+        bytes(buffer)
+
+
+@pytest.mark.parametrize("fixture", ["simple_file", "memory_file", "temp_file"])
+def test_buffer_outside_a_block(fixture, request):
+    file = request.getfixturevalue(fixture)
+
+    assert file_buffer(file) == PDF_CONTENT
+    assert isinstance(file_buffer(file), bytes)
+
+
+def test_buffer_released_after_dumps(memory_file):
+    c = msgpack_serializer.copy()
+    register_binary_file_hooks(c)
+
+    c.dumps(PDF(pdf=memory_file))
+
+    # the buffer of the file isn't exported anymore, so it can be written to
+    memory_file.file.write(b"more")
+
+
+@pytest.mark.parametrize("fixture", ["simple_file", "memory_file", "temp_file"])
+def test_round_trip(fixture, request, serializer):
+    file = request.getfixturevalue(fixture)
+    c, raw_loads = serializer
+
+    dump = c.dumps(PDF(pdf=file))
+    raw = raw_loads(dump)
+
+    # embedded as a binary blob, not a list of ints or a file object
+    assert raw["pdf"] == {
+        "name": "test.pdf",
+        "content_type": "application/pdf",
+        "content": PDF_CONTENT,
+    }
+
+    structure = c.loads(dump, PDF)
+    assert isinstance(structure.pdf, InMemoryUploadedFile)
+    assert structure.pdf.name == "test.pdf"
+    assert structure.pdf.content_type == "application/pdf"
+    assert structure.pdf.size == len(PDF_CONTENT)
+    assert structure.pdf.read() == PDF_CONTENT
+
+
+def test_nullable(serializer, simple_file):
+    c, _ = serializer
+
+    assert c.loads(c.dumps(PDFNullable(pdf=None)), PDFNullable).pdf is None
+    assert c.loads(c.dumps(PDFNullable(pdf=simple_file)), PDFNullable).pdf.read() == PDF_CONTENT
+
+
+def test_url(serializer):
+    c, _ = serializer
+    url = "https://example.com/test.pdf"
+
+    assert c.loads(c.dumps(PDF(pdf=url)), PDF).pdf == url
+
+
+def test_empty_file(serializer):
+    c, _ = serializer
+    file = SimpleUploadedFile(name="empty.pdf", content=b"", content_type="application/pdf")
+
+    assert c.loads(c.dumps(PDF(pdf=file)), PDF).pdf.read() == b""
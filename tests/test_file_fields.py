@@ -30,6 +30,7 @@ from django_cattrs_fields.converters.msgpack import serializer as msgpack_serial
 from django_cattrs_fields.converters.msgspec import serializer as msgspec_serializer
 from django_cattrs_fields.converters.orjson import serializer as orjson_serializer
 from django_cattrs_fields.converters.pyyaml import serializer as pyyaml_serializer
+from django_cattrs_fields.converters.toml import serializer as toml_serializer
 from django_cattrs_fields.converters.tomlkit import serializer as tomlkit_serializer
 from django_cattrs_fields.converters.ujson import serializer as ujson_serializer
 from django_cattrs_fields.fields.files import FileField
@@ -270,6 +271,7 @@ def test_unstructure_field_file_nullable(simple_file, db, simple):
         (msgspec_serializer, msgspec_json.encode),
         (orjson_serializer, orjson.dumps),
         (pyyaml_serializer, yaml.safe_dump),
+        (toml_serializer, tomlkit.dumps),
         (tomlkit_serializer, tomlkit.dumps),
         (ujson_serializer, ujson.dumps),
     ],
@@ -359,6 +361,7 @@ def test_dumps_nullable(
         (msgspec_serializer, msgspec_json.encode),
         (orjson_serializer, orjson.dumps),
         (pyyaml_serializer, yaml.safe_dump),
+        (toml_serializer, tomlkit.dumps),
         (tomlkit_serializer, tomlkit.dumps),
         (ujson_serializer, ujson.dumps),
     ],
@@ -435,6 +438,7 @@ def test_loads_nullable(
         (msgspec_serializer),
         (orjson_serializer),
         (pyyaml_serializer),
+        (toml_serializer),
         (tomlkit_serializer),
         (ujson_serializer),
     ],
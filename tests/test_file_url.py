@@ -0,0 +1,141 @@
+import pytest
+
+from attrs import define
+
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.converters.json import serializer as json_serializer
+from django_cattrs_fields.converters.register_hooks import register_lazy_file_structure_hooks
+from django_cattrs_fields.fields.files import FileField
+from django_cattrs_fields.utils import files
+from django_cattrs_fields.utils.files import FileURLCache, LazyFileURL, set_file_url_cache
+
+from tests.books.models import Book
+
+
+@define
+class PDF:
+    pdf: FileField
+
+
+@define
+class PDFNullable:
+    pdf: FileField | None
+
+
+@pytest.fixture
+def book(db):
+    return Book.objects.create(
+        pdf=SimpleUploadedFile(name="test.pdf", content=b"wheeee", content_type="application/pdf")
+    )
+
+
+@pytest.fixture
+def url_calls(monkeypatch):
+    calls = []
+    url = FileSystemStorage.url
+
+    def counting_url(self, name):
+        calls.append(name)
+        return url(self, name)
+
+    monkeypatch.setattr(FileSystemStorage, "url", counting_url)
+    return calls
+
+
+@pytest.fixture
+def url_cache():
+    cache = FileURLCache(maxsize=2, ttl=60)
+    set_file_url_cache(cache)
+    yield cache
+    set_file_url_cache(None)
+
+
+@pytest.fixture
+def lazy_converter():
+    c = converter.copy()
+    register_lazy_file_structure_hooks(c)
+    return c
+
+
+def test_cache(book, url_calls, url_cache):
+    for _ in range(3):
+        structure = converter.structure({"pdf": book.pdf}, PDF)
+        assert structure.pdf == book.pdf.storage.url(book.pdf.name)
+
+    # one for the first structure, the rest are from the assertion
+    assert len(url_calls) == 4
+    assert len(url_cache) == 1
+
+
+def test_cache_ttl(book, url_calls, url_cache, monkeypatch):
+    converter.structure({"pdf": book.pdf}, PDF)
+
+    now = files.time.monotonic()
+    monkeypatch.setattr(files.time, "monotonic", lambda: now + 61)
+    converter.structure({"pdf": book.pdf}, PDF)
+
+    assert len(url_calls) == 2
+
+
+def test_cache_bounded():
+    cache = FileURLCache(maxsize=2, ttl=60)
+    storage = object()
+    cache.set(storage, "a", "/a")
+    cache.set(storage, "b", "/b")
+    cache.get(storage, "a")
+    cache.set(storage, "c", "/c")
+
+    assert len(cache) == 2
+    assert cache.get(storage, "a") == "/a"
+    assert cache.get(storage, "b") is None
+    assert cache.get(storage, "c") == "/c"
+
+
+def test_no_cache(book, url_calls):
+    converter.structure({"pdf": book.pdf}, PDF)
+    converter.structure({"pdf": book.pdf}, PDF)
+
+    assert len(url_calls) == 2
+
+
+def test_lazy_structure(book, url_calls, lazy_converter):
+    structure = lazy_converter.structure({"pdf": book.pdf}, PDF)
+
+    assert isinstance(structure.pdf, LazyFileURL)
+    assert not structure.pdf.resolved
+    assert url_calls == []
+
+    assert structure.pdf == book.pdf.url
+    assert structure.pdf.resolved
+    assert len(url_calls) == 2
+
+
+def test_lazy_unstructure(book, lazy_converter):
+    structure = lazy_converter.structure({"pdf": book.pdf}, PDF)
+    unstructure = lazy_converter.unstructure(structure)
+
+    assert isinstance(unstructure["pdf"], str)
+    assert unstructure["pdf"] == book.pdf.url
+
+
+def test_lazy_dumps(book, lazy_converter):
+    structure = lazy_converter.structure({"pdf": book.pdf}, PDF)
+
+    assert json_serializer.dumps(structure) == json_serializer.dumps(PDF(pdf=book.pdf.url))
+
+
+@pytest.mark.parametrize("simple", [True, False])
+def test_lazy_nullable(db, lazy_converter, simple):
+    b = Book.objects.create(
+        pdf=SimpleUploadedFile(name="test.pdf", content=b"wheeee") if simple else None
+    )
+    structure = lazy_converter.structure({"pdf": b.pdf}, PDFNullable)
+
+    if simple:
+        assert isinstance(structure.pdf, LazyFileURL)
+        assert structure.pdf == b.pdf.url
+    else:
+        assert structure.pdf is None
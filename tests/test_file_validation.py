@@ -0,0 +1,152 @@
+import hashlib
+import io
+from typing import Annotated
+
+import pytest
+
+from attrs import define
+
+from django.core.files.uploadedfile import (
+    InMemoryUploadedFile,
+    SimpleUploadedFile,
+    TemporaryUploadedFile,
+)
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.fields import Params
+from django_cattrs_fields.fields.files import FileField
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+@define
+class Image:
+    image: Annotated[
+        FileField,
+        Params(file_max_size=200, file_content_types=("image/png",), file_hash="sha256"),
+    ]
+
+
+@define
+class Document:
+    document: Annotated[FileField, Params(file_max_size=200)]
+
+
+@define
+class ImageNullable:
+    image: Annotated[FileField, Params(file_content_types=("image/png",))] | None
+
+
+@define
+class ImageInnerNullable:
+    image: Annotated[FileField | None, Params(file_max_size=200, file_content_types=("image/png",))]
+
+
+@pytest.fixture
+def simple_file():
+    return SimpleUploadedFile(name="image.png", content=PNG, content_type="image/png")
+
+
+@pytest.fixture
+def memory_file():
+    return InMemoryUploadedFile(
+        file=io.BytesIO(PNG),
+        field_name="image",
+        name="image.png",
+        content_type="image/png",
+        size=len(PNG),
+        charset=None,
+    )
+
+
+@pytest.fixture
+def temp_file():
+    file = TemporaryUploadedFile(name="image.png", content_type="image/png", size=0, charset=None)
+    file.write(PNG)
+    file.seek(0)
+    file.size = len(PNG)
+    yield file
+    file.close()
+
+
+@pytest.mark.parametrize("fixture", ["simple_file", "memory_file", "temp_file"])
+def test_structure(fixture, request):
+    file = request.getfixturevalue(fixture)
+
+    structure = converter.structure({"image": file}, Image)
+
+    assert structure.image is file
+    assert structure.image.checksum == hashlib.sha256(PNG).hexdigest()
+    # the file is ready to be read again
+    assert structure.image.read() == PNG
+
+
+def test_max_size():
+    file = SimpleUploadedFile(name="doc.txt", content=b"a" * 201, content_type="text/plain")
+
+    with pytest.RaisesGroup(ValueError):
+        converter.structure({"document": file}, Document)
+
+    file = SimpleUploadedFile(name="doc.txt", content=b"a" * 200, content_type="text/plain")
+    assert converter.structure({"document": file}, Document).document is file
+
+
+def test_max_size_wrong_reported_size(memory_file):
+    memory_file.size = 10
+    memory_file.file = io.BytesIO(PNG * 2)
+
+    with pytest.RaisesGroup(ValueError):
+        converter.structure({"image": memory_file}, Image)
+
+
+def test_content_type():
+    file = SimpleUploadedFile(name="image.png", content=PNG, content_type="image/jpeg")
+
+    with pytest.RaisesGroup(ValueError):
+        converter.structure({"image": file}, Image)
+
+
+def test_content_types_list(simple_file):
+    @define
+    class Upload:
+        image: Annotated[FileField, Params(file_content_types=["image/png", "image/jpeg"])]
+
+    assert converter.structure({"image": simple_file}, Upload).image is simple_file
+
+    file = SimpleUploadedFile(name="image.gif", content=PNG, content_type="image/gif")
+    with pytest.RaisesGroup(ValueError):
+        converter.structure({"image": file}, Upload)
+
+
+def test_content_magic():
+    file = SimpleUploadedFile(name="image.png", content=b"<html></html>", content_type="image/png")
+
+    with pytest.RaisesGroup(ValueError):
+        converter.structure({"image": file}, Image)
+
+
+def test_nullable(simple_file):
+    assert converter.structure({"image": None}, ImageNullable).image is None
+    assert converter.structure({"image": simple_file}, ImageNullable).image is simple_file
+
+    file = SimpleUploadedFile(name="image.png", content=b"not a png", content_type="image/png")
+    with pytest.RaisesGroup(ValueError):
+        converter.structure({"image": file}, ImageNullable)
+
+
+def test_inner_nullable(simple_file):
+    assert converter.structure({"image": None}, ImageInnerNullable).image is None
+    assert converter.structure({"image": simple_file}, ImageInnerNullable).image is simple_file
+
+    file = SimpleUploadedFile(name="image.png", content=b"not a png", content_type="image/png")
+    with pytest.RaisesGroup(ValueError):
+        converter.structure({"image": file}, ImageInnerNullable)
+
+    large = SimpleUploadedFile(name="image.png", content=PNG * 100, content_type="image/png")
+    with pytest.RaisesGroup(ValueError):
+        converter.structure({"image": large}, ImageInnerNullable)
+
+
+def test_url():
+    url = "https://example.com/image.png"
+    assert converter.structure({"image": url}, Image).image == url
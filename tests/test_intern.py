@@ -0,0 +1,119 @@
+from typing import Annotated
+
+import pytest
+
+from attrs import define
+
+from cattrs.errors import ClassValidationError
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.fields import CharField, Params, SlugField
+from django_cattrs_fields.hooks.batch_hooks import structure_batch
+from django_cattrs_fields.utils.intern import InternTable, global_table, interning
+
+
+@define
+class Order:
+    status: Annotated[CharField, Params(intern="batch")]
+    country: Annotated[SlugField, Params(intern="global")]
+    note: Annotated[CharField, Params(intern="batch")] | None = None
+    name: Annotated[CharField, Params()] = "x"
+
+
+def fresh(val):
+    # a new string object on every call
+    return "".join(list(val))
+
+
+def rows(n):
+    return [{"status": fresh("active"), "country": fresh("iran")} for _ in range(n)]
+
+
+def test_batch():
+    data = rows(3)
+    assert data[0]["status"] is not data[1]["status"]
+
+    with interning():
+        orders = converter.structure(data, list[Order])
+
+    assert orders[0].status is orders[1].status is orders[2].status
+
+
+def test_batch_outside_a_block():
+    orders = converter.structure(rows(2), list[Order])
+
+    assert orders[0].status == orders[1].status
+    assert orders[0].status is not orders[1].status
+
+
+def test_batch_nullable():
+    data = [{**row, "note": fresh("late")} for row in rows(2)] + [rows(1)[0]]
+
+    with interning():
+        orders = converter.structure(data, list[Order])
+
+    assert orders[0].note is orders[1].note
+    assert orders[2].note is None
+
+
+def test_inner_nullable():
+    @define
+    class Tagged:
+        tag: Annotated[CharField | None, Params(intern="batch")]
+        slug: Annotated[SlugField | None, Params(intern="global")] = None
+
+    with interning():
+        first = converter.structure({"tag": fresh("new"), "slug": fresh("iran")}, Tagged)
+        second = converter.structure({"tag": fresh("new"), "slug": fresh("iran")}, Tagged)
+        empty = converter.structure({"tag": None}, Tagged)
+
+    assert first.tag is second.tag
+    assert first.slug is second.slug
+    assert empty == Tagged(tag=None, slug=None)
+    with pytest.raises(ClassValidationError):
+        converter.structure({"tag": "", "slug": "not a slug"}, Tagged)
+
+
+def test_structure_batch_interns():
+    orders = structure_batch(rows(3), Order, converter)
+
+    assert orders[0].status is orders[1].status is orders[2].status
+
+
+def test_global():
+    first = converter.structure(rows(1)[0], Order)
+    second = converter.structure(rows(1)[0], Order)
+
+    assert first.country is second.country
+    assert len(global_table) >= 1
+
+
+def test_validation_still_runs():
+    with pytest.raises(ClassValidationError):
+        converter.structure({"status": "", "country": "not a slug"}, Order)
+
+
+def test_unknown_policy():
+    @define
+    class Bad:
+        status: Annotated[CharField, Params(intern="always")]
+
+    with pytest.raises(ValueError, match="intern should be one of"):
+        converter.structure({"status": "a"}, Bad)
+
+
+def test_intern_table_is_bounded():
+    table = InternTable(maxsize=2)
+    a, b = fresh("a"), fresh("a")
+
+    assert table.intern(a) is a
+    assert table.intern(b) is a
+    table.intern("b")
+
+    c = fresh("c")
+    assert table.intern(c) is c
+    assert len(table) == 2
+    assert table.intern(fresh("a")) is a
+
+    table.clear()
+    assert len(table) == 0
@@ -0,0 +1,172 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from attrs import define, field
+
+from cattrs.converters import Converter
+from cattrs.gen import make_dict_unstructure_fn, override
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.converters.register_hooks import (
+    register_all_empty_unstructure_hooks,
+    register_all_unstructure_hooks,
+    register_structure_hooks,
+)
+from django_cattrs_fields.fields import (
+    CharField,
+    DateTimeField,
+    DecimalField,
+    Empty,
+    EmptyField,
+    IntegerField,
+    UUIDField,
+)
+from django_cattrs_fields.utils.lazy import UnstructuredView, unstructure_lazy
+
+from tests.books.models import Human as HumanModel
+
+
+@define
+class Address:
+    city: CharField
+
+
+@define
+class Human:
+    name: CharField
+    age: IntegerField
+    uid: UUIDField
+    joined: DateTimeField
+    balance: DecimalField
+    address: Address
+    nickname: CharField = field(default="")
+
+
+human = Human(
+    name="bob",
+    age=25,
+    uid=uuid.uuid4(),
+    joined=datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC),
+    balance=Decimal("10.50"),
+    address=Address(city="tehran"),
+)
+
+
+def test_same_as_unstructure():
+    view = UnstructuredView(human, converter)
+
+    assert dict(view) == converter.unstructure(human)
+    assert list(view) == list(converter.unstructure(human))
+    assert len(view) == 7
+    assert "name" in view
+    assert "nope" not in view
+
+
+def test_hooks_run_once_on_access():
+    calls = []
+    conv = Converter()
+    register_all_unstructure_hooks(conv)
+    conv.register_unstructure_hook(UUIDField, lambda v: calls.append(v) or str(v))
+
+    view = UnstructuredView(human, conv)
+    assert view["name"] == "bob"
+    assert calls == []
+
+    assert view["uid"] == str(human.uid)
+    assert view["uid"] == str(human.uid)
+    assert calls == [human.uid]
+
+    with pytest.raises(KeyError):
+        view["nope"]
+
+
+def test_omit_if_default():
+    conv = Converter(omit_if_default=True)
+    register_all_unstructure_hooks(conv)
+
+    view = UnstructuredView(human, conv)
+
+    assert "nickname" not in view
+    assert dict(view) == conv.unstructure(human)
+
+
+def test_unstructure_lazy_list():
+    views = unstructure_lazy([human, human], converter)
+
+    assert [dict(v) for v in views] == converter.unstructure([human, human])
+    assert unstructure_lazy(5, converter) == 5
+
+
+@pytest.mark.django_db
+def test_model_kwargs():
+    @define
+    class HumanData:
+        name: CharField
+        age: IntegerField
+
+    conv = Converter()
+    register_structure_hooks(conv)
+    register_all_unstructure_hooks(conv)
+
+    obj = HumanModel(**UnstructuredView(HumanData(name="bob", age=30), conv))
+
+    assert (obj.name, obj.age) == ("bob", 30)
+
+
+@define
+class Patch:
+    name: CharField | EmptyField
+    age: IntegerField | EmptyField = 0
+
+
+def test_skip_empty():
+    conv = Converter(omit_if_default=True)
+    register_all_unstructure_hooks(conv)
+    register_all_empty_unstructure_hooks(conv)
+    patch = Patch(name="bob", age=Empty)
+
+    view = UnstructuredView(patch, conv)
+
+    assert dict(view) == conv.unstructure(patch) == {"name": "bob"}
+    assert dict(UnstructuredView(Patch(name="bob"), conv)) == conv.unstructure(Patch(name="bob"))
+
+
+def test_custom_class_hook():
+    conv = Converter()
+    register_all_unstructure_hooks(conv)
+    conv.register_unstructure_hook(
+        Address, make_dict_unstructure_fn(Address, conv, city=override(rename="town"))
+    )
+    address = Address(city="tehran")
+
+    assert dict(UnstructuredView(address, conv)) == {"town": "tehran"}
+    assert unstructure_lazy(address, conv) == {"town": "tehran"}
+
+
+def test_class_hook_registered_later():
+    conv = Converter()
+    register_all_unstructure_hooks(conv)
+    address = Address(city="tehran")
+
+    assert isinstance(unstructure_lazy(address, conv), UnstructuredView)
+
+    conv.register_unstructure_hook(
+        Address, make_dict_unstructure_fn(Address, conv, city=override(omit=True))
+    )
+
+    assert unstructure_lazy(address, conv) == conv.unstructure(address) == {}
+    assert dict(UnstructuredView(address, conv)) == {}
+
+
+def test_field_hook_registered_later():
+    conv = Converter()
+    register_all_unstructure_hooks(conv)
+    assert dict(unstructure_lazy(human, conv))["age"] == 25
+
+    conv.register_unstructure_hook(IntegerField, str)
+
+    assert dict(unstructure_lazy(human, conv)) == conv.unstructure(human)
+    assert unstructure_lazy(human, conv)["age"] == "25"
@@ -25,6 +25,7 @@ from django_cattrs_fields.converters.msgpack import serializer as msgpack_serial
 from django_cattrs_fields.converters.msgspec import serializer as msgspec_serializer
 from django_cattrs_fields.converters.orjson import serializer as orjson_serializer
 from django_cattrs_fields.converters.pyyaml import serializer as pyyaml_serializer
+from django_cattrs_fields.converters.toml import serializer as toml_serializer
 from django_cattrs_fields.converters.tomlkit import serializer as tomlkit_serializer
 from django_cattrs_fields.converters.ujson import serializer as ujson_serializer
 from django_cattrs_fields.fields import CharField, DecimalField, IntegerField
@@ -109,6 +110,7 @@ def test_unstructure_model(create_books):
         (msgspec_serializer, msgspec_json.encode),
         (orjson_serializer, orjson.dumps),
         (pyyaml_serializer, yaml.safe_dump),
+        pytest.param(toml_serializer, tomlkit.dumps, marks=pytest.mark.xfail),
         pytest.param(tomlkit_serializer, tomlkit.dumps, marks=pytest.mark.xfail),
         (ujson_serializer, ujson.dumps),
     ],
@@ -141,6 +143,7 @@ def test_dumps(converter, dumps):
         (msgspec_serializer, msgspec_json.encode),
         (orjson_serializer, orjson.dumps),
         (pyyaml_serializer, yaml.safe_dump),
+        pytest.param(toml_serializer, tomlkit.dumps, marks=pytest.mark.xfail),
         pytest.param(tomlkit_serializer, tomlkit.dumps, marks=pytest.mark.xfail),
         (ujson_serializer, ujson.dumps),
     ],
@@ -0,0 +1,134 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import msgpack
+import pytest
+
+from attrs import define
+
+from django.utils import timezone
+
+from django_cattrs_fields.converters.msgpack import (
+    DECIMAL_EXT_CODE,
+    decimal_unstructure_ext,
+    ext_hook,
+    register_ext_hooks,
+    serializer,
+)
+from django_cattrs_fields.fields import DateTimeField, DecimalField, UUIDField
+
+
+@define
+class Event:
+    uid: UUIDField
+    at: DateTimeField
+    amount: DecimalField
+    parent: UUIDField | None = None
+    done_at: DateTimeField | None = None
+    fee: DecimalField | None = None
+
+
+@pytest.fixture
+def ext_serializer():
+    c = serializer.copy()
+    register_ext_hooks(c)
+    return c
+
+
+def make_event(**kwargs):
+    return Event(
+        uid=uuid.uuid4(),
+        at=timezone.now(),
+        amount=Decimal("12.50"),
+        **kwargs,
+    )
+
+
+def test_dumps(ext_serializer):
+    event = make_event()
+
+    raw = msgpack.unpackb(ext_serializer.dumps(event))
+
+    assert raw["uid"] == event.uid.bytes
+    assert raw["at"] == msgpack.Timestamp.from_datetime(event.at)
+    # exponent -2, coefficient 1250
+    assert raw["amount"] == msgpack.ExtType(DECIMAL_EXT_CODE, b"\xfe\x04\xe2")
+    assert raw["parent"] is None
+
+
+def test_smaller(ext_serializer):
+    event = make_event()
+
+    assert len(ext_serializer.dumps(event)) < len(serializer.dumps(event))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "12.50",
+        "-12.50",
+        "0",
+        "0.000",
+        "-0.001",
+        "1E+5",
+        "12345678901234567890.1234567890",
+        "1E+200",
+        "-1E-300",
+        "Infinity",
+        "NaN",
+    ],
+)
+def test_decimal_ext(value):
+    data = msgpack.packb(decimal_unstructure_ext(Decimal(value)))
+
+    load = msgpack.unpackb(data, ext_hook=ext_hook)
+
+    assert str(load) == str(Decimal(value))
+
+
+@pytest.mark.parametrize("value", ["1234567.89", "-98765.4321", "99999999999999.99"])
+def test_decimal_ext_smaller_than_text(value):
+    assert len(msgpack.packb(decimal_unstructure_ext(Decimal(value)))) < len(msgpack.packb(value))
+
+
+def test_dump_then_load(ext_serializer):
+    event = make_event(
+        parent=uuid.uuid4(),
+        done_at=timezone.now(),
+        fee=Decimal("0"),
+    )
+
+    load = ext_serializer.loads(ext_serializer.dumps(event), Event)
+
+    assert load == event
+    assert load.at.tzinfo == timezone.get_current_timezone()
+    assert load.fee == Decimal("0")
+
+
+def test_naive_datetime(ext_serializer):
+    naive = datetime.datetime(2024, 5, 6, 7, 8, 9)
+    event = make_event()
+    event.at = naive
+
+    load = ext_serializer.loads(ext_serializer.dumps(event), Event)
+
+    assert load.at == naive.replace(tzinfo=datetime.UTC)
+
+
+def test_loads_without_ext(ext_serializer):
+    # the default dumps still load
+    event = make_event()
+
+    assert ext_serializer.loads(serializer.dumps(event), Event) == event
+
+
+def test_uuid_bytes():
+    uid = uuid.uuid4()
+
+    assert (
+        serializer.structure({"uid": uid.bytes, "at": timezone.now(), "amount": "1"}, Event).uid
+        == uid
+    )
+    with pytest.RaisesGroup(ValueError):
+        serializer.structure({"uid": b"short", "at": timezone.now(), "amount": "1"}, Event)
@@ -0,0 +1,154 @@
+import datetime
+import uuid
+from decimal import Decimal
+from typing import Annotated
+
+import msgspec
+import pytest
+
+from attrs import Factory, define
+
+from django.utils import timezone
+
+from django_cattrs_fields.converters.msgspec import serializer, struct_for, struct_loads
+from django_cattrs_fields.fields import (
+    BooleanField,
+    CharField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    EmailField,
+    FloatField,
+    IntegerField,
+    Params,
+    SlugField,
+    TimeField,
+    URLField,
+    UUIDField,
+)
+from django_cattrs_fields.fields.files import FileField
+
+
+@define
+class Tag:
+    slug: SlugField
+
+
+@define
+class Profile:
+    name: CharField
+    email: EmailField
+    website: URLField
+    uid: UUIDField
+    age: IntegerField
+    score: FloatField
+    price: Annotated[DecimalField, Params(decimal_max_digits=5, decimal_places=2)]
+    active: BooleanField
+    birthday: DateField
+    joined: DateTimeField
+    wakes: TimeField
+    nickname: CharField | None = None
+    tags: list[Tag] = Factory(list)
+
+
+data = {
+    "name": "bob",
+    "email": "bob@example.com",
+    "website": "https://example.com",
+    "uid": "5c9a0a2e-8d6b-4d5e-9d4a-6b1c1ad7b6f1",
+    "age": 32,
+    "score": 1.5,
+    "price": "12.50",
+    "active": True,
+    "birthday": "1990-01-02",
+    "joined": "2024-05-06T07:08:09",
+    "wakes": "07:30:00",
+    "tags": [{"slug": "a-tag"}],
+}
+
+
+def test_struct_for():
+    struct = struct_for(Profile)
+
+    assert issubclass(struct, msgspec.Struct)
+    assert set(struct.__struct_fields__) == {a.name for a in Profile.__attrs_attrs__}
+
+
+def test_struct_for_unsupported():
+    @define
+    class Document:
+        pdf: FileField
+
+    with pytest.raises(TypeError):
+        struct_for(Document)
+
+
+def test_loads():
+    dump = msgspec.json.encode(data)
+
+    struct = struct_loads(dump, Profile)
+
+    assert struct == serializer.loads(dump, Profile)
+    assert struct.uid == uuid.UUID(data["uid"])
+    assert struct.price == Decimal("12.50")
+    assert struct.birthday == datetime.date(1990, 1, 2)
+    assert struct.wakes == datetime.time(7, 30)
+    assert struct.tags == [Tag(slug="a-tag")]
+    assert struct.nickname is None
+
+
+def test_loads_timezone():
+    struct = struct_loads(msgspec.json.encode(data), Profile)
+
+    assert timezone.is_aware(struct.joined)
+    assert struct.joined.tzinfo == timezone.get_current_timezone()
+
+
+def test_loads_list():
+    dump = msgspec.json.encode([data, {**data, "name": "alice"}])
+
+    struct = struct_loads(dump, list[Profile])
+
+    assert [p.name for p in struct] == ["bob", "alice"]
+    assert struct == serializer.loads(dump, list[Profile])
+
+
+def test_loads_lax_numbers():
+    struct = struct_loads(msgspec.json.encode({**data, "age": "32", "price": 12.5}), Profile)
+
+    assert struct.age == 32
+    assert struct.price == Decimal("12.5")
+
+
+@pytest.mark.parametrize(
+    "invalid",
+    [
+        {"name": ""},
+        {"name": "bo\x00b"},
+        {"email": "not an email"},
+        {"website": "not a url"},
+        {"uid": "not a uuid"},
+        {"age": "a"},
+        {"age": False},
+        {"score": "inf"},
+        {"price": "1234.5"},
+        {"price": "1.234"},
+        {"birthday": "1990-13-02"},
+        {"tags": [{"slug": "not a slug"}]},
+    ],
+)
+def test_loads_invalid(invalid):
+    with pytest.RaisesGroup(ValueError, allow_unwrapped=False, flatten_subgroups=True):
+        struct_loads(msgspec.json.encode({**data, **invalid}), Profile)
+
+
+def test_loads_missing_field():
+    dump = msgspec.json.encode({k: v for k, v in data.items() if k != "email"})
+
+    with pytest.RaisesGroup(ValueError):
+        struct_loads(dump, Profile)
+
+
+def test_loads_malformed():
+    with pytest.RaisesGroup(ValueError):
+        struct_loads(b"{", Profile)
@@ -0,0 +1,67 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from django_cattrs_fields.hooks.numpy_hooks import float_array, integer_array  # noqa: E402
+
+
+def test_float_array():
+    arr = float_array([1.5, 2, 3.25])
+
+    assert arr.dtype == np.float64
+    assert arr.tolist() == [1.5, 2.0, 3.25]
+
+
+def test_float_array_invalid_indices():
+    with pytest.raises(ValueError, match="invalid values at indices 1, 3"):
+        float_array([1.0, math.inf, 2.0, math.nan])
+    with pytest.raises(ValueError, match="invalid values at indices 1"):
+        float_array([1.0, None])
+
+
+def test_float_array_reports_a_limited_number_of_indices():
+    with pytest.raises(ValueError, match=r"19, \.\.\. \(30 in total\)"):
+        float_array([math.nan] * 30)
+
+
+def test_float_array_nullable():
+    arr = float_array([1.0, None], nullable=True)
+
+    assert arr[0] == 1.0
+    assert math.isnan(arr[1])
+
+    with pytest.raises(ValueError, match="indices 0"):
+        float_array([math.nan, None], nullable=True)
+
+
+def test_float_array_scalar_fallback():
+    assert float_array(["1.5", 2, True]).tolist() == [1.5, 2.0, 1.0]
+
+    with pytest.raises(ValueError, match="indices 1, 2"):
+        float_array(["1.5", "nope", False])
+
+
+def test_integer_array():
+    arr = integer_array([1, 2, 3])
+
+    assert arr.dtype == np.int64
+    assert arr.tolist() == [1, 2, 3]
+    assert integer_array(["1", 2.0]).tolist() == [1, 2]
+
+
+def test_integer_array_range():
+    with pytest.raises(ValueError, match="indices 1"):
+        integer_array([1, 2**63, -(2**63)])
+
+
+def test_integer_array_nullable():
+    arr = integer_array([1, None, 3], nullable=True)
+
+    assert arr.mask.tolist() == [False, True, False]
+    assert arr.tolist() == [1, None, 3]
+    assert integer_array([1, 2], nullable=True).tolist() == [1, 2]
+
+    with pytest.raises(ValueError, match="indices 1"):
+        integer_array([1, None])
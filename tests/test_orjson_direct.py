@@ -0,0 +1,163 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from attrs import Factory, define, frozen
+from cattrs.gen import make_dict_unstructure_fn, override
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+
+from django_cattrs_fields.converters.orjson import default, direct_dumps, serializer
+from django_cattrs_fields.fields import (
+    BooleanField,
+    CharField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    EmailField,
+    FloatField,
+    IntegerField,
+    SlugField,
+    TimeField,
+    URLField,
+    UUIDField,
+)
+from django_cattrs_fields.fields.files import FileField
+
+from tests.books.models import Book
+
+
+@frozen
+class Tag:
+    slug: SlugField
+
+
+@define
+class Profile:
+    name: CharField
+    email: EmailField
+    website: URLField
+    uid: UUIDField
+    age: IntegerField
+    score: FloatField
+    price: DecimalField
+    active: BooleanField
+    birthday: DateField
+    joined: DateTimeField
+    wakes: TimeField
+    nickname: CharField | None = None
+    discount: DecimalField | None = None
+    tags: list[Tag] = Factory(list)
+
+
+@define
+class PDF:
+    pdf: FileField | None
+
+
+@define
+class Single:
+    name: CharField
+
+
+@define
+class Tagged:
+    tags: set[Tag]
+
+
+def make_profile(**kwargs):
+    return Profile(
+        **{
+            "name": "bob",
+            "email": "bob@example.com",
+            "website": "https://example.com",
+            "uid": uuid.uuid4(),
+            "age": 32,
+            "score": 1.5,
+            "price": Decimal("12.50"),
+            "active": True,
+            "birthday": datetime.date(1990, 1, 2),
+            "joined": timezone.now(),
+            "wakes": datetime.time(7, 30),
+            "tags": [Tag(slug="a"), Tag(slug="b")],
+            **kwargs,
+        }
+    )
+
+
+def test_dumps():
+    profile = make_profile()
+
+    assert direct_dumps(profile) == serializer.dumps(profile)
+
+
+def test_dumps_nullable():
+    profile = make_profile(nickname="bobby", discount=Decimal("1.10"))
+
+    assert direct_dumps(profile) == serializer.dumps(profile)
+
+
+def test_dumps_list():
+    profiles = [make_profile(name=f"bob{i}") for i in range(10)]
+
+    assert direct_dumps(profiles) == serializer.dumps(profiles, unstructure_as=list[Profile])
+    assert [p["name"] for p in orjson.loads(direct_dumps(profiles))] == [
+        f"bob{i}" for i in range(10)
+    ]
+
+
+def test_dumps_single_field():
+    assert direct_dumps(Single(name="bob")) == b'{"name":"bob"}'
+
+
+def test_dumps_set():
+    assert orjson.loads(direct_dumps(Tagged(tags={Tag(slug="a")}))) == {"tags": [{"slug": "a"}]}
+
+
+def test_dumps_option():
+    profile = make_profile()
+
+    assert direct_dumps(profile, option=orjson.OPT_INDENT_2) == orjson.dumps(
+        orjson.loads(serializer.dumps(profile)), option=orjson.OPT_INDENT_2
+    )
+
+
+def test_dumps_file(db):
+    book = Book.objects.create(pdf=SimpleUploadedFile(name="test.pdf", content=b"wheeee"))
+
+    assert direct_dumps(PDF(pdf=book.pdf)) == serializer.dumps(PDF(pdf=book.pdf))
+    assert orjson.loads(direct_dumps(PDF(pdf=book.pdf))) == {"pdf": book.pdf.url}
+    assert direct_dumps(PDF(pdf=None)) == b'{"pdf":null}'
+
+
+def test_dumps_class_hook():
+    @define
+    class Account:
+        name: CharField
+        internal: CharField
+
+    account = Account(name="x", internal="hunter2")
+    assert direct_dumps(account) == serializer.dumps(account)
+
+    # registered after the class was encoded once
+    serializer.register_unstructure_hook(
+        Account,
+        make_dict_unstructure_fn(
+            Account, serializer, name=override(rename="login"), internal=override(omit=True)
+        ),
+    )
+
+    assert direct_dumps(account) == serializer.dumps(account) == b'{"login":"x"}'
+    assert direct_dumps([account]) == b'[{"login":"x"}]'
+
+
+def test_default_unsupported():
+    with pytest.raises(TypeError):
+        default(object())
+
+    with pytest.raises(orjson.JSONEncodeError):
+        direct_dumps({"a": object()})
@@ -0,0 +1,100 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import pytest
+import yaml
+
+from attrs import Factory, define
+
+from django.utils import timezone
+
+from django_cattrs_fields.converters.pyyaml import YamlConverter, serializer
+from django_cattrs_fields.fields import (
+    BooleanField,
+    CharField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    FloatField,
+    IntegerField,
+    TimeField,
+    UUIDField,
+)
+
+
+@define
+class Service:
+    name: CharField
+    replicas: IntegerField
+    ratio: FloatField
+    enabled: BooleanField
+    uid: UUIDField
+    budget: DecimalField
+    launch: DateField
+    updated: DateTimeField
+    backup_at: TimeField
+    description: CharField | None = None
+    hosts: list[CharField] = Factory(list)
+
+
+@pytest.fixture
+def services():
+    return [
+        Service(
+            name=f"service {i}: ünïcode",
+            replicas=i,
+            ratio=i / 3,
+            enabled=bool(i % 2),
+            uid=uuid.uuid4(),
+            budget=Decimal("1200.50"),
+            launch=datetime.date(2024, 1, i + 1),
+            updated=timezone.now(),
+            backup_at=datetime.time(3, i),
+            description="a very long line " * 10 if i % 2 else None,
+            hosts=[f"10.0.0.{j}" for j in range(i)],
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def pure_serializer():
+    c = serializer.copy()
+    c.loader = yaml.SafeLoader
+    c.dumper = yaml.SafeDumper
+    return c
+
+
+def test_libyaml():
+    if not yaml.__with_libyaml__:
+        pytest.skip("pyyaml is built without libyaml")
+
+    assert YamlConverter.loader is yaml.CSafeLoader
+    assert YamlConverter.dumper is yaml.CSafeDumper
+
+
+def test_same_output(services, pure_serializer):
+    dump = serializer.dumps(services, unstructure_as=list[Service])
+
+    assert dump == pure_serializer.dumps(services, unstructure_as=list[Service])
+    assert dump == yaml.safe_dump(pure_serializer.unstructure(services, list[Service]))
+
+
+def test_same_loads(services, pure_serializer):
+    dump = pure_serializer.dumps(services, unstructure_as=list[Service])
+
+    assert serializer.loads(dump, list[Service]) == pure_serializer.loads(dump, list[Service])
+    assert serializer.loads(dump, list[Service]) == services
+
+
+def test_loads_safe():
+    with pytest.raises(yaml.YAMLError):
+        serializer.loads("!!python/object/apply:os.system ['true']", Service)
+
+
+def test_frozenset():
+    dump = serializer.dumps(frozenset({"a"}), unstructure_as=frozenset[CharField])
+
+    assert yaml.safe_load(dump) == ["a"]
+    assert serializer.loads(dump, frozenset[CharField]) == frozenset({"a"})
@@ -0,0 +1,167 @@
+import pytest
+
+from attrs import define
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.fields import CharField
+from django_cattrs_fields.utils import relations
+from django_cattrs_fields.utils.relations import related_lookups
+
+from tests.books.models import Author, Chapter, Novel, Publisher, Tag
+
+
+@define
+class PublisherData:
+    name: CharField
+
+
+@define
+class AuthorData:
+    name: CharField
+    publisher: PublisherData | None
+
+
+@define
+class TagData:
+    name: CharField
+
+
+@define
+class ChapterData:
+    title: CharField
+
+
+@define
+class NovelData:
+    title: CharField
+    author: AuthorData
+    chapters: list[ChapterData]
+    tags: list[TagData]
+
+
+@define
+class AuthorNovelsData:
+    name: CharField
+    novels: list[NovelData]
+
+
+@pytest.fixture
+def seed(db):
+    publisher = Publisher.objects.create(name="penguin")
+    tags = [Tag.objects.create(name=f"tag{i}") for i in range(3)]
+    for i in range(5):
+        author = Author.objects.create(name=f"author{i}", publisher=publisher if i % 2 else None)
+        novel = Novel.objects.create(title=f"novel{i}", author=author)
+        novel.tags.set(tags[: i % 3 + 1])
+        for j in range(3):
+            Chapter.objects.create(title=f"chapter{i}-{j}", novel=novel)
+
+
+def test_related_lookups():
+    assert related_lookups(NovelData, Novel) == (
+        ("author", "author__publisher"),
+        ("chapters", "tags"),
+    )
+    assert related_lookups(AuthorNovelsData, Author) == (
+        (),
+        (
+            "novels",
+            "novels__author",
+            "novels__author__publisher",
+            "novels__chapters",
+            "novels__tags",
+        ),
+    )
+
+
+def test_structure_instance(seed):
+    novel = Novel.objects.get(title="novel1")
+
+    struct = converter.structure(novel, NovelData)
+
+    assert struct == NovelData(
+        title="novel1",
+        author=AuthorData(name="author1", publisher=PublisherData(name="penguin")),
+        chapters=[ChapterData(title=f"chapter1-{j}") for j in range(3)],
+        tags=[TagData(name="tag0"), TagData(name="tag1")],
+    )
+
+
+def test_structure_instance_null_relation(seed):
+    novel = Novel.objects.get(title="novel0")
+
+    struct = converter.structure(novel, NovelData)
+
+    assert struct.author == AuthorData(name="author0", publisher=None)
+
+
+def test_structure_queryset(seed, django_assert_num_queries):
+    # one query for novels joined with authors and publishers, one per prefetch
+    with django_assert_num_queries(3):
+        struct = converter.structure(Novel.objects.order_by("id"), list[NovelData])
+
+    assert len(struct) == 5
+    assert struct[3].author.publisher == PublisherData(name="penguin")
+    assert [c.title for c in struct[3].chapters] == [f"chapter3-{j}" for j in range(3)]
+    assert len(struct[4].tags) == 2
+
+
+def test_structure_reverse_relation(seed, django_assert_num_queries):
+    with django_assert_num_queries(5):
+        struct = converter.structure(Author.objects.order_by("id"), list[AuthorNovelsData])
+
+    assert [a.novels[0].title for a in struct] == [f"novel{i}" for i in range(5)]
+
+
+def test_structure_list_of_objects(seed, django_assert_num_queries):
+    novels = list(Novel.objects.order_by("id"))
+
+    # author, publisher, chapters and tags, once each
+    with django_assert_num_queries(4):
+        struct = converter.structure(novels, list[NovelData])
+
+    assert struct[3].author.publisher == PublisherData(name="penguin")
+    assert len(struct[4].tags) == 2
+
+
+def test_structure_list_prefetches_once(seed, monkeypatch):
+    calls = []
+    prefetch = relations.prefetch_related_objects
+    monkeypatch.setattr(
+        relations,
+        "prefetch_related_objects",
+        lambda *args: calls.append(args) or prefetch(*args),
+    )
+
+    converter.structure(list(Novel.objects.order_by("id")), list[NovelData])
+    converter.structure(Novel.objects.order_by("id"), list[NovelData])
+
+    # once for the list of objects, the queryset prefetches by itself
+    assert len(calls) == 1
+
+
+def test_structure_values_queryset(seed):
+    @define
+    class NovelTitle:
+        title: CharField
+
+    struct = converter.structure(Novel.objects.order_by("id").values("title"), list[NovelTitle])
+    assert [n.title for n in struct] == [f"novel{i}" for i in range(5)]
+
+
+def test_structure_instance_queries(seed, django_assert_num_queries):
+    author = Author.objects.get(name="author1")
+
+    # novels (their author is known), then publishers, chapters and tags, once each
+    with django_assert_num_queries(4):
+        struct = converter.structure(author, AuthorNovelsData)
+
+    assert struct.novels[0].author.publisher == PublisherData(name="penguin")
+
+
+def test_structure_evaluated_queryset(seed):
+    novels = Novel.objects.order_by("id")
+    list(novels)
+
+    struct = converter.structure(novels, list[NovelData])
+    assert [n.title for n in struct] == [f"novel{i}" for i in range(5)]
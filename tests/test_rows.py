@@ -0,0 +1,149 @@
+import pytest
+
+from attrs import define
+
+from django.db import connection
+from django.db.models import F
+
+from cattrs.errors import ClassValidationError
+
+from django_cattrs_fields.converters import converter
+from django_cattrs_fields.converters.json import serializer as json_serializer
+from django_cattrs_fields.fields import CharField, IntegerField
+from django_cattrs_fields.hooks.row_hooks import (
+    cursor_columns,
+    make_row_structure_fn,
+    structure_rows,
+    structure_table,
+    structure_values_list,
+    unstructure_rows,
+    unstructure_table,
+)
+
+from tests.books.models import Human
+
+
+@define
+class HumanData:
+    name: CharField
+    age: IntegerField
+
+
+@define
+class HumanDefault:
+    name: CharField
+    age: IntegerField = 18
+
+
+@define
+class HumanAnnotated:
+    name: CharField
+    double_age: IntegerField
+
+
+@pytest.fixture
+def seed(db):
+    for i in range(5):
+        Human.objects.create(name=f"a{i}", age=i)
+
+
+def test_structure_rows():
+    rows = [("bob", 32), ("alice", "30")]
+
+    struct = structure_rows(rows, HumanData, ["name", "age"], converter)
+
+    assert struct == [HumanData(name="bob", age=32), HumanData(name="alice", age=30)]
+
+
+def test_structure_rows_column_order():
+    fn = make_row_structure_fn(HumanData, ["id", "age", "name"], converter)
+
+    assert fn((1, 32, "bob")) == HumanData(name="bob", age=32)
+
+
+def test_structure_rows_default():
+    fn = make_row_structure_fn(HumanDefault, ["name"], converter)
+
+    assert fn(("bob",)) == HumanDefault(name="bob", age=18)
+
+
+def test_structure_rows_missing_column():
+    with pytest.raises(ValueError):
+        make_row_structure_fn(HumanData, ["name"], converter)
+
+
+def test_structure_rows_invalid():
+    fn = make_row_structure_fn(HumanData, ["name", "age"], converter)
+
+    with pytest.raises(ClassValidationError) as e:
+        fn(("", None))
+
+    assert len(e.value.exceptions) == 2
+    assert e.value.exceptions[0].__notes__[-1].name == "name"
+    assert e.value.exceptions[1].__notes__[-1].name == "age"
+
+
+def test_structure_rows_not_detailed():
+    fn = make_row_structure_fn(
+        HumanData, ["name", "age"], converter.copy(detailed_validation=False)
+    )
+
+    assert fn(("bob", 3)) == HumanData(name="bob", age=3)
+    with pytest.raises(ValueError):
+        fn(("", 3))
+
+
+def test_structure_values_list(seed, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        struct = structure_values_list(Human.objects.order_by("id"), HumanData, converter)
+
+    assert struct == [HumanData(name=f"a{i}", age=i) for i in range(5)]
+
+
+def test_structure_values_list_annotation(seed):
+    qs = Human.objects.order_by("id").annotate(double_age=F("age") * 2)
+
+    struct = structure_values_list(qs, HumanAnnotated, converter)
+
+    assert struct == [HumanAnnotated(name=f"a{i}", double_age=i * 2) for i in range(5)]
+
+
+def test_structure_cursor(seed):
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT age, name FROM {Human._meta.db_table} ORDER BY id")  # noqa: S608
+        struct = structure_rows(cursor.fetchall(), HumanData, cursor_columns(cursor), converter)
+
+    assert struct == [HumanData(name=f"a{i}", age=i) for i in range(5)]
+
+
+def test_unstructure_rows():
+    humans = [HumanData(name="bob", age=25), HumanData(name="alice", age=30)]
+
+    assert unstructure_rows(humans, HumanData, converter) == [("bob", 25), ("alice", 30)]
+    assert unstructure_rows(humans, HumanData, converter, ["age"]) == [(25,), (30,)]
+
+
+def test_table_round_trip():
+    humans = [HumanData(name="bob", age=25), HumanData(name="alice", age=30)]
+
+    table = unstructure_table(humans, HumanData, converter)
+
+    assert table == {"fields": ["name", "age"], "rows": [("bob", 25), ("alice", 30)]}
+    assert structure_table(table, HumanData, converter) == humans
+
+
+def test_table_json():
+    humans = [HumanData(name="bob", age=25)]
+
+    dump = json_serializer.dumps(unstructure_table(humans, HumanData, json_serializer))
+
+    assert dump == '{"fields": ["name", "age"], "rows": [["bob", 25]]}'
+    assert structure_table(json_serializer.loads(dump, dict), HumanData, converter) == humans
+
+
+def test_structure_table_invalid():
+    with pytest.raises(ValueError):
+        structure_table({"rows": []}, HumanData, converter)
+
+    with pytest.raises(ClassValidationError):
+        structure_table({"fields": ["name", "age"], "rows": [["", 1]]}, HumanData, converter)
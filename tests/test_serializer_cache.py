@@ -0,0 +1,173 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from attrs import define, frozen
+
+from django_cattrs_fields.converters.bson import serializer as bson_serializer
+from django_cattrs_fields.converters.cache import SerializerCache, cacheable
+from django_cattrs_fields.converters.cbor2 import serializer as cbor2_serializer
+from django_cattrs_fields.converters.json import serializer as json_serializer
+from django_cattrs_fields.converters.msgpack import serializer as msgpack_serializer
+from django_cattrs_fields.converters.msgspec import serializer as msgspec_serializer
+from django_cattrs_fields.converters.orjson import serializer as orjson_serializer
+from django_cattrs_fields.converters.pyyaml import serializer as pyyaml_serializer
+from django_cattrs_fields.converters.ujson import serializer as ujson_serializer
+from django_cattrs_fields.fields import (
+    CharField,
+    DateTimeField,
+    DecimalField,
+    IntegerField,
+    UUIDField,
+)
+
+
+@frozen
+class Country:
+    code: CharField
+    name: CharField
+    uid: UUIDField
+    tax: DecimalField
+
+
+@define
+class Mutable:
+    name: CharField
+
+
+@frozen
+class Counter:
+    count: IntegerField
+
+
+serializers = [
+    cbor2_serializer,
+    json_serializer,
+    msgpack_serializer,
+    msgspec_serializer,
+    orjson_serializer,
+    pyyaml_serializer,
+    ujson_serializer,
+]
+
+
+def countries(n):
+    return [
+        Country(code=f"c{i}", name=f"country {i}", uid=uuid.uuid4(), tax=Decimal("9.5"))
+        for i in range(n)
+    ]
+
+
+def test_cacheable():
+    assert cacheable(Country)
+    assert not cacheable(Mutable)
+    assert not cacheable(dict)
+
+
+@pytest.mark.parametrize("serializer", serializers)
+def test_dumps(serializer):
+    cache = SerializerCache(serializer)
+    (country,) = countries(1)
+
+    assert cache.dumps(country) == serializer.dumps(country)
+    assert cache.dumps(country) == serializer.dumps(country)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("serializer", serializers)
+@pytest.mark.parametrize("n", [0, 1, 15, 16, 23, 24, 300, 70000])
+def test_dumps_list(serializer, n):
+    if n == 70000 and serializer is pyyaml_serializer:
+        pytest.skip("too slow")
+    cache = SerializerCache(serializer, maxsize=10)
+    items = countries(min(n, 10)) * (n // 10 or 1) if n >= 10 else countries(n)
+
+    dump = cache.dumps_list(items)
+
+    assert dump == serializer.dumps(items, unstructure_as=list[Country])
+    assert serializer.loads(dump, list[Country]) == items
+
+
+def test_dumps_list_unspliceable():
+    cache = SerializerCache(bson_serializer)
+    items = countries(3)
+
+    assert cache.dumps_list(items) == bson_serializer.dumps(items)
+
+
+def test_not_cached():
+    cache = SerializerCache(json_serializer)
+
+    assert cache.dumps(Mutable(name="a")) == json_serializer.dumps(Mutable(name="a"))
+    assert len(cache) == 0
+
+
+def test_bounded():
+    cache = SerializerCache(orjson_serializer, maxsize=2)
+    a, b, c = (Counter(count=i) for i in range(3))
+
+    cache.dumps(a)
+    cache.dumps(b)
+    cache.dumps(a)
+    cache.dumps(c)
+
+    assert len(cache) == 2
+    cache.dumps(a)
+    assert cache.hits == 2
+    cache.dumps(b)
+    assert cache.misses == 4
+
+
+def test_equal_instances_get_their_own_entry():
+    cache = SerializerCache(orjson_serializer)
+    a, b = Counter(count=1), Counter(count=1)
+
+    cache.dumps(a)
+    cache.dumps(b)
+    cache.dumps(a)
+
+    assert len(cache) == 2
+    assert cache.hits == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@frozen
+class Price:
+    amount: DecimalField
+    at: DateTimeField
+
+
+def test_equal_but_different_values():
+    # equal, but dumped differently
+    utc = datetime.datetime(2025, 1, 1, 12, tzinfo=datetime.UTC)
+    plus_one = utc.astimezone(datetime.timezone(datetime.timedelta(hours=1)))
+    a = Price(amount=Decimal("1.0"), at=utc)
+    b = Price(amount=Decimal("1.00"), at=plus_one)
+    assert a == b
+
+    cache = SerializerCache(json_serializer)
+    assert cache.dumps(a) == json_serializer.dumps(a)
+    assert cache.dumps(b) == json_serializer.dumps(b)
+    assert cache.dumps(a) != cache.dumps(b)
+
+
+def test_dead_objects_are_not_hit():
+    cache = SerializerCache(json_serializer)
+
+    for i in range(100):
+        # ids of dead objects get reused
+        assert cache.dumps(Counter(count=i)) == json_serializer.dumps(Counter(count=i))
+    assert cache.hits == 0
+
+
+@frozen(weakref_slot=False)
+class NoWeakref:
+    count: IntegerField
+
+
+def test_cacheable_without_weakrefs():
+    assert not cacheable(NoWeakref)
@@ -0,0 +1,82 @@
+import datetime
+import tomllib
+
+import pytest
+import tomlkit
+
+from attrs import define
+
+from django_cattrs_fields.converters.toml import dumps_toml, serializer
+from django_cattrs_fields.converters.tomlkit import serializer as tomlkit_serializer
+from django_cattrs_fields.fields import CharField, DateField, FloatField, IntegerField
+
+
+@define
+class Database:
+    host: CharField
+    port: IntegerField
+
+
+@define
+class Replica:
+    host: CharField
+    weight: FloatField
+
+
+@define
+class Config:
+    name: CharField
+    started: DateField
+    tags: list[CharField]
+    database: Database
+    replicas: list[Replica]
+
+
+data = {
+    "name": "service",
+    "started": datetime.date(2024, 5, 6),
+    "tags": ["a", "b"],
+    "database": {"host": "localhost", "port": 5432},
+    "replicas": [{"host": "r1", "weight": 0.5}, {"host": "r2", "weight": 1.5}],
+}
+
+
+def test_dumps_toml():
+    doc = {
+        "title": 'quote " and \\ and \n and \x7f and ünïcode',
+        "with space": 1,
+        "floats": [1.0, 1e20, float("inf"), float("-inf")],
+        "when": datetime.datetime(2024, 5, 6, 7, 8, 9, tzinfo=datetime.UTC),
+        "at": datetime.time(7, 8, 9),
+        "inline": [[1, 2], {"a": 1}],
+        "empty": {},
+        "table": {"a": 1, "nested": {"b": True}},
+        "items": [{"a": 1}, {"a": 2, "deeper": {"c": "d"}}],
+    }
+
+    assert tomllib.loads(dumps_toml(doc)) == doc
+
+
+def test_dumps_toml_not_a_table():
+    with pytest.raises(TypeError):
+        dumps_toml([1, 2])
+
+    with pytest.raises(TypeError):
+        dumps_toml({"a": None})
+
+
+def test_same_as_tomlkit():
+    structure = serializer.structure(data, Config)
+
+    assert serializer.dumps(structure) == tomlkit_serializer.dumps(structure)
+    assert (
+        tomllib.loads(serializer.dumps(structure))
+        == tomlkit.loads(tomlkit_serializer.dumps(structure)).unwrap()
+    )
+
+
+def test_dump_then_load():
+    structure = serializer.structure(data, Config)
+
+    assert serializer.loads(serializer.dumps(structure), Config) == structure
+    assert serializer.loads(tomlkit_serializer.dumps(structure), Config) == structure
@@ -0,0 +1,111 @@
+from typing import Annotated
+
+import pytest
+
+from attrs import define
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import StopUpload, TemporaryFileUploadHandler
+
+from django_cattrs_fields.fields import Params
+from django_cattrs_fields.fields.files import FileField
+from django_cattrs_fields.uploadhandler import ParamsUploadHandler, file_params
+
+from tests.books.views import ImageData
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+@define
+class NoParams:
+    name: str
+
+
+def test_file_params():
+    params = file_params(ImageData)
+
+    assert params["image"].file_max_size == 1024
+    assert file_params(NoParams) == {}
+
+
+def test_file_params_nullable():
+    @define
+    class Nullable:
+        inner: Annotated[FileField | None, Params(file_max_size=10)]
+        outer: Annotated[FileField, Params(file_max_size=20)] | None
+
+    params = file_params(Nullable)
+
+    assert params["inner"].file_max_size == 10
+    assert params["outer"].file_max_size == 20
+
+
+def test_upload(client):
+    file = SimpleUploadedFile(name="image.png", content=PNG, content_type="image/png")
+    result = client.post("/upload/", {"image": file})
+
+    assert result.status_code == 200
+
+
+def test_upload_too_large(client):
+    file = SimpleUploadedFile(name="image.png", content=PNG * 20, content_type="image/png")
+    result = client.post("/upload/", {"image": file})
+
+    assert result.status_code == 400
+    assert result.text == "File is larger than 1024 bytes."
+
+
+def test_upload_wrong_type(client):
+    file = SimpleUploadedFile(name="image.png", content=PNG, content_type="image/gif")
+    result = client.post("/upload/", {"image": file})
+
+    assert result.status_code == 400
+    assert result.text == "File type “image/gif” is not allowed."
+
+
+def test_upload_wrong_magic(client):
+    file = SimpleUploadedFile(name="image.png", content=b"<html>" * 10, content_type="image/png")
+    result = client.post("/upload/", {"image": file})
+
+    assert result.status_code == 400
+    assert result.text == "File content doesn't match its type “image/png”."
+
+
+def test_upload_small_wrong_magic(client):
+    file = SimpleUploadedFile(name="image.png", content=b"<p>", content_type="image/png")
+    result = client.post("/upload/", {"image": file})
+
+    assert result.status_code == 400
+
+
+def test_stops_mid_stream():
+    handler = ParamsUploadHandler(cls=ImageData)
+    handler.new_file("image", "image.png", "image/png", None)
+
+    assert handler.receive_data_chunk(PNG, 0) == PNG
+    with pytest.raises(StopUpload):
+        for i in range(20):
+            handler.receive_data_chunk(PNG, len(PNG) * (i + 1))
+
+    assert handler.received <= 1024 + len(PNG)
+    assert "image" in handler.errors
+
+
+def test_other_fields_untouched():
+    handler = ParamsUploadHandler(cls=ImageData)
+    handler.new_file("other", "other.txt", "text/plain", None)
+
+    assert handler.receive_data_chunk(b"a" * 2048, 0) == b"a" * 2048
+    assert handler.file_complete(2048) is None
+    assert handler.errors == {}
+
+
+def test_next_handler_stores(rf):
+    file = SimpleUploadedFile(name="image.png", content=PNG, content_type="image/png")
+    request = rf.post("/upload/", {"image": file})
+    request.upload_handlers = [
+        ParamsUploadHandler(request, ImageData),
+        TemporaryFileUploadHandler(request),
+    ]
+
+    assert request.FILES["image"].read() == PNG